@@ -0,0 +1,81 @@
+"""
+Benchmarks of loading, saving, serializing and validating iFDOs.
+"""
+
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ifdo import iFDO
+from ifdo.pickling import dumps_items, loads_items
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def test_from_dict(benchmark: "BenchmarkFixture", ifdo_dict: dict[str, Any]) -> None:
+    """
+    Parse an encoded iFDO dict.
+    """
+    benchmark(iFDO.from_dict, ifdo_dict)
+
+
+def test_to_dict(benchmark: "BenchmarkFixture", ifdo_dict: dict[str, Any]) -> None:
+    """
+    Encode an iFDO to a dict.
+    """
+    ifdo = iFDO.from_dict(ifdo_dict)
+    benchmark(ifdo.to_dict)
+
+
+def test_load(benchmark: "BenchmarkFixture", ifdo_yaml_path: Path) -> None:
+    """
+    Load an iFDO from a YAML file.
+    """
+    benchmark.pedantic(iFDO.load, args=(ifdo_yaml_path,), rounds=3)
+
+
+def test_save(benchmark: "BenchmarkFixture", ifdo_dict: dict[str, Any], tmp_path: Path) -> None:
+    """
+    Save an iFDO to a YAML file.
+    """
+    ifdo = iFDO.from_dict(ifdo_dict)
+    benchmark.pedantic(ifdo.save, args=(tmp_path / "ifdo.yaml",), rounds=3)
+
+
+def test_pickle_items(benchmark: "BenchmarkFixture", ifdo_dict: dict[str, Any]) -> None:
+    """
+    Serialize and deserialize the image set items with dumps_items and loads_items.
+    """
+    ifdo = iFDO.from_dict(ifdo_dict)
+    benchmark(lambda: loads_items(dumps_items(ifdo.image_set_items)))
+
+
+def test_schema_validation(benchmark: "BenchmarkFixture", ifdo_dict: dict[str, Any]) -> None:
+    """
+    Validate an iFDO against the JSON schema.
+    """
+    ifdo = iFDO.from_dict(ifdo_dict)
+    benchmark.pedantic(ifdo.validate_schema, rounds=3)
+
+
+def test_memory_footprint(benchmark: "BenchmarkFixture", ifdo_dict: dict[str, Any]) -> None:
+    """
+    Measure the memory retained by a parsed iFDO.
+    """
+
+    def measure() -> int:
+        tracemalloc.start()
+        try:
+            ifdo = iFDO.from_dict(ifdo_dict)
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del ifdo
+        return current
+
+    retained_bytes = benchmark.pedantic(measure, rounds=1)
+    benchmark.extra_info["retained_bytes"] = retained_bytes
+    benchmark.extra_info["retained_bytes_per_entry"] = retained_bytes / sum(
+        len(items) for items in ifdo_dict["image-set-items"].values()
+    )
@@ -0,0 +1,35 @@
+"""
+Benchmarks of the import time of the package.
+"""
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def import_time_us(statement: str) -> int:
+    """
+    Measure the cumulative import time of a statement in a fresh interpreter with `python -X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The last line is the outermost import: "import time: <self> | <cumulative> | <module>"
+    return int(result.stderr.strip().splitlines()[-1].split("|")[1])
+
+
+@pytest.mark.parametrize("statement", ["import ifdo", "from ifdo import iFDO"])
+def test_import_time(benchmark: "BenchmarkFixture", statement: str) -> None:
+    """
+    Measure the cumulative import time of a statement.
+    """
+    cumulative_us = benchmark.pedantic(import_time_us, args=(statement,), rounds=5)
+    benchmark.extra_info["cumulative_import_us"] = cumulative_us
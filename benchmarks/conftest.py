@@ -0,0 +1,58 @@
+"""
+Fixtures providing generated iFDOs of each benchmark size and variant.
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from yaml import safe_dump
+
+from benchmarks.generate import generate_ifdo_dict
+from ifdo import iFDO
+
+# Number of image data entries per generated iFDO, e.g. IFDO_BENCHMARK_SIZES=1000,100000,1000000
+SIZES = [int(size) for size in os.environ.get("IFDO_BENCHMARK_SIZES", "1000").split(",")]
+
+# Number of entries of the sample that is validated against the schema. The generator treats all entries alike, so a
+# sample shows that the generated iFDOs of every size are valid.
+SAMPLE_SIZE = 100
+
+VARIANTS = {
+    "sparse": {},
+    "dense": {"dense": True},
+    "annotated": {"annotations": True},
+    "video": {"frames": 50},
+}
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda size: f"n={size}")
+def size(request: pytest.FixtureRequest) -> int:
+    """
+    The number of image data entries.
+    """
+    return request.param
+
+
+@pytest.fixture(scope="session", params=list(VARIANTS))
+def ifdo_dict(request: pytest.FixtureRequest, size: int) -> dict[str, Any]:
+    """
+    An encoded iFDO dict of the given size and variant, checked to be valid under the iFDO schema.
+    """
+    variant = VARIANTS[request.param]
+    errors = iFDO.from_dict(generate_ifdo_dict(SAMPLE_SIZE, **variant)).validate_schema()
+    if errors:
+        pytest.fail(f"Generated {request.param} iFDOs are not valid under the schema: {errors[:3]}")
+    return generate_ifdo_dict(size, **variant)
+
+
+@pytest.fixture(scope="session")
+def ifdo_yaml_path(ifdo_dict: dict[str, Any], tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    The iFDO dict saved to a YAML file.
+    """
+    path = tmp_path_factory.mktemp("benchmarks") / "ifdo.yaml"
+    with path.open("w") as f:
+        safe_dump(ifdo_dict, f, sort_keys=False)
+    return path
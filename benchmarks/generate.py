@@ -0,0 +1,125 @@
+"""
+Generate synthetic iFDO dicts for benchmarking.
+
+The generated dicts are in the encoded form read from and written to iFDO files, so they can be passed directly to
+iFDO.from_dict or dumped to YAML/JSON. They are valid under the iFDO schema, so that benchmarks measure the normal
+cost of validation rather than error reporting.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+START = datetime(2019, 3, 4, 8, 0, 0, tzinfo=timezone.utc)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(UUID(int=rng.getrandbits(128), version=4))
+
+
+def _header(rng: random.Random) -> dict:
+    image_set_uuid = _uuid(rng)
+    return {
+        "image-set-name": "Synthetic benchmark image set",
+        "image-set-uuid": image_set_uuid,
+        "image-set-handle": f"https://hdl.handle.net/20.500.12085/{image_set_uuid}",
+        "image-set-ifdo-version": "v2.1.0",
+        "image-datetime": START.strftime("%Y-%m-%d %H:%M:%S.%f"),
+        "image-latitude": 11.9,
+        "image-longitude": -117.0,
+        "image-altitude-meters": -4094.5,
+        "image-coordinate-reference-system": "EPSG:4326",
+        "image-coordinate-uncertainty-meters": 10.0,
+        "image-context": {"name": "Benchmark"},
+        "image-project": {"name": "Benchmark project"},
+        "image-event": {"name": "Benchmark event"},
+        "image-platform": {"name": "Benchmark platform"},
+        "image-sensor": {"name": "Benchmark sensor"},
+        "image-pi": {"name": "Benchmark PI"},
+        "image-creators": [{"name": "Benchmark creator"}],
+        "image-license": {"name": "CC-BY"},
+        "image-copyright": "Copyright (C)",
+        "image-abstract": "Synthetic image set generated for benchmarking.",
+        "image-acquisition": "photo",
+        "image-marine-zone": "seafloor",
+    }
+
+
+def _image_data(rng: random.Random, index: int, dense: bool) -> dict:
+    image_uuid = _uuid(rng)
+    d = {
+        "image-datetime": (START + timedelta(seconds=index)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+        "image-latitude": 11.9 + rng.random() * 0.01,
+        "image-longitude": -117.0 - rng.random() * 0.01,
+        "image-altitude-meters": -4094.5 + rng.random(),
+        "image-uuid": image_uuid,
+        "image-handle": f"https://hdl.handle.net/20.500.12085/{image_uuid}",
+        "image-hash-sha256": f"{rng.getrandbits(256):064x}",
+    }
+    if dense:
+        d.update(
+            {
+                "image-coordinate-uncertainty-meters": rng.random() * 10,
+                "image-camera-yaw-degrees": rng.random() * 360,
+                "image-camera-pitch-degrees": rng.random() * 10,
+                "image-camera-roll-degrees": rng.random() * 10,
+                "image-meters-above-ground": 1.5 + rng.random(),
+                "image-area-square-meters": 20 + rng.random() * 5,
+                "image-illumination": "artificial light",
+                "image-quality": "raw",
+                "image-entropy": rng.random(),
+                "image-average-color": [rng.randrange(256) for _ in range(3)],
+                "image-mpeg7-colorstatistic": [rng.random() * 255 for _ in range(18)],
+                "image-mpeg7-edgehistogram": [rng.random() for _ in range(80)],
+            },
+        )
+    return d
+
+
+def _annotation(rng: random.Random) -> dict:
+    x, y = rng.random(), rng.random()
+    return {
+        "coordinates": [[x, y, x + 0.1, y, x + 0.1, y + 0.1, x, y + 0.1]],
+        "labels": [
+            {
+                "label": rng.choice(["fish", "sponge", "coral", "rock"]),
+                "annotator": "benchmark",
+                "created-at": START.strftime("%Y-%m-%d %H:%M:%S.%f"),
+                "confidence": rng.random(),
+            },
+        ],
+        "shape": "rectangle",
+    }
+
+
+def generate_ifdo_dict(
+    n_items: int,
+    *,
+    dense: bool = False,
+    annotations: bool = False,
+    frames: int = 1,
+    seed: int = 0,
+) -> dict:
+    """
+    Generate a synthetic iFDO dict.
+
+    Args:
+        n_items: Number of image data entries in total, across all items.
+        dense: Whether to populate many optional fields on each entry.
+        annotations: Whether to add an annotation to each entry.
+        frames: Number of image data entries per item. Greater than 1 generates video items with per-frame entries.
+        seed: Seed of the random number generator, so generated dicts are reproducible.
+
+    Returns:
+        iFDO dict
+    """
+    rng = random.Random(seed)  # noqa: S311  # nosec B311 - not used for security
+    items: dict[str, list[dict]] = {}
+    for index in range(n_items):
+        suffix = "MP4" if frames > 1 else "JPG"
+        filename = f"BENCH_{index // frames:08d}.{suffix}"
+        image_data = _image_data(rng, index, dense)
+        if annotations:
+            image_data["image-annotations"] = [_annotation(rng)]
+        items.setdefault(filename, []).append(image_data)
+    return {"image-set-header": _header(rng), "image-set-items": items}
@@ -1,3 +1,49 @@
-from ifdo.models import iFDO
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ifdo.models import iFDO  # noqa: TCH004 - imported lazily by __getattr__ at runtime
 
 __all__ = ["iFDO"]
+
+# Submodules and attributes are imported on first access, so that `import ifdo` does not pay for pydantic, PyYAML and
+# the construction of the model classes until they are used.
+_SUBMODULES = frozenset(
+    {
+        "aio",
+        "cache",
+        "compression",
+        "container",
+        "database",
+        "dataframe",
+        "decimate",
+        "dedup",
+        "files",
+        "journal",
+        "model",
+        "models",
+        "navigation",
+        "pickling",
+        "profiling",
+        "scan",
+        "shards",
+        "similarity",
+        "tabular",
+        "validation",
+        "verify",
+    },
+)
+
+
+def __getattr__(name: str) -> object:
+    if name == "iFDO":
+        from ifdo.models import iFDO  # Deferred, see above
+
+        return iFDO
+    if name in _SUBMODULES:
+        return import_module(f"ifdo.{name}")
+    raise AttributeError(f"module 'ifdo' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), "iFDO", *_SUBMODULES])
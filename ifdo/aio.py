@@ -0,0 +1,148 @@
+"""
+Asynchronous loading and saving of iFDO files for asyncio applications.
+
+File I/O, YAML parsing and encoding, and conversion to and from model objects all block and can take a long time on
+large files. The functions in this module run them in an executor, reading and writing in chunks, so that the event
+loop stays responsive. Compressed files are handled as by iFDO.load/save. The context (e.g. an active profile() or
+enum_report()) is propagated to the executor.
+
+aiter_items does not load the whole document: it streams the items with the incremental parsers of
+ifdo.dedup.iter_file_items, parsing and converting one batch at a time in the executor, so the first items arrive
+before the rest of the file is read and memory use is bounded by the batch size.
+
+Functions:
+    aload: Load an iFDO from a YAML file.
+    asave: Save an iFDO to a YAML file.
+    aiter_items: Stream the image set items of a YAML or JSON file in batches.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor
+from contextvars import copy_context
+from functools import partial
+from io import StringIO
+from itertools import islice
+from pathlib import Path
+from typing import Any, TypeVar
+
+from ifdo.compression import open_text
+from ifdo.dedup import iter_file_items
+from ifdo.models import ImageData, iFDO
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+BATCH_SIZE = 1000
+
+T = TypeVar("T")
+
+
+async def _run(executor: Executor | None, func: Callable[..., T], *args: object) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(copy_context().run, func, *args))
+
+
+async def _read_text(path: Path, executor: Executor | None, chunk_size: int) -> str:
+    f = await _run(executor, open_text, path)
+    try:
+        chunks = []
+        while chunk := await _run(executor, f.read, chunk_size):
+            chunks.append(chunk)
+    finally:
+        await _run(executor, f.close)
+    return "".join(chunks)
+
+
+async def _parse_yaml(path: Path, executor: Executor | None, chunk_size: int) -> dict[str, Any]:
+    from yaml import safe_load  # Deferred to keep module import cheap
+
+    text = await _read_text(path, executor, chunk_size)
+    return await _run(executor, safe_load, text)
+
+
+async def aload(path: str | Path, executor: Executor | None = None, chunk_size: int = CHUNK_SIZE) -> iFDO:
+    """
+    Load an iFDO from a YAML file without blocking the event loop.
+
+    Args:
+        path: Path to the YAML file.
+        executor: Executor to run blocking work in. Defaults to the event loop's default executor.
+        chunk_size: Number of characters to read per chunk.
+
+    Returns:
+        The loaded iFDO object.
+    """
+    d = await _parse_yaml(Path(path), executor, chunk_size)
+    return await _run(executor, iFDO.from_dict, d)
+
+
+def _dump(ifdo: iFDO) -> str:
+    from yaml import safe_dump  # Deferred to keep module import cheap
+
+    stream = StringIO()
+    safe_dump(ifdo.to_dict(), stream, sort_keys=False)
+    return stream.getvalue()
+
+
+async def asave(
+    ifdo: iFDO,
+    path: str | Path,
+    executor: Executor | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    compresslevel: int | None = None,
+) -> None:
+    """
+    Save an iFDO to a YAML file without blocking the event loop.
+
+    Args:
+        ifdo: iFDO to save.
+        path: Path to the YAML file.
+        executor: Executor to run blocking work in. Defaults to the event loop's default executor.
+        chunk_size: Number of characters to write per chunk.
+        compresslevel: Compression level for compressed files. Defaults to the codec's default.
+    """
+    text = await _run(executor, _dump, ifdo)
+    f = await _run(executor, open_text, path, "w", compresslevel)
+    try:
+        for start in range(0, len(text), chunk_size):
+            await _run(executor, f.write, text[start : start + chunk_size])
+    finally:
+        await _run(executor, f.close)
+    ifdo.mark_clean()  # The file now reflects the current state
+
+
+def _next_batch(items: Iterator[tuple[str, Any]], batch_size: int) -> list[tuple[str, list[ImageData]]]:
+    # Parse and convert the next batch of items
+    return [
+        (filename, [ImageData.from_dict(d) for d in image_data_list])
+        for filename, image_data_list in islice(items, batch_size)
+    ]
+
+
+async def aiter_items(
+    path: str | Path,
+    executor: Executor | None = None,
+    batch_size: int = BATCH_SIZE,
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[tuple[str, list[ImageData]]]:
+    """
+    Stream the image set items of a YAML or JSON file without blocking the event loop.
+
+    The file is parsed incrementally: each batch of items is read, parsed and converted to model objects in the
+    executor, so one large file does not starve other tasks and is never held in memory as a whole.
+
+    Args:
+        path: Path to the YAML or JSON file.
+        executor: Executor to run blocking work in. Defaults to the event loop's default executor.
+        batch_size: Number of items to parse and convert per batch.
+        chunk_size: Number of characters to read per chunk from JSON files.
+
+    Yields:
+        Tuples of filename and image data entries, in file order.
+    """
+    items = iter_file_items(path, chunk_size)
+    try:
+        while batch := await _run(executor, _next_batch, items, batch_size):
+            for item in batch:
+                yield item
+    finally:
+        await _run(executor, items.close)  # Closes the file if iteration stopped early
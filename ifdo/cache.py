@@ -0,0 +1,144 @@
+"""
+On-disk cache of parsed iFDO objects.
+
+Parsing a large iFDO YAML file and converting it into model objects is expensive. This module provides an opt-in cache
+that stores the parsed object in a fast binary form (pickle) in a cache directory, so that subsequent loads of an
+unchanged file skip parsing entirely.
+
+Cache entries are keyed by the resolved source path, its modification time, size and content hash, and are tagged with
+the library version so that upgrades never return stale objects. The total size of the cache directory is bounded by
+evicting the least recently used entries.
+
+Classes:
+    ParseCache: Directory-backed cache of parsed iFDO objects.
+"""
+
+import os
+import pickle  # nosec B403 - cache entries are only ever written by this module
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from ifdo.files import file_sha256
+
+ENTRY_SUFFIX = ".pickle"
+
+
+def library_version() -> str:
+    """
+    Get the installed version of the ifdo package.
+
+    Returns:
+        Version string, or "unknown" if the package is not installed.
+    """
+    try:
+        return version("ifdo")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class ParseCache:
+    """
+    Cache parsed iFDO objects in a directory.
+
+    Attributes:
+        directory (Path): Directory holding the cache entries.
+        max_bytes (int | None): Maximum total size of the cache entries in bytes. None for no limit.
+
+    Example:
+        cache = ParseCache("~/.cache/ifdo", max_bytes=1 << 30)
+        ifdo = iFDO.load("path/to/ifdo.yaml", cache=cache)  # Parses and stores
+        ifdo = iFDO.load("path/to/ifdo.yaml", cache=cache)  # Served from the cache
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int | None = None) -> None:
+        """
+        Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory: Directory to hold the cache entries.
+            max_bytes: Maximum total size of the cache entries in bytes. None for no limit.
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def key(self, path: str | Path) -> str:
+        """
+        Compute the cache key of a source file.
+
+        Args:
+            path: Path to the source file.
+
+        Returns:
+            Cache key.
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        parts = (str(path), str(stat.st_mtime_ns), str(stat.st_size), file_sha256(path), library_version())
+        return sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> object | None:
+        """
+        Get a cached object.
+
+        Args:
+            key: Cache key, as returned by key().
+
+        Returns:
+            The cached object, or None if there is no valid entry for the key.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with entry_path.open("rb") as f:
+                obj: object = pickle.load(f)  # noqa: S301  # nosec B301 - entries are only ever written by this module
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        os.utime(entry_path)  # Record the access for least recently used eviction
+        return obj
+
+    def put(self, key: str, obj: object) -> None:
+        """
+        Store an object in the cache, evicting old entries if the cache grows too large.
+
+        Args:
+            key: Cache key, as returned by key().
+            obj: Object to store.
+        """
+        with NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False) as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(f.name).replace(self._entry_path(key))  # Atomic, so readers never see a partial entry
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits within max_bytes.
+        """
+        if self.max_bytes is None:
+            return
+
+        entries = []
+        for entry_path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:  # Removed concurrently
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        for entry_path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            entry_path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
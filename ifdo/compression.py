@@ -0,0 +1,109 @@
+"""
+Transparent compression for iFDO files.
+
+iFDO files compress well, so archives are often stored as .gz, .bz2, .xz or .zst files. open_text() opens such files as
+text streams: the compression of an existing file is detected from its leading magic bytes, and the compression of a
+new file from its suffix. The streams decompress/compress incrementally, so decompression is interleaved with YAML
+parsing on load, and compression with YAML encoding on save.
+
+Zstandard support requires the optional zstandard package (pip install ifdo[zstd]).
+
+Functions:
+    compression_from_suffix: Get the compression implied by a file's suffix.
+    detect_compression: Detect the compression of an existing file.
+    open_text: Open a possibly compressed file as a text stream.
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Literal
+
+SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+MAGIC_BYTES = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+
+def compression_from_suffix(path: str | Path) -> str | None:
+    """
+    Get the compression implied by a file's suffix.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        One of "gzip", "bz2", "xz" or "zstd", or None if the file is not compressed.
+    """
+    return SUFFIXES.get(Path(path).suffix.lower())
+
+
+def detect_compression(path: str | Path) -> str | None:
+    """
+    Detect the compression of an existing file from its leading magic bytes.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        One of "gzip", "bz2", "xz" or "zstd", or None if the file is not compressed.
+    """
+    with Path(path).open("rb") as f:
+        head = f.read(max(len(magic) for magic in MAGIC_BYTES))
+    for magic, compression in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _open_zstd(path: Path, mode: str, compresslevel: int | None) -> IO[str]:
+    try:
+        import zstandard  # Optional dependency
+    except ImportError as e:
+        raise ImportError("Zstandard compression requires the zstandard package: pip install ifdo[zstd]") from e
+
+    cctx = zstandard.ZstdCompressor(level=compresslevel) if compresslevel is not None else None
+    stream: IO[str] = zstandard.open(path, mode, cctx=cctx, encoding="utf-8")
+    return stream
+
+
+def open_text(path: str | Path, mode: str = "r", compresslevel: int | None = None) -> IO[str]:
+    """
+    Open a possibly compressed file as a text stream.
+
+    Args:
+        path: Path to the file.
+        mode: "r" to read, or "w" to write.
+        compresslevel: Compression level when writing a compressed file. Defaults to the codec's default.
+
+    Returns:
+        Text stream.
+
+    Raises:
+        ValueError: If the mode is not supported.
+    """
+    path = Path(path)  # Ensure Path object
+    if mode == "r":
+        compression = detect_compression(path)
+    elif mode == "w":
+        compression = compression_from_suffix(path)
+    else:
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    text_mode: Literal["rt", "wt"] = "rt" if mode == "r" else "wt"
+    if compression is None:
+        return path.open(mode)
+    if compression == "zstd":
+        return _open_zstd(path, text_mode, compresslevel)
+    if compression == "xz":
+        if text_mode == "rt":  # A preset is only accepted when writing
+            return lzma.open(path, text_mode, encoding="utf-8")
+        return lzma.open(path, text_mode, preset=compresslevel, encoding="utf-8")
+    opener = gzip.open if compression == "gzip" else bz2.open
+    if compresslevel is None:
+        return opener(path, text_mode, encoding="utf-8")
+    return opener(path, text_mode, compresslevel=compresslevel, encoding="utf-8")
@@ -0,0 +1,322 @@
+"""
+Binary iFDO container format with memory-mapped random access to image set items.
+
+A container holds the same content as a YAML/JSON iFDO file, laid out so that the metadata of a single image can be
+read without parsing the rest of the file:
+
+    preamble  magic (8 bytes), format version, offsets and lengths of the blocks below, and the number of items
+    header    UTF-8 JSON encoding of the image set header
+    extras    UTF-8 JSON encoding of the top-level keys other than the header and items (e.g. $schema)
+    records   one UTF-8 JSON record per image set item (the list of image data entries for a filename)
+    names     the UTF-8 filenames of the items, concatenated
+    entries   per item, in item order: offset and length of its filename and of its record (fixed width)
+    slots     hash table of filename to entry: CRC-32 of the filename, linear probing, entry number + 1 (0 if empty)
+
+Containers are opened via mmap, and nothing is decoded up front: all integers are little-endian and fixed width, so
+they are read in place. Looking up an item hashes its filename, probes the slots (comparing filenames byte by byte),
+and decodes that single record.
+
+Classes:
+    iFDOContainer: Read-only, memory-mapped view of a container file.
+
+Functions:
+    write_container: Write an iFDO to a container file.
+    convert_to_container: Convert a YAML/JSON iFDO file to a container file.
+    convert_from_container: Convert a container file to a YAML iFDO file.
+"""
+
+import json
+import mmap
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+
+MAGIC = b"IFDOPACK"
+FORMAT_VERSION = 2
+# Magic, version, header offset and length, extras offset and length, entries offset, slots offset, number of items,
+# number of slots
+PREAMBLE = struct.Struct("<8sIQQQQQQQQ")
+ENTRY = struct.Struct("<QQQQ")  # Filename offset and length, record offset and length
+SLOT = struct.Struct("<Q")  # Entry number + 1, or 0 for an empty slot
+
+
+def _encode(obj: object) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _hash(name: bytes) -> int:
+    return zlib.crc32(name)
+
+
+def _slot_count(count: int) -> int:
+    """
+    Get the number of hash table slots for a number of items: a power of two, at most half full.
+    """
+    return 1 << (2 * count).bit_length() if count else 0
+
+
+def write_container(ifdo: iFDO, path: str | Path) -> None:
+    """
+    Write an iFDO to a container file.
+
+    Args:
+        ifdo: iFDO to write.
+        path: Path to the container file.
+    """
+    path = Path(path)  # Ensure Path object
+    with path.open("wb") as f:
+        f.write(bytes(PREAMBLE.size))  # Placeholder, rewritten once the offsets are known
+
+        header = _encode(ifdo.image_set_header.to_dict())
+        header_offset = f.tell()
+        f.write(header)
+
+        extras = _encode(dict(ifdo.extras))
+        extras_offset = f.tell()
+        f.write(extras)
+
+        records = []
+        for image_data_list in ifdo.image_set_items.values():
+            record = _encode([image_data.to_dict() for image_data in image_data_list])
+            records.append((f.tell(), len(record)))
+            f.write(record)
+
+        names = [filename.encode("utf-8") for filename in ifdo.image_set_items]
+        name_spans = []
+        for name in names:
+            name_spans.append((f.tell(), len(name)))
+            f.write(name)
+
+        entries_offset = f.tell()
+        for name_span, record_span in zip(name_spans, records, strict=True):
+            f.write(ENTRY.pack(*name_span, *record_span))
+
+        slot_count = _slot_count(len(names))
+        slots = [0] * slot_count
+        for number, name in enumerate(names):
+            slot = _hash(name) & (slot_count - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (slot_count - 1)
+            slots[slot] = number + 1
+        slots_offset = f.tell()
+        f.write(struct.pack(f"<{slot_count}Q", *slots))
+
+        f.seek(0)
+        f.write(
+            PREAMBLE.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                header_offset,
+                len(header),
+                extras_offset,
+                len(extras),
+                entries_offset,
+                slots_offset,
+                len(names),
+                slot_count,
+            ),
+        )
+
+
+class iFDOContainer:  # noqa: N801
+    """
+    Read-only, memory-mapped view of an iFDO container file.
+
+    Attributes:
+        path (Path): Path to the container file.
+
+    Example:
+        with iFDOContainer("path/to/ifdo.ifdopack") as container:
+            image_data_list = container.get("image.jpg")
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open a container file.
+
+        Args:
+            path: Path to the container file.
+
+        Raises:
+            ValueError: If the file is not a supported container file.
+        """
+        self.path = Path(path)  # Ensure Path object
+        with self.path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < PREAMBLE.size:
+            self.close()
+            raise ValueError(f"Not an iFDO container file: {self.path}")
+        magic, format_version, *spans = PREAMBLE.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not an iFDO container file: {self.path}")
+        if format_version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported iFDO container format version: {format_version}")
+
+        header_offset, header_length, extras_offset, extras_length, *tables = spans
+        self._header_span = (header_offset, header_length)
+        self._extras_span = (extras_offset, extras_length)
+        self._entries_offset: int
+        self._slots_offset: int
+        self._count: int
+        self._slot_count: int
+        self._entries_offset, self._slots_offset, self._count, self._slot_count = tables
+        self._header: ImageSetHeader | None = None
+
+    def _read(self, offset: int, length: int) -> bytes:
+        return self._mmap[offset : offset + length]
+
+    def _entry(self, number: int) -> tuple[int, int, int, int]:
+        name_offset, name_length, record_offset, record_length = ENTRY.unpack_from(
+            self._mmap,
+            self._entries_offset + number * ENTRY.size,
+        )
+        return name_offset, name_length, record_offset, record_length
+
+    def _find(self, filename: str) -> int | None:
+        """
+        Find the entry number of an item by probing the hash table.
+        """
+        if not self._slot_count:
+            return None
+        name = filename.encode("utf-8")
+        mask = self._slot_count - 1
+        slot = _hash(name) & mask
+        while True:
+            number: int
+            (number,) = SLOT.unpack_from(self._mmap, self._slots_offset + slot * SLOT.size)
+            if not number:
+                return None
+            name_offset, name_length, _, _ = self._entry(number - 1)
+            if name_length == len(name) and self._read(name_offset, name_length) == name:
+                return number - 1
+            slot = (slot + 1) & mask
+
+    def _filename(self, number: int) -> str:
+        name_offset, name_length, _, _ = self._entry(number)
+        return self._read(name_offset, name_length).decode("utf-8")
+
+    def _record(self, number: int) -> list[ImageData]:
+        _, _, record_offset, record_length = self._entry(number)
+        return [ImageData.from_dict(d) for d in json.loads(self._read(record_offset, record_length))]
+
+    @property
+    def image_set_header(self) -> ImageSetHeader:
+        """
+        Get the image set header, decoded on first access.
+
+        Returns:
+            The image set header.
+        """
+        if self._header is None:
+            self._header = ImageSetHeader.from_dict(json.loads(self._read(*self._header_span)))
+        return self._header
+
+    @property
+    def extras(self) -> dict[str, Any]:
+        """
+        Get the top-level keys of the iFDO other than the header and items (e.g. $schema), decoded on each access.
+
+        Returns:
+            Mapping of key to raw value.
+        """
+        extras: dict[str, Any] = json.loads(self._read(*self._extras_span))
+        return extras
+
+    def get(self, filename: str) -> list[ImageData] | None:
+        """
+        Get the image data entries of a single item, decoding only that item's record.
+
+        Args:
+            filename: Filename of the item.
+
+        Returns:
+            The image data entries, or None if the container has no item with that filename.
+        """
+        number = self._find(filename)
+        return None if number is None else self._record(number)
+
+    def __getitem__(self, filename: str) -> list[ImageData]:
+        image_data_list = self.get(filename)
+        if image_data_list is None:
+            raise KeyError(filename)
+        return image_data_list
+
+    def __contains__(self, filename: object) -> bool:
+        return isinstance(filename, str) and self._find(filename) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        for number in range(self._count):
+            yield self._filename(number)
+
+    def items(self) -> Iterator[tuple[str, list[ImageData]]]:
+        """
+        Iterate over all items, decoding one record at a time.
+
+        Yields:
+            Tuples of filename and image data entries.
+        """
+        for number in range(self._count):
+            yield self._filename(number), self._record(number)
+
+    def to_ifdo(self) -> iFDO:
+        """
+        Decode the whole container into an iFDO.
+
+        Returns:
+            The iFDO.
+        """
+        ifdo = iFDO(image_set_header=self.image_set_header, image_set_items=dict(self.items()))
+        ifdo.extras.update(self.extras)
+        ifdo.mark_clean()  # Mirrors the file, like an iFDO created by from_dict
+        return ifdo
+
+    def close(self) -> None:
+        """
+        Close the memory map.
+        """
+        self._mmap.close()
+
+    def __enter__(self) -> "iFDOContainer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def convert_to_container(source: str | Path, destination: str | Path) -> None:
+    """
+    Convert a YAML/JSON iFDO file to a container file.
+
+    Args:
+        source: Path to the YAML/JSON iFDO file.
+        destination: Path to the container file.
+    """
+    write_container(iFDO.load(source), destination)
+
+
+def convert_from_container(source: str | Path, destination: str | Path) -> None:
+    """
+    Convert a container file to a YAML iFDO file.
+
+    Args:
+        source: Path to the container file.
+        destination: Path to the YAML iFDO file.
+    """
+    with iFDOContainer(source) as container:
+        container.to_ifdo().save(destination)
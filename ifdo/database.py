@@ -0,0 +1,325 @@
+"""
+SQLite storage for large collections of iFDOs.
+
+This module maps iFDO content into a normalized SQLite schema so that collections spanning many image sets can be
+queried without loading every iFDO file:
+
+    image_sets          one row per image set, with the encoded image set header
+    image_data          one row per image data entry, with indexed filename, UUID, datetime and coordinates
+    annotations         one row per image annotation
+    annotation_labels   one row per annotation label, with an indexed label
+
+Entries are stored in their encoded (dict) form, so an exported iFDO is equal to the imported one. The indexed UUID,
+datetime and coordinate columns hold the resolved values: a field that an entry does not set is taken from the first
+entry of its item (for video frames) and else from the image set header, so queries find entries that inherit it.
+Queries return ImageData objects and page through the results lazily.
+
+Classes:
+    Database: SQLite database of iFDO content.
+"""
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from ifdo.model import encode_value
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_sets (
+    id INTEGER PRIMARY KEY,
+    uuid TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    header TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS image_data (
+    id INTEGER PRIMARY KEY,
+    image_set_id INTEGER NOT NULL REFERENCES image_sets(id) ON DELETE CASCADE,
+    filename TEXT NOT NULL,
+    entry INTEGER NOT NULL,
+    uuid TEXT,
+    datetime TEXT,
+    latitude REAL,
+    longitude REAL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS annotations (
+    id INTEGER PRIMARY KEY,
+    image_data_id INTEGER NOT NULL REFERENCES image_data(id) ON DELETE CASCADE,
+    shape TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS annotation_labels (
+    annotation_id INTEGER NOT NULL REFERENCES annotations(id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    annotator TEXT,
+    confidence REAL
+);
+CREATE INDEX IF NOT EXISTS image_data_image_set_id ON image_data(image_set_id);
+CREATE INDEX IF NOT EXISTS image_data_filename ON image_data(filename);
+CREATE INDEX IF NOT EXISTS image_data_uuid ON image_data(uuid);
+CREATE INDEX IF NOT EXISTS image_data_datetime ON image_data(datetime);
+CREATE INDEX IF NOT EXISTS image_data_latitude_longitude ON image_data(latitude, longitude);
+CREATE INDEX IF NOT EXISTS annotations_image_data_id ON annotations(image_data_id);
+CREATE INDEX IF NOT EXISTS annotation_labels_annotation_id ON annotation_labels(annotation_id);
+CREATE INDEX IF NOT EXISTS annotation_labels_label ON annotation_labels(label);
+"""
+
+ANNOTATIONS_KEY = "image-annotations"
+INDEXED_FIELDS = ("image_uuid", "image_datetime", "image_latitude", "image_longitude")  # Resolved before insert
+MAX_VARIABLES = 999  # SQLite's lowest limit on bound parameters per statement (before 3.32)
+
+
+def _dumps(d: dict[str, Any]) -> str:
+    return json.dumps(d, separators=(",", ":"), ensure_ascii=False)
+
+
+def _resolve(image_data: ImageData, defaults: list[Any]) -> list[Any]:
+    """
+    Get the values of the indexed fields of an entry, falling back to the inherited ones for fields it does not set.
+    """
+    return [
+        default if value is None else value
+        for value, default in zip((getattr(image_data, name) for name in INDEXED_FIELDS), defaults, strict=True)
+    ]
+
+
+class Database:
+    """
+    SQLite database of iFDO content.
+
+    Attributes:
+        connection (sqlite3.Connection): Connection to the database.
+
+    Example:
+        with Database("catalog.sqlite") as db:
+            db.import_ifdo(iFDO.load("path/to/ifdo.yaml"))
+            for filename, image_data in db.query(label="fish", start=datetime(2019, 3, 1)):
+                ...
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open (or create) a database.
+
+        Args:
+            path: Path to the SQLite database file, or ":memory:" for an in-memory database.
+        """
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self.connection.close()
+
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def image_sets(self) -> list[tuple[str, str]]:
+        """
+        List the image sets in the database.
+
+        Returns:
+            Tuples of image set UUID and name, in import order.
+        """
+        return self.connection.execute("SELECT uuid, name FROM image_sets ORDER BY id").fetchall()
+
+    def import_ifdo(self, ifdo: iFDO) -> None:
+        """
+        Import an iFDO, replacing any image set with the same UUID.
+
+        Args:
+            ifdo: iFDO to import.
+        """
+        header = ifdo.image_set_header
+        with self.connection:  # Single transaction
+            self.connection.execute("DELETE FROM image_sets WHERE uuid = ?", (header.image_set_uuid,))
+            image_set_id = self.connection.execute(
+                "INSERT INTO image_sets (uuid, name, header) VALUES (?, ?, ?)",
+                (header.image_set_uuid, header.image_set_name, _dumps(header.to_dict())),
+            ).lastrowid
+
+            defaults = [getattr(header, name) for name in INDEXED_FIELDS]
+            for filename, image_data_list in ifdo.image_set_items.items():
+                item_defaults = defaults
+                for entry, image_data in enumerate(image_data_list):
+                    resolved = _resolve(image_data, item_defaults)
+                    if entry == 0:  # Later frames inherit from the first entry of the item
+                        item_defaults = resolved
+                    self._insert_image_data(image_set_id, filename, entry, image_data, resolved)
+
+    def _insert_image_data(
+        self,
+        image_set_id: int | None,
+        filename: str,
+        entry: int,
+        image_data: ImageData,
+        resolved: list[Any],
+    ) -> None:
+        d = image_data.to_dict()
+        annotations = d.pop(ANNOTATIONS_KEY, None) or []
+        uuid, image_datetime, latitude, longitude = resolved
+        image_data_id = self.connection.execute(
+            "INSERT INTO image_data (image_set_id, filename, entry, uuid, datetime, latitude, longitude, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                image_set_id,
+                filename,
+                entry,
+                uuid,
+                encode_value(image_datetime) if image_datetime is not None else None,
+                latitude,
+                longitude,
+                _dumps(d),
+            ),
+        ).lastrowid
+
+        for annotation in annotations:
+            annotation_id = self.connection.execute(
+                "INSERT INTO annotations (image_data_id, shape, data) VALUES (?, ?, ?)",
+                (image_data_id, annotation.get("shape"), _dumps(annotation)),
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO annotation_labels (annotation_id, label, annotator, confidence) VALUES (?, ?, ?, ?)",
+                [
+                    (annotation_id, label["label"], label.get("annotator"), label.get("confidence"))
+                    for label in annotation.get("labels", [])
+                ],
+            )
+
+    def export_ifdo(self, image_set_uuid: str) -> iFDO:
+        """
+        Export an image set as an iFDO.
+
+        Args:
+            image_set_uuid: UUID of the image set.
+
+        Returns:
+            The iFDO.
+
+        Raises:
+            KeyError: If the database has no image set with that UUID.
+        """
+        row = self.connection.execute(
+            "SELECT id, header FROM image_sets WHERE uuid = ?",
+            (image_set_uuid,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(image_set_uuid)
+        image_set_id, header = row
+
+        image_set_items: dict[str, list[ImageData]] = {}
+        for filename, image_data in self._select("image_data.image_set_id = ?", [image_set_id], page_size=1000):
+            image_set_items.setdefault(filename, []).append(image_data)
+
+        ifdo = iFDO(image_set_header=ImageSetHeader.from_dict(json.loads(header)), image_set_items=image_set_items)
+        ifdo.mark_clean()  # Mirrors the database, like an iFDO created by from_dict
+        return ifdo
+
+    def query(
+        self,
+        *,
+        image_set_uuid: str | None = None,
+        filename: str | None = None,
+        uuid: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bbox: tuple[float, float, float, float] | None = None,
+        label: str | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[tuple[str, ImageData]]:
+        """
+        Query image data entries across all image sets.
+
+        All given criteria must match. Results are fetched lazily, page_size entries at a time.
+
+        Args:
+            image_set_uuid: UUID of the image set.
+            filename: Filename of the item.
+            uuid: Image UUID.
+            start: Earliest image datetime (inclusive).
+            end: Latest image datetime (exclusive).
+            bbox: Bounding box as (min latitude, min longitude, max latitude, max longitude), inclusive.
+            label: Annotation label.
+            page_size: Number of entries to fetch per page.
+
+        Yields:
+            Tuples of filename and image data entry, in import order.
+        """
+        conditions = []
+        parameters: list[Any] = []
+        if image_set_uuid is not None:
+            conditions.append("image_data.image_set_id = (SELECT id FROM image_sets WHERE uuid = ?)")
+            parameters.append(image_set_uuid)
+        if filename is not None:
+            conditions.append("image_data.filename = ?")
+            parameters.append(filename)
+        if uuid is not None:
+            conditions.append("image_data.uuid = ?")
+            parameters.append(uuid)
+        if start is not None:
+            conditions.append("image_data.datetime >= ?")
+            parameters.append(encode_value(start))
+        if end is not None:
+            conditions.append("image_data.datetime < ?")
+            parameters.append(encode_value(end))
+        if bbox is not None:
+            conditions.append("image_data.latitude BETWEEN ? AND ? AND image_data.longitude BETWEEN ? AND ?")
+            min_latitude, min_longitude, max_latitude, max_longitude = bbox
+            parameters.extend((min_latitude, max_latitude, min_longitude, max_longitude))
+        if label is not None:
+            conditions.append(
+                "image_data.id IN (SELECT annotations.image_data_id FROM annotations "
+                "JOIN annotation_labels ON annotation_labels.annotation_id = annotations.id "
+                "WHERE annotation_labels.label = ?)",
+            )
+            parameters.append(label)
+
+        yield from self._select(" AND ".join(conditions) or "1", parameters, page_size)
+
+    def _select(self, where: str, parameters: list[Any], page_size: int) -> Iterator[tuple[str, ImageData]]:
+        # Conditions are fixed strings; all values are bound as parameters
+        sql = f"SELECT id, filename, data FROM image_data WHERE ({where}) AND id > ? ORDER BY id LIMIT ?"  # noqa: S608
+        last_id = 0
+        while True:
+            # Keyset pagination: each page is an index range scan, regardless of how far into the results it is
+            rows = self.connection.execute(sql, [*parameters, last_id, page_size]).fetchall()
+            if not rows:
+                return
+
+            annotations = self._annotations([row[0] for row in rows])
+            for image_data_id, filename, data in rows:
+                d = json.loads(data)
+                if image_data_id in annotations:
+                    d[ANNOTATIONS_KEY] = annotations[image_data_id]
+                yield filename, ImageData.from_dict(d)
+
+            last_id = rows[-1][0]
+
+    def _annotations(self, image_data_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+        # Only the entries of the page: with filters, the ids of a page can be far apart
+        annotations: dict[int, list[dict[str, Any]]] = {}
+        for start in range(0, len(image_data_ids), MAX_VARIABLES):
+            ids = image_data_ids[start : start + MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(ids))
+            for image_data_id, data in self.connection.execute(
+                f"SELECT image_data_id, data FROM annotations WHERE image_data_id IN ({placeholders}) ORDER BY id",  # noqa: S608
+                ids,
+            ):
+                annotations.setdefault(image_data_id, []).append(json.loads(data))
+        return annotations
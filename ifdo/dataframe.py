@@ -0,0 +1,182 @@
+"""
+Conversion between iFDOs and pandas/Polars DataFrames.
+
+An iFDO is flattened into one row per image data entry (so a video item contributes one row per frame entry). Columns
+are named by iFDO key, with an "image-filename" column for the item's filename. Nested objects are flattened into dotted
+columns (e.g. "image-context.name", "image-camera-pose.pose-utm-zone"). Enumerations are stored as their values, and
+lists (such as the camera pose orientation matrix, creators or annotations) as encoded lists in a single cell.
+
+The columns are built directly from the model objects, without an intermediate to_dict of the whole iFDO.
+
+pandas and Polars are optional dependencies (pip install ifdo[pandas] or ifdo[polars]).
+
+Functions:
+    to_columns: Flatten an iFDO into a mapping of column name to values.
+    to_pandas: Convert an iFDO to a pandas DataFrame.
+    to_polars: Convert an iFDO to a Polars DataFrame.
+    from_dataframe: Convert a pandas or Polars DataFrame back to an iFDO.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from ifdo.model import encode_value
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+from ifdo.tabular import FILENAME_COLUMN, column_values, dataframe_columns, is_missing, items_from_columns
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+SEPARATOR = "."
+
+
+def _flatten(obj: object, prefix: str, row: dict[str, Any]) -> None:
+    """
+    Flatten the fields of a model object into row, under dotted column names.
+    """
+    for name, key in obj.field_keys.items():  # type: ignore[attr-defined]
+        value = getattr(obj, name)
+        if value is None:
+            continue
+        column = f"{prefix}{key}"
+        if hasattr(value, "field_keys"):  # Nested object
+            _flatten(value, f"{column}{SEPARATOR}", row)
+        elif isinstance(value, Enum):
+            row[column] = value.value
+        elif isinstance(value, datetime):
+            row[column] = value
+        else:
+            row[column] = encode_value(value)
+
+
+def to_columns(ifdo: iFDO, *, inherit_header: bool = False) -> dict[str, list[Any]]:
+    """
+    Flatten an iFDO into a mapping of column name to values, with one row per image data entry.
+
+    Args:
+        ifdo: iFDO to flatten.
+        inherit_header: Whether to fill fields that an entry does not set from the first entry of its item (for video
+            frames) and from the image set header.
+
+    Returns:
+        Mapping of column name to values. The first column is the filename.
+    """
+    header_row: dict[str, Any] = {}
+    if inherit_header:
+        _flatten(ifdo.image_set_header, "", header_row)
+        header_row = {
+            column: value
+            for column, value in header_row.items()
+            if column.partition(SEPARATOR)[0] in ImageData.key_fields  # Only fields that entries can override
+        }
+
+    n_rows = sum(len(image_data_list) for image_data_list in ifdo.image_set_items.values())
+    columns: dict[str, list[Any]] = {FILENAME_COLUMN: [None] * n_rows}
+    row_index = 0
+    for filename, image_data_list in ifdo.image_set_items.items():
+        first_row: dict[str, Any] = {}
+        for entry_index, image_data in enumerate(image_data_list):
+            row: dict[str, Any] = {}
+            _flatten(image_data, "", row)
+            if inherit_header:
+                if entry_index == 0:
+                    first_row = row
+                else:
+                    row = {**first_row, **row}
+                row = {**header_row, **row}
+
+            columns[FILENAME_COLUMN][row_index] = filename
+            for column, value in row.items():
+                values = columns.get(column)
+                if values is None:
+                    values = columns[column] = [None] * n_rows
+                values[row_index] = value
+            row_index += 1
+    return columns
+
+
+def to_pandas(ifdo: iFDO, *, inherit_header: bool = False) -> "pd.DataFrame":
+    """
+    Convert an iFDO to a pandas DataFrame, with one row per image data entry.
+
+    Args:
+        ifdo: iFDO to convert.
+        inherit_header: Whether to fill fields that an entry does not set from the first entry of its item (for video
+            frames) and from the image set header.
+
+    Returns:
+        pandas.DataFrame
+    """
+    try:
+        import pandas as pd  # Optional dependency
+    except ImportError as e:
+        raise ImportError("DataFrame export requires pandas: pip install ifdo[pandas]") from e
+
+    return pd.DataFrame(to_columns(ifdo, inherit_header=inherit_header))
+
+
+def to_polars(ifdo: iFDO, *, inherit_header: bool = False) -> "pl.DataFrame":
+    """
+    Convert an iFDO to a Polars DataFrame, with one row per image data entry.
+
+    Args:
+        ifdo: iFDO to convert.
+        inherit_header: Whether to fill fields that an entry does not set from the first entry of its item (for video
+            frames) and from the image set header.
+
+    Returns:
+        polars.DataFrame
+    """
+    try:
+        import polars as pl  # Optional dependency
+    except ImportError as e:
+        raise ImportError("DataFrame export requires Polars: pip install ifdo[polars]") from e
+
+    return pl.DataFrame(to_columns(ifdo, inherit_header=inherit_header), strict=False)
+
+
+def _unflatten(columns: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    """
+    Combine dotted columns into columns of dicts, e.g. "image-context.name" into "image-context".
+    """
+    combined: dict[str, list[Any]] = {}
+    nested: dict[str, dict[str, list[Any]]] = {}
+    for column, values in columns.items():
+        prefix, separator, rest = column.partition(SEPARATOR)
+        if separator:
+            nested.setdefault(prefix, {})[rest] = values
+        else:
+            combined[column] = values
+
+    for prefix, flat_columns in nested.items():
+        sub_columns = _unflatten(flat_columns)
+        n_rows = len(next(iter(sub_columns.values())))
+        combined[prefix] = [
+            {
+                key: values[row]
+                for key, values in sub_columns.items()
+                if not is_missing(values[row], empty_strings=False)
+            }
+            or None
+            for row in range(n_rows)
+        ]
+    return combined
+
+
+def from_dataframe(df: "pd.DataFrame | pl.DataFrame", header: ImageSetHeader, *, validate: bool = True) -> iFDO:
+    """
+    Convert a pandas or Polars DataFrame with one row per image data entry back to an iFDO.
+
+    Args:
+        df: pandas.DataFrame or polars.DataFrame, with columns as produced by to_pandas/to_polars.
+        header: Image set header of the iFDO.
+        validate: Whether to check range constraints (e.g. latitude and longitude) over each whole column.
+
+    Returns:
+        The iFDO.
+    """
+    columns = {column: column_values(values) for column, values in dataframe_columns(df).items()}
+    image_set_items = items_from_columns(_unflatten(columns), validate=validate, empty_strings=False)
+    return iFDO(image_set_header=header, image_set_items=image_set_items)
@@ -0,0 +1,224 @@
+"""
+Decimation of video frame entries.
+
+A video item can list an image data entry for every frame, while most consumers (viewers, training pipelines) need only
+about one frame per second, frames after the camera moved, or the annotated frames. decimate() produces a reduced iFDO
+that keeps a frame if it satisfies any of the enabled criteria:
+
+- interval: at least this many seconds after the last kept frame of the item.
+- min_distance: at least this many meters from the position of the last kept frame (including altitude changes).
+- annotated: the frame has annotations.
+
+The first entry of a video item also holds the defaults of its other frames. If the first entry is dropped, its
+defaults are merged into the first kept frame, which becomes the new first entry, and later kept frames explicitly set
+the fields they would otherwise wrongly inherit from it: the old first entry's value, or else the image set header's.
+If a later frame inherited a field from neither, it cannot be expressed without a first entry that leaves the field
+unset, so the old first entry is kept instead. Times and positions that a frame does not set are taken from the first
+entry.
+
+Items are processed one at a time in a single pass, so decimate_items() can also stream items from any source. Items
+with a single entry (photos) are kept unchanged, and kept entries are shared with the source rather than copied.
+
+Functions:
+    decimate_frames: Decimate the entries of one video item.
+    decimate_items: Decimate the entries of a stream of image set items.
+    decimate: Decimate the video items of an iFDO.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from math import asin, cos, hypot, radians, sin, sqrt
+
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+
+EARTH_RADIUS_METERS = 6371008.8
+
+
+def _seconds(value: datetime) -> float:
+    """
+    Get the POSIX time of a datetime, taking naive datetimes as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _distance_meters(a: ImageData, b: ImageData, defaults: ImageData) -> float | None:
+    """
+    Get the distance between the positions of two frames, or None if either lacks a position.
+    """
+    lat_a = a.image_latitude if a.image_latitude is not None else defaults.image_latitude
+    lon_a = a.image_longitude if a.image_longitude is not None else defaults.image_longitude
+    lat_b = b.image_latitude if b.image_latitude is not None else defaults.image_latitude
+    lon_b = b.image_longitude if b.image_longitude is not None else defaults.image_longitude
+    if lat_a is None or lon_a is None or lat_b is None or lon_b is None:
+        return None
+    # Haversine formula
+    phi_a, phi_b = radians(lat_a), radians(lat_b)
+    h = sin((phi_b - phi_a) / 2) ** 2 + cos(phi_a) * cos(phi_b) * sin(radians(lon_b - lon_a) / 2) ** 2
+    distance = 2 * EARTH_RADIUS_METERS * asin(min(1.0, sqrt(h)))
+
+    alt_a = a.image_altitude_meters if a.image_altitude_meters is not None else defaults.image_altitude_meters
+    alt_b = b.image_altitude_meters if b.image_altitude_meters is not None else defaults.image_altitude_meters
+    if alt_a is not None and alt_b is not None:
+        distance = hypot(distance, alt_b - alt_a)
+    return distance
+
+
+def _set_fields(image_data: ImageData) -> dict[str, object]:
+    return {name: value for name in ImageData.field_keys if (value := getattr(image_data, name)) is not None}
+
+
+def _rebase(first: ImageData, kept: list[ImageData], header: ImageSetHeader | None) -> list[ImageData] | None:
+    """
+    Make the first kept frame the new first entry of an item whose first entry was dropped.
+
+    Returns None if a later kept frame would inherit a value from the new first entry that it inherited from neither
+    the old first entry nor the header.
+    """
+    # Fields that would now be inherited from the new first entry rather than the old one, with the values the later
+    # frames inherited so far (None if they inherited nothing)
+    first_fields = _set_fields(first)
+    changed = {}
+    for name, value in _set_fields(kept[0]).items():
+        inherited = first_fields.get(name)
+        if inherited is None and header is not None:
+            inherited = getattr(header, name, None)
+        if inherited != value:
+            changed[name] = inherited
+
+    restores = []
+    for image_data in kept[1:]:
+        restore = {name: value for name, value in changed.items() if getattr(image_data, name) is None}
+        if None in restore.values():
+            return None
+        restores.append(restore)
+
+    new_first = first.replace(**_set_fields(kept[0]))  # The old defaults, overridden by the frame's own values
+    if kept[0].extras:
+        new_first.extras.update(kept[0].extras)
+    rebased = [new_first]
+    for image_data, restore in zip(kept[1:], restores, strict=True):
+        rebased.append(image_data.replace(**restore) if restore else image_data)
+    return rebased
+
+
+def decimate_frames(
+    image_data_list: list[ImageData],
+    interval: float | None = None,
+    min_distance: float | None = None,
+    *,
+    annotated: bool = False,
+    header: ImageSetHeader | None = None,
+) -> list[ImageData]:
+    """
+    Decimate the entries of one video item.
+
+    Args:
+        image_data_list: The entries, in frame order. The first entry holds the defaults of the others.
+        interval: Keep frames at least this many seconds after the last kept frame.
+        min_distance: Keep frames at least this many meters from the last kept frame.
+        annotated: Keep frames that have annotations.
+        header: The image set header, which frames fall back to for fields that the first entry does not set.
+
+    Returns:
+        The kept entries, with the first-entry defaults preserved. Unchanged entries are shared with the input. Empty if
+        no frame is kept. The first entry is kept along with the kept frames if they cannot be rebased onto the first
+        kept frame (see the module docstring).
+
+    Raises:
+        ValueError: If no criterion is enabled.
+    """
+    if interval is None and min_distance is None and not annotated:
+        raise ValueError("Enable at least one of interval, min_distance and annotated")
+    if len(image_data_list) <= 1:
+        return list(image_data_list)
+
+    first = image_data_list[0]
+    kept: list[ImageData] = []
+    last_time: float | None = None
+    last: ImageData | None = None
+    for image_data in image_data_list:
+        time = image_data.image_datetime if image_data.image_datetime is not None else first.image_datetime
+        keep = annotated and bool(image_data.image_annotations)
+        if not keep and interval is not None:
+            keep = last is None or (time is not None and (last_time is None or _seconds(time) - last_time >= interval))
+        if not keep and min_distance is not None:
+            distance = None if last is None else _distance_meters(last, image_data, first)
+            keep = last is None or (distance is not None and distance >= min_distance)
+        if keep:
+            kept.append(image_data)
+            last = image_data
+            last_time = _seconds(time) if time is not None else None
+
+    if kept and kept[0] is not first:
+        rebased = _rebase(first, kept, header)
+        return rebased if rebased is not None else [first, *kept]
+    return kept
+
+
+def decimate_items(
+    items: Iterable[tuple[str, list[ImageData]]],
+    interval: float | None = None,
+    min_distance: float | None = None,
+    *,
+    annotated: bool = False,
+    header: ImageSetHeader | None = None,
+) -> Iterator[tuple[str, list[ImageData]]]:
+    """
+    Decimate the entries of a stream of image set items.
+
+    Args:
+        items: Pairs of filename and entries, e.g. iFDO.image_set_items.items().
+        interval: Keep frames at least this many seconds after the last kept frame of the item.
+        min_distance: Keep frames at least this many meters from the last kept frame of the item.
+        annotated: Keep frames that have annotations.
+        header: The image set header, which frames fall back to for fields that the first entry does not set.
+
+    Yields:
+        Pairs of filename and kept entries. Video items without any kept frame are dropped.
+
+    Raises:
+        ValueError: If no criterion is enabled.
+    """
+    for filename, image_data_list in items:
+        kept = decimate_frames(image_data_list, interval, min_distance, annotated=annotated, header=header)
+        if kept or not image_data_list:
+            yield filename, kept
+
+
+def decimate(
+    ifdo: iFDO,
+    interval: float | None = None,
+    min_distance: float | None = None,
+    *,
+    annotated: bool = False,
+) -> iFDO:
+    """
+    Decimate the video items of an iFDO.
+
+    Args:
+        ifdo: The iFDO.
+        interval: Keep frames at least this many seconds after the last kept frame of each item, e.g. 1.0 for 1 Hz.
+        min_distance: Keep frames at least this many meters from the last kept frame of each item.
+        annotated: Keep frames that have annotations.
+
+    Returns:
+        A copy-on-write clone of the iFDO with the decimated items. Video items without any kept frame are dropped.
+
+    Raises:
+        ValueError: If no criterion is enabled.
+
+    Example:
+        # One frame per second, plus every annotated frame
+        reduced = decimate(ifdo, interval=1.0, annotated=True)
+        reduced.save("ifdo-1hz.yaml")
+    """
+    items = decimate_items(
+        ifdo.image_set_items.items(),
+        interval,
+        min_distance,
+        annotated=annotated,
+        header=ifdo.image_set_header,
+    )
+    return ifdo.with_items(dict(items))
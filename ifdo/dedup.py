@@ -0,0 +1,455 @@
+"""
+Persistent index of image hashes and UUIDs for finding duplicates across many iFDOs.
+
+Merging archives means finding the images that appear in several iFDOs, matched by image-hash-sha256 or image-uuid.
+DedupIndex keeps one row per image set item in an SQLite database, with only compact keys: the raw 32-byte SHA-256
+digest, the raw 16-byte UUID, and an 8-byte digest of the item's remaining metadata. Hashes that are not SHA-256 hex
+digests and UUIDs that do not parse are stored as text, so they still match themselves. The database stays on disk and
+is queried with indexed GROUP BY queries, so the index scales to tens of millions of items in modest memory.
+
+iFDO files are ingested item by item with streaming JSON and YAML parsers, without constructing model objects or
+holding the whole document in memory, and each source is written in one transaction. Re-ingesting a source replaces
+its rows. Large ingests should run in a bulk() block, which builds the key indexes once at the end rather than
+maintaining them row by row.
+
+Classes:
+    Match: A group of items that share a key.
+    DedupIndex: SQLite index of image hashes and UUIDs.
+
+Functions:
+    iter_file_items: Stream the encoded image set items of an iFDO file.
+"""
+
+import json
+import sqlite3
+from collections.abc import Callable, Generator, Iterable, Iterator
+from contextlib import contextmanager
+from hashlib import sha256
+from itertools import groupby, islice
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, NamedTuple
+from uuid import UUID
+
+from ifdo.compression import open_text
+from ifdo.model import encode_value
+from ifdo.models import iFDO
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS items (
+    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    filename TEXT NOT NULL,
+    hash BLOB,
+    uuid BLOB,
+    metadata BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_source_id ON items(source_id);
+"""
+KEY_INDEXES = """
+CREATE INDEX IF NOT EXISTS items_hash ON items(hash, uuid, metadata);
+CREATE INDEX IF NOT EXISTS items_uuid ON items(uuid, hash);
+"""
+
+ITEMS_KEY = "image-set-items"
+HASH_KEY = "image-hash-sha256"
+UUID_KEY = "image-uuid"
+SHA256_HEX_SIZE = 64
+METADATA_DIGEST_SIZE = 8
+READ_SIZE = 1 << 20  # 1 MiB
+BATCH_SIZE = 10000
+CACHE_KIB = 64 * 1024
+
+
+class Match(NamedTuple):
+    """
+    A group of items that share a key.
+
+    Attributes:
+        kind (str): What the items share and (for conflicts) how they differ: "hash" or "uuid" for duplicates,
+            "hash-uuid" for items with the same hash but different UUIDs, "uuid-hash" for items with the same UUID but
+            different hashes, and "metadata" for items with the same hash and UUID but different other metadata.
+        key (str): The shared hash (hex) or UUID.
+        items (list[tuple[str, str]]): The items, as (source, filename) tuples.
+    """
+
+    kind: str
+    key: str
+    items: list[tuple[str, str]]
+
+
+def _hash_key(value: object) -> bytes | str | None:
+    """
+    Get the stored key of a hash: the raw digest for SHA-256 hex digests, and the text of any other value.
+    """
+    if not value:
+        return None
+    text = str(value)
+    if len(text) == SHA256_HEX_SIZE:
+        try:
+            return bytes.fromhex(text)
+        except ValueError:  # Not hex
+            pass
+    return text
+
+
+def _uuid_key(value: object) -> bytes | str | None:
+    """
+    Get the stored key of a UUID: the raw 16 bytes for valid UUIDs, and the text of any other value.
+    """
+    if not value:
+        return None
+    text = str(value)
+    try:
+        return UUID(text).bytes
+    except ValueError:  # Not a UUID
+        return text
+
+
+def _hash_str(key: bytes | str) -> str:
+    return key.hex() if isinstance(key, bytes) else key
+
+
+def _uuid_str(key: bytes | str) -> str:
+    return str(UUID(bytes=key)) if isinstance(key, bytes) else key
+
+
+def _item_row(
+    filename: str,
+    entries: dict[str, Any] | list[dict[str, Any]] | None,
+) -> tuple[str, bytes | str | None, bytes | str | None, bytes]:
+    """
+    Get the keys of an encoded image set item: a dict, or a list of dicts for videos.
+    """
+    if isinstance(entries, dict):
+        entries = [entries]
+    entries = entries or [{}]
+    hash_value = next((entry.get(HASH_KEY) for entry in entries if entry.get(HASH_KEY)), None)
+    uuid_value = next((entry.get(UUID_KEY) for entry in entries if entry.get(UUID_KEY)), None)
+    metadata = {key: value for key, value in entries[0].items() if key not in (HASH_KEY, UUID_KEY)}
+    canonical = json.dumps(metadata, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    digest = sha256(canonical.encode("utf-8")).digest()[:METADATA_DIGEST_SIZE]
+    return filename, _hash_key(hash_value), _uuid_key(uuid_value), digest
+
+
+class _JSONScanner:
+    """
+    Incremental scanner over a JSON text stream, decoding one value at a time.
+    """
+
+    def __init__(self, f: IO[str], read_size: int = READ_SIZE) -> None:
+        self.f = f
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read(self) -> None:
+        chunk = self.f.read(self.read_size)
+        self.eof = not chunk
+        self.buffer, self.position = self.buffer[self.position :] + chunk, 0
+
+    def peek(self, consume: str = "") -> str:
+        """
+        Skip whitespace and get the next character ("" at the end), consuming it if it is one of the given characters.
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                break
+            self._read()
+        char = self.buffer[self.position : self.position + 1]
+        if char and char in consume:
+            self.position += 1
+        return char
+
+    def decode(self) -> object:
+        """
+        Decode the next value, reading more input while it is incomplete or may continue (like a number).
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            self._read()
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object at the current position. The value of each key must be consumed in turn.
+        """
+        if self.peek("{") != "{":
+            raise ValueError("Expected a JSON object")
+        while self.peek("}") not in ("}", ""):
+            key = self.decode()
+            self.peek(":")
+            yield str(key)
+            self.peek(",")
+
+
+def _json_items(f: IO[str], read_size: int = READ_SIZE) -> Iterator[tuple[str, Any]]:
+    """
+    Stream the image set items of a JSON iFDO document, decoding one item at a time.
+    """
+    scanner = _JSONScanner(f, read_size)
+    for key in scanner.members():
+        if key != ITEMS_KEY or scanner.peek() != "{":
+            scanner.decode()  # Other top-level values (the header) are decoded and discarded
+            continue
+        for filename in scanner.members():
+            yield filename, scanner.decode()
+
+
+def _yaml_items(f: IO[str]) -> Iterator[tuple[str, Any]]:
+    """
+    Stream the image set items of a YAML iFDO document, composing and constructing one item at a time.
+    """
+    from yaml import SafeLoader
+    from yaml.events import MappingEndEvent, MappingStartEvent
+
+    loader: Any = SafeLoader(f)  # The event-level API is only partly typed in the stubs
+    try:
+        loader.get_event()  # Stream start
+        loader.get_event()  # Document start
+        if not loader.check_event(MappingStartEvent):
+            return
+        loader.get_event()
+        while not loader.check_event(MappingEndEvent):
+            key = loader.construct_object(loader.compose_node(None, None), deep=True)
+            if key != ITEMS_KEY or not loader.check_event(MappingStartEvent):
+                loader.compose_node(None, None)  # Other top-level values are composed but not constructed
+                continue
+            loader.get_event()
+            while not loader.check_event(MappingEndEvent):
+                filename = loader.construct_object(loader.compose_node(None, None), deep=True)
+                yield filename, loader.construct_object(loader.compose_node(None, None), deep=True)
+                loader.constructed_objects = {}  # Only keep the current item
+            loader.get_event()
+    finally:
+        loader.dispose()
+
+
+def iter_file_items(path: str | Path, read_size: int = READ_SIZE) -> Generator[tuple[str, Any], None, None]:
+    """
+    Stream the encoded image set items of an iFDO file (possibly compressed), one item at a time.
+
+    Args:
+        path: Path to the YAML or JSON file.
+        read_size: Number of characters to read per chunk from JSON files (YAML is read in the parser's own chunks).
+
+    Yields:
+        Pairs of filename and encoded item (a dict, or a list of dicts for videos).
+    """
+    with open_text(path) as f:
+        is_json = f.read(READ_SIZE).lstrip().startswith("{")
+    with open_text(path) as f:
+        yield from _json_items(f, read_size) if is_json else _yaml_items(f)
+
+
+class DedupIndex:
+    """
+    SQLite index of image hashes and UUIDs.
+
+    Attributes:
+        connection (sqlite3.Connection): Connection to the database.
+
+    Example:
+        with DedupIndex("dedup.sqlite") as index, index.bulk():
+            for path in Path("archive").glob("*.yaml"):
+                index.add_file(path)
+        with DedupIndex("dedup.sqlite") as index:
+            for match in index.duplicates():
+                print(match.key, match.items)
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open (or create) an index.
+
+        Args:
+            path: Path to the SQLite database file, or ":memory:" for an in-memory index.
+        """
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")  # Durable across application crashes with WAL
+        self.connection.execute(f"PRAGMA cache_size = -{CACHE_KIB}")  # Keeps index pages hot during bulk inserts
+        self.connection.executescript(SCHEMA)
+        self.connection.executescript(KEY_INDEXES)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self.connection.close()
+
+    def __enter__(self) -> "DedupIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @contextmanager
+    def bulk(self) -> Iterator["DedupIndex"]:
+        """
+        Defer maintenance of the hash and UUID indexes while ingesting many sources.
+
+        Inserting random keys into an index is much slower than building the index once over all rows, so the indexes
+        are dropped on entry and rebuilt on exit. Lookups and reports within the block are slow.
+
+        Yields:
+            The index.
+        """
+        self.connection.executescript("DROP INDEX IF EXISTS items_hash; DROP INDEX IF EXISTS items_uuid;")
+        try:
+            yield self
+        finally:
+            self.connection.executescript(KEY_INDEXES)
+
+    def sources(self) -> list[str]:
+        """
+        List the ingested sources.
+
+        Returns:
+            Source names, in ingestion order.
+        """
+        return [name for (name,) in self.connection.execute("SELECT name FROM sources ORDER BY id")]
+
+    def add_items(self, source: str, items: Iterable[tuple[str, Any]]) -> int:
+        """
+        Ingest encoded image set items, replacing any previous items of the same source.
+
+        Args:
+            source: Name of the source, e.g. the path of the iFDO file.
+            items: Pairs of filename and encoded item (a dict, or a list of dicts for videos), e.g. from the
+                "image-set-items" dict of a parsed iFDO file.
+
+        Returns:
+            Number of items ingested.
+        """
+        rows = (_item_row(filename, entries) for filename, entries in items)
+        count = 0
+        with self.connection:  # Single transaction
+            self.connection.execute("DELETE FROM sources WHERE name = ?", (source,))
+            source_id = self.connection.execute("INSERT INTO sources (name) VALUES (?)", (source,)).lastrowid
+            while batch := list(islice(rows, BATCH_SIZE)):
+                self.connection.executemany(
+                    "INSERT INTO items (source_id, filename, hash, uuid, metadata) VALUES (?, ?, ?, ?, ?)",
+                    [(source_id, *row) for row in batch],
+                )
+                count += len(batch)
+        return count
+
+    def add_ifdo(self, ifdo: iFDO, source: str | None = None) -> int:
+        """
+        Ingest the items of an iFDO object.
+
+        Args:
+            ifdo: The iFDO.
+            source: Name of the source. Defaults to the image set UUID.
+
+        Returns:
+            Number of items ingested.
+        """
+        source = source if source is not None else ifdo.image_set_header.image_set_uuid
+        items = ((filename, encode_value(entries)) for filename, entries in ifdo.image_set_items.items())
+        return self.add_items(source, items)
+
+    def add_file(self, path: str | Path, source: str | None = None) -> int:
+        """
+        Ingest the items of an iFDO file (possibly compressed), streamed one item at a time.
+
+        Args:
+            path: Path to the YAML or JSON file.
+            source: Name of the source. Defaults to the path.
+
+        Returns:
+            Number of items ingested.
+        """
+        return self.add_items(source if source is not None else str(path), iter_file_items(path))
+
+    def lookup(self, hash: str | None = None, uuid: str | None = None) -> list[tuple[str, str]]:  # noqa: A002
+        """
+        Find the items with a hash or UUID.
+
+        Args:
+            hash: Hex-encoded SHA-256 digest.
+            uuid: UUID.
+
+        Returns:
+            The items, as (source, filename) tuples.
+
+        Raises:
+            ValueError: If neither or both of hash and uuid are given.
+        """
+        if (hash is None) == (uuid is None):
+            raise ValueError("Give either a hash or a UUID")
+        column, key = ("hash", _hash_key(hash)) if hash is not None else ("uuid", _uuid_key(uuid))
+        return self.connection.execute(
+            f"SELECT sources.name, items.filename FROM items "  # noqa: S608 # nosec B608 - fixed identifiers
+            f"JOIN sources ON sources.id = items.source_id WHERE items.{column} = ? ORDER BY items.rowid",
+            (key,),
+        ).fetchall()
+
+    def _groups(self, kind: str, column: str, having: str, render: Callable[[bytes | str], str]) -> Iterator[Match]:
+        cursor = self.connection.execute(
+            f"SELECT items.{column}, sources.name, items.filename FROM items "  # noqa: S608 # nosec B608 - fixed identifiers
+            f"JOIN sources ON sources.id = items.source_id "
+            f"WHERE items.{column} IN (SELECT {column} FROM items WHERE {column} IS NOT NULL "
+            f"GROUP BY {column} HAVING {having}) "
+            f"ORDER BY items.{column}, items.rowid",
+        )
+        for key, rows in groupby(cursor, key=lambda row: row[0]):
+            yield Match(kind, render(key), [(source, filename) for _, source, filename in rows])
+
+    def duplicates(self, by: str = "hash") -> Iterator[Match]:
+        """
+        Find the groups of items that share a hash or UUID.
+
+        Args:
+            by: "hash" or "uuid".
+
+        Yields:
+            One match per shared key, ordered by key.
+
+        Raises:
+            ValueError: If by is not "hash" or "uuid".
+        """
+        if by == "hash":
+            return self._groups("hash", "hash", "COUNT(*) > 1", _hash_str)
+        if by == "uuid":
+            return self._groups("uuid", "uuid", "COUNT(*) > 1", _uuid_str)
+        raise ValueError(f"Unsupported key: {by}")
+
+    def conflicts(self) -> Iterator[Match]:
+        """
+        Find the groups of items whose keys or metadata disagree.
+
+        Yields:
+            Matches of kind "hash-uuid" (same hash, different UUIDs), then "uuid-hash" (same UUID, different hashes),
+            then "metadata" (same hash, UUID-consistent, but different other metadata).
+        """
+        yield from self._groups("hash-uuid", "hash", "COUNT(DISTINCT uuid) > 1", _hash_str)
+        yield from self._groups("uuid-hash", "uuid", "COUNT(DISTINCT hash) > 1", _uuid_str)
+        yield from self._groups(
+            "metadata",
+            "hash",
+            "COUNT(DISTINCT uuid) <= 1 AND COUNT(DISTINCT metadata) > 1",
+            _hash_str,
+        )
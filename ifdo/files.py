@@ -0,0 +1,211 @@
+"""
+Hashing of image files and tracking of their state between runs.
+
+Scanning and verifying image directories both hash many large files, often on network storage. The helpers in this
+module hash files concurrently in a bounded thread pool (hashlib releases the GIL on large buffers, so threads scale
+with the storage), stream each file through a reused buffer, and remember the size, modification time and digest of
+each file in a JSON state file so that unchanged files are not hashed again.
+
+Classes:
+    FileState: Size, modification time and digest of a file.
+    FileStateCache: Persistent mapping of file path to file state.
+
+Functions:
+    list_files: List the files under a directory.
+    file_sha256: Compute the SHA-256 digest of a file's contents.
+    hash_files: Hash files concurrently, skipping files whose state is unchanged.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import NamedTuple
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+STATE_VERSION = 1
+
+
+def list_files(root: Path, suffixes: Iterable[str] | None = None, *, recursive: bool = True) -> list[tuple[str, Path]]:
+    """
+    List the files under a directory, skipping hidden files and directories.
+
+    Args:
+        root: Directory to list.
+        suffixes: Optional file suffixes to include (with the leading dot). Matched case-insensitively.
+        recursive: Whether to list subdirectories.
+
+    Returns:
+        Pairs of path relative to root (in POSIX form) and path, sorted by path.
+    """
+    suffixes = frozenset(suffix.lower() for suffix in suffixes) if suffixes is not None else None
+    files = []
+    for directory, dirnames, filenames in os.walk(root):
+        if recursive:
+            dirnames[:] = [dirname for dirname in dirnames if not dirname.startswith(".")]
+        else:
+            dirnames.clear()
+        for filename in filenames:
+            if filename.startswith(".") or (suffixes is not None and Path(filename).suffix.lower() not in suffixes):
+                continue
+            path = Path(directory) / filename
+            files.append((path.relative_to(root).as_posix(), path))
+    return sorted(files)
+
+
+def file_sha256(path: Path, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        path: Path to the file.
+        chunk_size: Number of bytes to read at a time.
+
+    Returns:
+        Hex-encoded digest.
+    """
+    digest = sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with path.open("rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+class FileState(NamedTuple):
+    """
+    Size, modification time and digest of a file.
+
+    Attributes:
+        size (int): Size in bytes.
+        mtime_ns (int): Modification time in nanoseconds.
+        sha256 (str): Hex-encoded SHA-256 digest of the contents.
+        uuid (str | None): UUID assigned to the file, if any.
+    """
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    uuid: str | None = None
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """
+        Check whether a file still has this size and modification time.
+
+        Args:
+            stat: Current stat result of the file.
+
+        Returns:
+            True if the file is unchanged.
+        """
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+class FileStateCache:
+    """
+    Persistent mapping of file path to file state, stored as a JSON file.
+
+    Attributes:
+        path (Path | None): Path to the JSON file, or None for an in-memory cache.
+        states (dict[str, FileState]): File states by path.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        Initialize the cache, loading the JSON file if it exists.
+
+        Args:
+            path: Path to the JSON file, or None for an in-memory cache.
+        """
+        self.path = Path(path) if path is not None else None
+        self.states: dict[str, FileState] = {}
+        if self.path is not None and self.path.exists():
+            with self.path.open() as f:
+                d = json.load(f)
+            if d.get("version") == STATE_VERSION:  # Ignore state files written by other versions
+                self.states = {key: FileState(*value) for key, value in d["files"].items()}
+
+    def get(self, key: str, stat: os.stat_result) -> FileState | None:
+        """
+        Get the state of a file if it is unchanged.
+
+        Args:
+            key: Path of the file, as used by put.
+            stat: Current stat result of the file.
+
+        Returns:
+            The cached state, or None if the file is unknown or has changed.
+        """
+        state = self.states.get(key)
+        if state is None or not state.matches(stat):
+            return None
+        return state
+
+    def put(self, key: str, state: FileState) -> None:
+        """
+        Store the state of a file.
+
+        Args:
+            key: Path of the file.
+            state: State of the file.
+        """
+        self.states[key] = state
+
+    def save(self) -> None:
+        """
+        Write the cache to its JSON file, atomically replacing the previous version.
+        """
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        d = {"version": STATE_VERSION, "files": {key: list(state) for key, state in self.states.items()}}
+        with NamedTemporaryFile("w", dir=self.path.parent, delete=False, suffix=".tmp") as f:
+            json.dump(d, f, separators=(",", ":"))
+        Path(f.name).replace(self.path)
+
+
+def hash_files(
+    files: Iterable[tuple[str, Path]],
+    cache: FileStateCache | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[str, Path, FileState | OSError]]:
+    """
+    Hash files concurrently, skipping files whose size and modification time match the cache.
+
+    Computed states are stored in the cache (but the cache is not saved). A file that does not exist or cannot be read
+    does not stop the other files: its error is yielded in place of its state.
+
+    Args:
+        files: Pairs of cache key and path.
+        cache: Optional cache of file states.
+        workers: Maximum number of hashing threads. Defaults to the ThreadPoolExecutor default.
+        chunk_size: Number of bytes to read at a time.
+
+    Yields:
+        Tuples of cache key, path and file state, in input order. States keep the UUID stored in the cache. For files
+        that do not exist or cannot be read, the OSError (e.g. FileNotFoundError) instead of the state.
+    """
+
+    def state_of(file: tuple[str, Path]) -> FileState | OSError:
+        key, path = file
+        try:
+            stat = path.stat()
+            previous = cache.states.get(key) if cache is not None else None
+            if previous is not None and previous.matches(stat):
+                return previous
+            uuid = previous.uuid if previous is not None else None  # A modified file keeps its identity
+            return FileState(stat.st_size, stat.st_mtime_ns, file_sha256(path, chunk_size), uuid)
+        except OSError as e:  # Vanished or unreadable
+            return e
+
+    files = list(files)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for (key, path), state in zip(files, executor.map(state_of, files), strict=True):
+            if cache is not None and isinstance(state, FileState):
+                cache.put(key, state)
+            yield key, path, state
@@ -0,0 +1,324 @@
+"""
+Appending image set items to an iFDO file through a sidecar journal.
+
+Saving an iFDO rewrites the whole file, so adding a few frames to a growing file every few minutes costs O(total
+items) per update. append_items() instead appends the new items to a journal next to the file (ifdo.yaml.journal for
+ifdo.yaml), one JSON line per call, without reading or rewriting the iFDO file itself. load() applies the journal on top
+of the file, and compact() merges it into the file and removes it.
+
+The journal is crash-safe:
+
+- Each append is a single write of one complete line, followed by fsync. A line torn by a crash mid-write is
+  ignored on load and cut off by the next append.
+- The journal's first line records the size and modification time of the iFDO file it extends. compact() records
+  the size and modification time of the merged file in the journal, then atomically replaces the iFDO file, then
+  removes the journal. A journal left behind by a crash in between is recognized as merged and ignored, rather than
+  applied twice.
+- If the iFDO file is modified in any other way while its journal holds items, the journal no longer matches the file.
+  Its items were never merged, so append_items(), load() and compact() raise StaleJournalError rather than drop them.
+- append_items() and compact() hold an exclusive lock on the journal, so items appended by another process while the
+  file is compacted are written to a new journal once compaction is done, rather than lost. Locking uses fcntl; where
+  it is not available (Windows), compact() must not run concurrently with append_items().
+
+Appended entries extend the entries of an existing item with the same filename (e.g. new frames of a video), or add a
+new item. The iFDO file may be YAML or JSON, and compressed (see ifdo.compression).
+
+Classes:
+    StaleJournalError: Raised when a journal holds items that were never merged into its modified iFDO file.
+
+Functions:
+    journal_path: Get the path of the journal of an iFDO file.
+    append_items: Append image set items to the journal of an iFDO file.
+    load: Load an iFDO file and apply its journal.
+    compact: Merge the journal into the iFDO file.
+"""
+
+import json
+import os
+import shutil
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO, Any
+
+from ifdo.compression import open_text
+from ifdo.model import encode_value
+from ifdo.models import ImageData, iFDO
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_VERSION = 1
+ITEMS_KEY = "image-set-items"
+COMPACTED_KEY = "compacted-into"
+TAIL_CHUNK_SIZE = 1 << 16  # 64 KiB
+
+
+class StaleJournalError(ValueError):
+    """
+    Raised when a journal holds items that were never merged into its iFDO file, but the file was modified since.
+
+    The items are kept in the journal. Merge them by hand (e.g. by loading the journal records with json) or remove the
+    journal to discard them.
+
+    Attributes:
+        journal (Path): Path to the journal.
+        records (int): Number of item records in the journal.
+    """
+
+    def __init__(self, journal: Path, records: int) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            journal: Path to the journal
+            records: Number of item records in the journal
+        """
+        super().__init__(
+            f"{journal} holds {records} records that were never merged, but its iFDO file was modified since",
+        )
+        self.journal = journal
+        self.records = records
+
+
+def journal_path(path: str | Path) -> Path:
+    """
+    Get the path of the journal of an iFDO file.
+
+    Args:
+        path: Path to the iFDO file.
+
+    Returns:
+        Path to the journal.
+    """
+    path = Path(path)
+    return path.with_name(path.name + JOURNAL_SUFFIX)
+
+
+def _base_header(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {"ifdo-journal": JOURNAL_VERSION, "size": stat.st_size, "mtime-ns": stat.st_mtime_ns}
+
+
+def _is_current(f: IO[bytes], journal: Path, header: dict[str, Any]) -> bool:
+    """
+    Check whether a journal extends the iFDO file with the given header.
+
+    Returns False for a journal that holds nothing to apply and may be started over: empty, torn while its header was
+    written, or left behind by a crash during compact() after the file was replaced.
+
+    Raises:
+        StaleJournalError: If the journal holds items, but the file was modified in another way.
+    """
+    f.seek(0)
+    lines = iter(f)
+    first_line = next(lines, b"")
+    if not first_line.endswith(b"\n"):  # Empty, or torn header: nothing was appended
+        return False
+    if json.loads(first_line) == header:
+        return True
+    records = 0
+    for line in lines:
+        if not line.endswith(b"\n"):  # Torn by a crash mid-write
+            break
+        record = json.loads(line)
+        if record.get(COMPACTED_KEY) == header:  # Already merged into the file
+            return False
+        records += ITEMS_KEY in record
+    if records:
+        raise StaleJournalError(journal, records)
+    return False
+
+
+def _dumps_line(d: dict[str, Any]) -> bytes:
+    return (json.dumps(d, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _fsync_directory(directory: Path) -> None:
+    if not hasattr(os, "O_DIRECTORY"):  # Not supported (e.g. on Windows), where the rename itself is durable
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _locked_journal(journal: Path) -> Iterator[IO[bytes]]:
+    """
+    Open a journal for reading and appending, creating it if needed, and hold an exclusive lock on it.
+    """
+    while True:
+        f = journal.open("a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                current = os.path.samestat(os.fstat(f.fileno()), journal.stat())
+            except FileNotFoundError:
+                current = False
+            if current:
+                yield f
+                return
+        finally:
+            f.close()  # Also releases the lock
+        # Removed by compact() while waiting for the lock: open the new journal
+
+
+def _complete_length(f: IO[bytes]) -> int:
+    """
+    Get the length of the journal up to and including its last newline, i.e. without a torn last line.
+    """
+    end = f.seek(0, os.SEEK_END)
+    position = end
+    while position > 0:
+        start = max(0, position - TAIL_CHUNK_SIZE)
+        f.seek(start)
+        chunk = f.read(position - start)
+        newline = chunk.rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        position = start
+    return 0
+
+
+def _read_journal(path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Read the item records of the journal of an iFDO file, if it exists and extends the current file.
+    """
+    journal = journal_path(path)
+    if not journal.exists():
+        return
+    with journal.open("rb") as f:
+        if not _is_current(f, journal, _base_header(path)):
+            return
+        f.seek(0)
+        lines = iter(f)
+        next(lines)  # The header
+        for line in lines:
+            if not line.endswith(b"\n"):  # Torn by a crash mid-write
+                return
+            record = json.loads(line)
+            if ITEMS_KEY in record:  # Not a compaction record
+                yield record[ITEMS_KEY]
+
+
+def append_items(path: str | Path, items: Mapping[str, list[ImageData]]) -> None:
+    """
+    Append image set items to the journal of an iFDO file, durably.
+
+    Args:
+        path: Path to the iFDO file. It is not modified.
+        items: Mapping of filename to image data entries. Entries extend any existing item with the same filename.
+
+    Raises:
+        FileNotFoundError: If the iFDO file does not exist.
+        StaleJournalError: If the journal holds items that were never merged, but the iFDO file was modified since.
+    """
+    path = Path(path)
+    path.stat()  # Fail before creating a journal for a missing file
+    journal = journal_path(path)
+    record = _dumps_line({ITEMS_KEY: {filename: encode_value(entries) for filename, entries in items.items()}})
+
+    with _locked_journal(journal) as f:
+        created = f.seek(0, os.SEEK_END) == 0
+        header = _base_header(path)  # Under the lock, as compact() may replace the file until then
+        if _is_current(f, journal, header):
+            f.truncate(_complete_length(f))  # Cut off a line torn by a previous crash
+        else:  # New, torn or merged journal: start over
+            f.truncate(0)
+            f.write(_dumps_line(header))
+        f.write(record)
+        f.flush()
+        os.fsync(f.fileno())
+    if created:
+        _fsync_directory(journal.parent)
+
+
+def load(path: str | Path) -> iFDO:
+    """
+    Load an iFDO file and apply its journal.
+
+    Args:
+        path: Path to the iFDO file.
+
+    Returns:
+        The iFDO, including the appended items.
+
+    Raises:
+        StaleJournalError: If the journal holds items that were never merged, but the iFDO file was modified since.
+    """
+    path = Path(path)
+    ifdo = iFDO.load(path)
+    for record in _read_journal(path):
+        for filename, encoded in record.items():
+            entries = [encoded] if isinstance(encoded, dict) else encoded
+            ifdo.image_set_items.setdefault(filename, []).extend(ImageData.from_dict(entry) for entry in entries)
+    return ifdo
+
+
+def _merge(path: Path, journal_file: IO[bytes], compresslevel: int | None) -> None:
+    """
+    Atomically replace an iFDO file with the file and its journal merged, keeping the file's permissions.
+
+    Before the file is replaced, the header of the merged file is recorded in the journal, so that the journal is
+    recognized as merged if a crash leaves it behind.
+    """
+    ifdo = load(path)
+    with open_text(path) as f:
+        is_json = f.read(TAIL_CHUNK_SIZE).lstrip().startswith("{")
+
+    with NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=path.suffix, delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        if is_json:
+            with open_text(tmp_path, "w", compresslevel) as f:
+                json.dump(ifdo.to_dict(), f, ensure_ascii=False, indent=2)
+        else:
+            ifdo.save(tmp_path, compresslevel)
+        with tmp_path.open("rb+") as f:
+            os.fsync(f.fileno())
+        shutil.copymode(path, tmp_path)  # Temporary files are created private (0600)
+        journal_file.truncate(_complete_length(journal_file))  # Cut off a line torn by a previous crash
+        journal_file.write(_dumps_line({COMPACTED_KEY: _base_header(tmp_path)}))  # Renaming keeps size and mtime
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+
+
+def compact(path: str | Path, compresslevel: int | None = None) -> int:
+    """
+    Merge the journal into the iFDO file and remove the journal.
+
+    The merged file is written next to the original and atomically replaces it, with the same permissions. JSON files
+    stay JSON; other files are written as YAML. The journal is locked meanwhile, so concurrent appends are not lost.
+
+    Args:
+        path: Path to the iFDO file.
+        compresslevel: Compression level for compressed files. Defaults to the codec's default.
+
+    Returns:
+        Number of journal records merged.
+
+    Raises:
+        StaleJournalError: If the journal holds items that were never merged, but the iFDO file was modified since.
+    """
+    path = Path(path)
+    journal = journal_path(path)
+    if not journal.exists():
+        return 0
+    with _locked_journal(journal) as f:
+        records = sum(1 for _ in _read_journal(path))
+        if records:
+            _merge(path, f, compresslevel)
+        journal.unlink(missing_ok=True)  # Appends waiting for the lock then start a new journal
+    return records
@@ -1,11 +1,176 @@
-from collections.abc import Callable
-from dataclasses import MISSING, fields
+import json
+import weakref
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import MISSING, Field, fields
+from dataclasses import dataclass as std_dataclass
+from dataclasses import field as std_field
 from datetime import datetime
 from enum import Enum
-from types import UnionType
-from typing import Any, TypeVar, Union, get_args, get_origin
+from hashlib import sha256
+from operator import itemgetter
+from types import MappingProxyType, UnionType
+from typing import Any, ClassVar, NamedTuple, Protocol, TypeVar, Union, get_args, get_origin
 
+from pydantic import ConfigDict
 from pydantic.dataclasses import dataclass
+from pydantic.fields import FieldInfo
+
+from ifdo.profiling import Profiler, current_profiler
+
+
+class InvalidEnumValueError(ValueError):
+    """
+    Raised when a value does not match any member of an enumeration, even after normalization.
+
+    Attributes:
+        enum_name (str): Name of the enumeration class.
+        value (Any): The value that was rejected.
+    """
+
+    def __init__(self, enum_class: type[Enum], value: object) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            enum_class: Enumeration class
+            value: The value that was rejected
+        """
+        super().__init__(f"{value!r} is not a valid {enum_class.__name__}")
+        self.enum_name = enum_class.__name__
+        self.value = value
+
+
+@std_dataclass
+class EnumReport:
+    """
+    Report of enumeration values that were normalized or rejected while parsing.
+
+    Attributes:
+        normalized (Counter[tuple[str, str, str]]): Counts of (enum name, raw value, member value) for values that only
+            matched a member after normalization.
+        invalid (Counter[tuple[str, str, str]]): Counts of (enum name, key, raw value) for values that matched no
+            member. The raw values are kept in the extras of the object being parsed.
+    """
+
+    normalized: Counter[tuple[str, str, str]] = std_field(default_factory=Counter)
+    invalid: Counter[tuple[str, str, str]] = std_field(default_factory=Counter)
+
+
+_current_enum_report: ContextVar[EnumReport | None] = ContextVar("ifdo_enum_report", default=None)
+_strict_enums: ContextVar[bool] = ContextVar("ifdo_strict_enums", default=False)
+
+
+@contextmanager
+def enum_report() -> Iterator[EnumReport]:
+    """
+    Report the enumeration values that are normalized or invalid while parsing in the current context.
+
+    Enumeration values are parsed leniently (unless within strict_enums): a value that matches no member does not
+    abort parsing, the field is left unset and the raw value is kept in the extras of the object, so it is written
+    back on save.
+
+    Yields:
+        The report, filled in as the block runs.
+
+    Example:
+        with enum_report() as report:
+            ifdo = iFDO.load("path/to/ifdo.yaml")
+        print(report.normalized, report.invalid)
+    """
+    report = EnumReport()
+    token = _current_enum_report.set(report)
+    try:
+        yield report
+    finally:
+        _current_enum_report.reset(token)
+
+
+@contextmanager
+def strict_enums() -> Iterator[None]:
+    """
+    Parse enumeration values strictly for the current context: a value that matches no member raises a ValueError.
+
+    Example:
+        with strict_enums():
+            ifdo = iFDO.from_dict(d)
+    """
+    token = _strict_enums.set(True)
+    try:
+        yield
+    finally:
+        _strict_enums.reset(token)
+
+
+def normalize_enum_value(value: str) -> str:
+    """
+    Normalize an enumeration value for lenient matching: case, hyphens, underscores and whitespace are ignored.
+
+    Args:
+        value: Value to normalize
+
+    Returns:
+        Normalized value
+    """
+    return " ".join(value.replace("-", " ").replace("_", " ").split()).casefold()
+
+
+_enum_tables: dict[type[Enum], tuple[dict[Any, Enum], dict[str, Enum]]] = {}
+
+
+def enum_tables(enum_class: type[Enum]) -> tuple[dict[Any, Enum], dict[str, Enum]]:
+    """
+    Get the lookup tables of an enumeration, building them on first use.
+
+    Args:
+        enum_class: Enumeration class
+
+    Returns:
+        Tables mapping exact member values, and normalized member values and names, to members
+    """
+    tables = _enum_tables.get(enum_class)
+    if tables is None:
+        exact: dict[Any, Enum] = {member.value: member for member in enum_class}
+        normalized: dict[str, Enum] = {}
+        for member in enum_class:
+            normalized.setdefault(normalize_enum_value(member.name), member)
+        for member in enum_class:  # Values take precedence over names
+            if isinstance(member.value, str):
+                normalized[normalize_enum_value(member.value)] = member
+        tables = _enum_tables[enum_class] = (exact, normalized)
+    return tables
+
+
+def parse_enum(enum_class: type[Enum], value: object) -> Enum:
+    """
+    Parse an enumeration value by table lookup, falling back to normalized matching.
+
+    Args:
+        enum_class: Enumeration class
+        value: Value to parse
+
+    Returns:
+        Enumeration member
+
+    Raises:
+        InvalidEnumValueError: If the value matches no member.
+    """
+    exact, normalized = enum_tables(enum_class)
+    try:
+        return exact[value]
+    except (KeyError, TypeError):  # Not a member value, or unhashable
+        pass
+
+    member = normalized.get(normalize_enum_value(value)) if isinstance(value, str) else None
+    if member is None or not isinstance(value, str):
+        raise InvalidEnumValueError(enum_class, value)
+
+    report = _current_enum_report.get()
+    if report is not None:
+        report.normalized[(enum_class.__name__, value, member.value)] += 1
+    return member
 
 
 def parse_value(field_class, value: Any) -> Any:
@@ -22,9 +187,13 @@ def parse_value(field_class, value: Any) -> Any:
     if hasattr(field_class, "from_dict"):
         return field_class.from_dict(value)
     if issubclass(field_class, Enum):
-        return field_class(value)
+        return parse_enum(field_class, value)
     if issubclass(field_class, datetime):
-        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+        profiler = current_profiler()
+        if profiler is None:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+        with profiler.stage("strptime"):
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
     return value
 
 
@@ -61,7 +230,7 @@ def parse_field(field_type, value: Any) -> Any:
     if field_origin is dict:
         inner_key_type, inner_value_type = field_args
         return {parse_field(inner_key_type, k): parse_field(inner_value_type, v) for k, v in value.items()}
-    if field_origin is Union:
+    if field_origin is Union or field_origin is UnionType:
         for inner_type in field_args:
             try:
                 return parse_field(inner_type, value)
@@ -96,15 +265,556 @@ def encode_value(value: Any) -> Any:
     return value
 
 
+def any_dirty(value: object) -> bool:
+    """
+    Check whether a value contains a model object that has been modified.
+
+    Args:
+        value: Value to check
+
+    Returns:
+        True if the value is, or contains, a dirty model object
+    """
+    if hasattr(value, "is_dirty"):
+        return bool(value.is_dirty())
+    if isinstance(value, list | tuple):
+        return any(any_dirty(v) for v in value)
+    if isinstance(value, dict):
+        return any(any_dirty(v) for v in value.values())
+    return False
+
+
+def clear_dirty(value: object) -> None:
+    """
+    Clear the dirty flag of every model object in a value.
+
+    Args:
+        value: Value to mark as clean
+    """
+    if hasattr(value, "mark_clean"):
+        value.mark_clean()
+    elif isinstance(value, list | tuple):
+        for v in value:
+            clear_dirty(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            clear_dirty(v)
+
+
+E = TypeVar("E", bound="ExtrasDict")
+
+
+class ExtrasDict(dict[str, Any]):
+    """
+    Extension fields of a model object: a dict that marks its owner as modified when it is changed.
+
+    Only changes to the dict itself are tracked, not changes inside its (raw) values. Copies and pickles are plain
+    dicts.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: object, *args: object, **kwargs: object) -> None:
+        """
+        Initialize the dict.
+
+        Args:
+            owner: Model object the extension fields belong to
+            *args: Initial items, as for dict
+            **kwargs: Initial items, as for dict
+        """
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self._owner = weakref.ref(owner)
+
+    def _modified(self) -> None:
+        owner = self._owner()
+        if owner is not None:
+            object.__setattr__(owner, "_ifdo_dirty", True)
+
+    def __setitem__(self, key: str, value: object) -> None:
+        super().__setitem__(key, value)
+        self._modified()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._modified()
+
+    def __ior__(self: E, other: object) -> E:  # type: ignore[override,misc]  # noqa: PYI034 - typing.Self needs 3.11
+        self.update(other)
+        return self
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[dict[str, Any]]]:
+        return dict, (dict(self),)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        if self:
+            super().clear()
+            self._modified()
+
+    def pop(self, key: str, *default: object) -> object:  # type: ignore[override]
+        """Remove a key and return its value, or the default if given and the key is missing."""
+        if key in self:
+            self._modified()
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, object]:
+        """Remove and return the last item."""
+        item = super().popitem()
+        self._modified()
+        return item
+
+    def setdefault(self, key: str, default: object = None) -> object:  # type: ignore[override]
+        """Get the value of a key, inserting the default if the key is missing."""
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args: object, **kwargs: object) -> None:  # type: ignore[override]
+        """Update the dict from a mapping or iterable of pairs, and keyword arguments."""
+        super().update(*args, **kwargs)  # type: ignore[arg-type]
+        self._modified()
+
+
+def default_getter(field: Field[Any]) -> Callable[[], Any] | None:
+    """
+    Get a function that returns the default value of a dataclass field.
+
+    Args:
+        field: Dataclass field
+
+    Returns:
+        Function returning the default value, or None if the field has no default
+    """
+    default = field.default
+    if isinstance(default, FieldInfo):  # Declared with pydantic.Field(...)
+        if default.default_factory is not None:
+            return default.default_factory  # type: ignore[return-value,no-any-return]
+        default = MISSING if default.is_required() else default.default
+    if default is not MISSING:
+        return lambda: default
+    if field.default_factory is not MISSING:
+        return field.default_factory
+    return None
+
+
+class PickleLayout(NamedTuple):
+    """
+    Precomputed information used to pickle objects of a model class compactly.
+
+    Attributes:
+        names: Field names, in field order
+        get_values: Function returning the values of all fields from an object's __dict__, in field order
+        codes: Mapping of enumeration member to its index, by field index of the enumeration fields
+        members: Enumeration members, by field index of the enumeration fields
+        empty: Dict with every field set to None
+    """
+
+    names: tuple[str, ...]
+    get_values: Callable[[dict[str, Any]], tuple[Any, ...]]
+    codes: dict[int, dict[Enum, int]]
+    members: dict[int, tuple[Enum, ...]]
+    empty: dict[str, None]
+
+
+class FieldSpec(NamedTuple):
+    """
+    Precomputed information used to parse a dict key into a field.
+
+    Attributes:
+        name: Field name
+        type: Type annotation of the field
+        default: Function returning the default value, or None if the field has no default
+        alias: Whether the key is an alias rather than the field's canonical key
+    """
+
+    name: str
+    type: Any
+    default: Callable[[], Any] | None
+    alias: bool
+
+
 T = TypeVar("T")
 
 
-def model(case_func: Callable | None = None) -> Callable[[type[T]], type[T]]:
+def field_enum(field_type: object) -> type[Enum] | None:
+    """
+    Get the enumeration a field holds, directly or as Optional.
+
+    Args:
+        field_type: Type annotation of the field
+
+    Returns:
+        Enumeration class, or None if the field does not hold a single enumeration
+    """
+    if get_origin(field_type) is Union or get_origin(field_type) is UnionType:
+        field_args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(field_args) != 1:
+            return None
+        field_type = field_args[0]
+    return field_type if isinstance(field_type, type) and issubclass(field_type, Enum) else None
+
+
+def restore_model(cls: type[T], mask: int, values: tuple[Any, ...], dirty: bool, extras: dict[str, Any] | None) -> T:
+    """
+    Recreate a model object from its compact pickled form, as produced by its __reduce__ method.
+
+    The values were validated when the object was created, so they are set directly without validation.
+
+    Args:
+        cls: Model class
+        mask: Bit mask of the fields that are set (not None), by field index
+        values: Values of the set fields in field order, with enumeration members replaced by their index
+        dirty: Whether the object was modified
+        extras: Extension fields, or None
+
+    Returns:
+        Object of the class
+    """
+    layout = cls.pickle_layout  # type: ignore[attr-defined]
+    obj = object.__new__(cls)
+    d = obj.__dict__
+    d.update(layout.empty)
+    for value in values:  # One value per set bit of the mask, lowest first
+        bit = mask & -mask
+        mask ^= bit
+        index = bit.bit_length() - 1
+        members = layout.members.get(index)
+        d[layout.names[index]] = members[value] if members is not None and type(value) is int else value
+    if not dirty:
+        d["_ifdo_dirty"] = False
+    if extras is not None:
+        d["_ifdo_extras"] = extras
+    return obj
+
+
+class ModelSpec(NamedTuple):
+    """
+    Precomputed information about the fields of a model class, used by the methods that model() adds.
+
+    Attributes:
+        field_names: Names of the fields
+        field_key_items: Pairs of field name and dict key, in field order
+        key_specs: Mapping of dict key (including aliases) to field information
+        base_setattr: __setattr__ of the dataclass, without change tracking
+    """
+
+    field_names: frozenset[str]
+    field_key_items: tuple[tuple[str, str], ...]
+    key_specs: dict[str, FieldSpec]
+    base_setattr: Callable[[Any, str, Any], None]
+
+
+class ModelObject(Protocol):
+    """
+    Object of a model class, as seen by the methods that model() adds.
+    """
+
+    _ifdo_spec: ClassVar[ModelSpec]
+    _ifdo_dirty: bool
+    pickle_layout: ClassVar[PickleLayout]
+
+    def to_dict(self) -> dict[str, Any]: ...  # noqa: D102
+
+
+M = TypeVar("M", bound=ModelObject)
+
+
+_INVALID = object()  # Marks an invalid enumeration value that is kept in the extras rather than raised
+
+
+def _key_tables(
+    cls: type[Any],
+    case_func: Callable[[str], str] | None,
+    aliases: Mapping[str, str] | None,
+    keys: Mapping[str, str] | None = None,
+) -> tuple[dict[str, str], dict[str, FieldSpec]]:
+    """
+    Compute the mapping of field name to dict key, and of dict key (including aliases) to field information.
+    """
+    keys = keys or {}
+    field_keys = {
+        field.name: keys.get(field.name) or (field.name if case_func is None else case_func(field.name))
+        for field in fields(cls)
+    }
+    key_specs = {
+        field_keys[field.name]: FieldSpec(field.name, field.type, default_getter(field), alias=False)
+        for field in fields(cls)
+    }
+    for alias, name in (aliases or {}).items():
+        if name in field_keys and alias not in key_specs:
+            key_specs[alias] = key_specs[field_keys[name]]._replace(alias=True)
+    return field_keys, key_specs
+
+
+def _pickle_layout(cls: type[Any]) -> PickleLayout:
+    """
+    Compute the pickle layout of a model class.
+    """
+    names = tuple(field.name for field in fields(cls))
+    enums = {
+        index: tuple(enum_class)
+        for index, field in enumerate(fields(cls))
+        if (enum_class := field_enum(field.type)) is not None
+    }
+    return PickleLayout(
+        names,
+        itemgetter(*names) if len(names) > 1 else lambda d: (d[names[0]],),
+        {index: {member: code for code, member in enumerate(members)} for index, members in enums.items()},
+        enums,
+        dict.fromkeys(names),
+    )
+
+
+def _model_setattr(self: ModelObject, name: str, value: object) -> None:
+    # Track assignments to fields so that modified objects can be found later
+    spec = self._ifdo_spec
+    spec.base_setattr(self, name, value)
+    if name in spec.field_names:
+        object.__setattr__(self, "_ifdo_dirty", True)
+
+
+def _model_to_dict(self: ModelObject) -> dict[str, Any]:
+    """
+    Convert the object to a dict object.
+
+    Returns:
+        dict object
+    """
+    profiler = current_profiler()
+    if profiler is None:
+        return _encode_model(self)
+    with profiler.stage("to_dict"):
+        return _encode_model(self)
+
+
+def _encode_model(self: ModelObject) -> dict[str, Any]:
+    d = {}
+    for name, key in self._ifdo_spec.field_key_items:
+        value = getattr(self, name)
+        if value is not None:
+            d[key] = encode_value(value)
+
+    extras = self.__dict__.get("_ifdo_extras")
+    if extras:  # Write back unrecognized keys as they were read
+        for key, value in extras.items():
+            d.setdefault(key, value)
+    return d
+
+
+def _model_from_dict(cls: type[T], d: Mapping[str, Any]) -> T:  # noqa: D417 - documented as a class method
+    """
+    Convert a dict object to an object of this class.
+
+    Args:
+        d: dict object
+
+    Returns:
+        Object of this class
+    """
+    profiler = current_profiler()
+    if profiler is None:
+        return _decode_model(cls, d, None)
+    profiler.count_construction(cls.__name__)
+    with profiler.stage("from_dict"):
+        return _decode_model(cls, d, profiler)
+
+
+def _parse_error(key: str, value: object, error: ValueError) -> object:
+    """
+    Handle a value that could not be parsed: raise, or return _INVALID for an invalid enumeration value.
+    """
+    if not isinstance(error, InvalidEnumValueError) or _strict_enums.get():
+        raise ValueError(f"Could not parse value {value} for field {key}: {error}") from error
+    report = _current_enum_report.get()
+    if report is not None:
+        report.invalid[(error.enum_name, key, value if isinstance(value, str) else repr(value))] += 1
+    return _INVALID
+
+
+def _decode_model(cls: type[T], d: Mapping[str, Any], profiler: Profiler | None) -> T:
+    key_specs = cls._ifdo_spec.key_specs  # type: ignore[attr-defined]
+    kwargs = {}
+    extras = None
+    for key, value in d.items():
+        spec = key_specs.get(key)
+        if spec is not None and spec.alias and spec.name in kwargs:  # The canonical key takes precedence over aliases
+            continue
+        if spec is not None:
+            try:
+                parsed_value = parse_field(spec.type, value)
+            except ValueError as e:
+                parsed_value = _parse_error(key, value, e)
+            if parsed_value is None and spec.default is not None:  # Use default value/factory if parsed is None
+                parsed_value = spec.default()
+            if parsed_value is not _INVALID:
+                kwargs[spec.name] = parsed_value
+                continue
+        # Not a field of this class, or an invalid value: keep the raw value so it is written back
+        if extras is None:
+            extras = {}
+        extras[key] = value
+
+    # Create the object from the kwargs, unmodified since it mirrors the dict
+    if profiler is None:
+        obj = cls(**kwargs)
+    else:
+        with profiler.stage("construct"):
+            obj = cls(**kwargs)
+    object.__setattr__(obj, "_ifdo_dirty", False)
+    if extras is not None:
+        object.__setattr__(obj, "_ifdo_extras", extras)
+    return obj
+
+
+def _model_extras(self: ModelObject) -> dict[str, Any]:
+    """
+    Extension fields: keys that are not fields of this class, with their raw (unparsed) values.
+
+    They are read by from_dict and written back by to_dict. The dict is only allocated for objects that have
+    extension fields or whose extras are accessed. Adding, replacing or removing keys marks the object as
+    modified; changes inside the values are not tracked.
+
+    Returns:
+        Mutable dict of key to raw value
+    """
+    extras = self.__dict__.get("_ifdo_extras")
+    if type(extras) is not ExtrasDict:  # Stored as a plain dict until first accessed
+        extras = ExtrasDict(self, extras or ())
+        object.__setattr__(self, "_ifdo_extras", extras)
+    return extras
+
+
+def _model_unknown_keys(self: ModelObject) -> tuple[str, ...]:
+    """
+    Get the keys of the extension fields of this object.
+
+    Returns:
+        Unknown keys, in dict order
+    """
+    return tuple(self.__dict__.get("_ifdo_extras", ()))
+
+
+def _model_fingerprint(self: ModelObject) -> str:
+    """
+    Compute a stable content fingerprint from the canonical encoded form of the object.
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _model_is_dirty(self: ModelObject) -> bool:
+    """
+    Check whether the object or any nested object was modified since it was loaded or last marked clean.
+
+    Objects constructed directly (rather than via from_dict) are considered dirty.
+
+    Returns:
+        True if modified
+    """
+    if self._ifdo_dirty:
+        return True
+    return any(any_dirty(getattr(self, name)) for name in self._ifdo_spec.field_names)
+
+
+def _model_mark_clean(self: ModelObject) -> None:
+    """
+    Mark the object and all nested objects as unmodified.
+    """
+    object.__setattr__(self, "_ifdo_dirty", False)
+    for name in self._ifdo_spec.field_names:
+        clear_dirty(getattr(self, name))
+
+
+def _model_reduce(self: ModelObject) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+    # Compact pickle protocol: only set fields are stored, behind a bit mask, and enumeration members as their index
+    layout = self.pickle_layout
+    d = self.__dict__
+    values = list(layout.get_values(d))
+    for index, codes in layout.codes.items():
+        value = values[index]
+        if value is not None:
+            values[index] = codes.get(value, value)
+    mask = 0
+    present = []
+    for index, value in enumerate(values):
+        if value is not None:
+            mask |= 1 << index
+            present.append(value)
+    dirty = d.get("_ifdo_dirty", True)
+    return restore_model, (type(self), mask, tuple(present), dirty, d.get("_ifdo_extras") or None)
+
+
+def _model_copy(self: M) -> M:
+    obj = object.__new__(type(self))
+    obj.__dict__.update(self.__dict__)
+    extras = self.__dict__.get("_ifdo_extras")
+    if extras is not None:  # Do not share the mutable extras dict between copies
+        object.__setattr__(obj, "_ifdo_extras", dict(extras))
+    return obj
+
+
+def _model_replace(self: M, **changes: object) -> M:  # noqa: D417 - documented as a method
+    """
+    Create a shallow copy of the object with some fields replaced.
+
+    Nested objects and unchanged values are shared with the original, so this is cheap regardless of the
+    object's size. The copy is marked as modified if any field is replaced.
+
+    Args:
+        **changes: Field names and their new values.
+
+    Returns:
+        Object of this class
+
+    Raises:
+        TypeError: If a name is not a field of this class.
+    """
+    unknown = changes.keys() - self._ifdo_spec.field_names
+    if unknown:
+        raise TypeError(f"{type(self).__name__} has no fields {', '.join(sorted(unknown))}")
+    obj = _model_copy(self)
+    for name, value in changes.items():
+        setattr(obj, name, value)
+    return obj
+
+
+_MODEL_METHODS = {
+    "__setattr__": _model_setattr,
+    "to_dict": _model_to_dict,
+    "from_dict": classmethod(_model_from_dict),
+    "extras": property(_model_extras),
+    "unknown_keys": _model_unknown_keys,
+    "fingerprint": _model_fingerprint,
+    "is_dirty": _model_is_dirty,
+    "mark_clean": _model_mark_clean,
+    "__copy__": _model_copy,
+    "replace": _model_replace,
+    "__reduce__": _model_reduce,
+}
+
+
+def model(
+    case_func: Callable[[str], str] | None = None,
+    aliases: Mapping[str, str] | None = None,
+    keys: Mapping[str, str] | None = None,
+) -> Callable[[type[T]], type[T]]:
     """
     Decorator that creates a dataclass with methods to convert it to/from a dict object.
 
+    The mapping between field names and dict keys is computed once per class and exposed in both directions as the
+    field_keys (field name -> key) and key_fields (key -> field name, including aliases) class attributes. Methods that
+    the class defines itself (e.g. a mark_clean that skips shared objects) are kept.
+
     Args:
         case_func: Optional function to transform field names (e.g. stringcase.spinalcase). Default is None.
+        aliases: Optional mapping of additional dict keys to field names, e.g. legacy spellings of keys. Aliases are
+            accepted by from_dict for classes that have the field; to_dict always writes the canonical key.
+        keys: Optional mapping of field names to canonical dict keys, for keys that case_func does not produce (e.g.
+            keys that a schema spells differently from the field name).
 
     Returns:
         Decorator function that converts a class into a dataclass with to_dict and from_dict methods.
@@ -112,72 +822,22 @@ def model(case_func: Callable | None = None) -> Callable[[type[T]], type[T]]:
 
     def decorator(cls: type[T]) -> type[T]:
         # Turn the class into a dataclass
-        cls = dataclass(cls)
-
-        # Define the to_dict method
-        def to_dict(self) -> dict:
-            """
-            Convert the object to a dict object.
-
-            Returns:
-                dict object
-            """
-            d = dict()
-            for field in fields(self):
-                name = field.name
-                if case_func is not None:
-                    name = case_func(name)
-                value = getattr(self, field.name)
-                if value is None:
-                    continue
-
-                encoded_value = encode_value(value)
-
-                d[name] = encoded_value
-            return d
-
-        # Define the from_dict method
-        def from_dict(cls, d: dict):
-            """
-            Convert a dict object to an object of this class.
-
-            Args:
-                d: dict object
-
-            Returns:
-                Object of this class
-            """
-            kwargs = {}
-            for field in fields(cls):
-                field_key = field.name
-                if case_func is not None:  # Remap by case function
-                    field_key = case_func(field_key)
-
-                if field_key in d:
-                    value = d[field_key]
-
-                    try:
-                        parsed_value = parse_field(field.type, value)
-                    except ValueError as e:
-                        raise ValueError(f"Could not parse value {value} for field {field_key}: {e}")
-
-                    if parsed_value is None:  # Use default value/factory if parsed value is None
-                        if field.default != MISSING:
-                            parsed_value = field.default
-                        elif field.default_factory != MISSING:
-                            parsed_value = field.default_factory()
-
-                    # Assign the parsed value to the kwargs
-                    kwargs[field.name] = parsed_value
-
-            # Create the object from the kwargs
-            return cls(**kwargs)
-
-        # Add the new methods to the class
-        cls.to_dict = to_dict
-        cls.from_dict = classmethod(from_dict)
-
-        # Return the modified class
+        cls = dataclass(cls, config=ConfigDict(defer_build=True))
+
+        # Precompute the key tables and the pickle layout
+        field_keys, key_specs = _key_tables(cls, case_func, aliases, keys)
+        attributes = {
+            "_ifdo_spec": ModelSpec(frozenset(field_keys), tuple(field_keys.items()), key_specs, cls.__setattr__),
+            "_ifdo_dirty": True,  # Class-level default, so new objects are dirty without per-instance cost
+            "field_keys": MappingProxyType(field_keys),
+            "key_fields": MappingProxyType({key: spec.name for key, spec in key_specs.items()}),
+            "pickle_layout": _pickle_layout(cls),
+        }
+
+        # Add the attributes and methods to the class
+        for name, value in {**attributes, **_MODEL_METHODS}.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, value)
         return cls
 
     return decorator
@@ -13,7 +13,7 @@ Imports:
     pathlib: Offers classes representing filesystem paths with semantics appropriate for different operating systems.
     pydantic: Provides data validation and settings management using Python type annotations.
     stringcase: Offers string case conversion utilities.
-    yaml: Implements YAML parser and emitter for Python.
+    yaml: Implements YAML parser and emitter for Python (imported on first load/save).
     ifdo.model: Contains the base model implementation for iFDO classes.
 
 Classes:
@@ -46,18 +46,42 @@ Classes:
     iFDO: Implements the Image FAIR Digital Object specification.
 """
 
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from copy import copy
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, field_validator
 from stringcase import spinalcase
-from yaml import safe_dump, safe_load
 
-from ifdo.model import model
+from ifdo.compression import open_text
+from ifdo.model import model, strict_enums
+from ifdo.profiling import current_profiler
 
-ifdo_model = model(case_func=spinalcase)  # Use spinal case for all field names
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import pandas as pd
+    import polars as pl
+
+    from ifdo.cache import ParseCache
+    from ifdo.validation import SchemaError
+
+# Keys that the iFDO schema spells differently from the spinal case of the field name, mapped from field names
+SCHEMA_KEYS = {
+    "image_area_square_meter": "image-area-square-meters",
+    "image_mpeg7_colorstatistics": "image-mpeg7-colorstatistic",
+}
+
+# Alternative spellings of keys found in iFDO files (the spinal case of the field names, as written by earlier
+# versions of this package), mapped to field names
+KEY_ALIASES = {spinalcase(name): name for name in SCHEMA_KEYS}
+
+ifdo_model = model(case_func=spinalcase, aliases=KEY_ALIASES, keys=SCHEMA_KEYS)  # Use spinal case for all field names
 
 
 class ImageAcquisition(str, Enum):
@@ -696,7 +720,8 @@ class ImageData:
         image_overlap_fraction (float | None): The average overlap of two consecutive images.
         image_datetime_format (str | None): Format used for the image_datetime field.
         image_camera_pose (ImageCameraPose | None): Camera pose information.
-        image_camera_housing_viewport (ImageCameraHousingViewport | None): Information about the camera housing viewport.
+        image_camera_housing_viewport (ImageCameraHousingViewport | None): Information about the camera housing
+            viewport.
         image_flatport_parameters (ImageFlatportParameters | None): Parameters for flat port camera housings.
         image_domeport_parameters (ImageDomeportParameters | None): Parameters for dome port camera housings.
         image_camera_calibration_model (ImageCameraCalibrationModel | None): Camera calibration model information.
@@ -844,7 +869,8 @@ class ImageSetHeader:
         image_overlap_fraction (float | None): The average overlap of two consecutive images.
         image_datetime_format (str | None): Format used for the image_datetime field.
         image_camera_pose (ImageCameraPose | None): Camera pose information.
-        image_camera_housing_viewport (ImageCameraHousingViewport | None): Information about the camera housing viewport.
+        image_camera_housing_viewport (ImageCameraHousingViewport | None): Information about the camera housing
+            viewport.
         image_flatport_parameters (ImageFlatportParameters | None): Parameters for flat port camera housings.
         image_domeport_parameters (ImageDomeportParameters | None): Parameters for dome port camera housings.
         image_camera_calibration_model (ImageCameraCalibrationModel | None): Camera calibration model information.
@@ -948,6 +974,15 @@ class ImageSetHeader:
     image_annotations: list[ImageAnnotation] | None = None
 
 
+def _model_objects(ifdo: "iFDO") -> Iterator[Any]:
+    """
+    Iterate over the header and the image data entries of an iFDO.
+    """
+    yield ifdo.image_set_header
+    for image_data_list in ifdo.image_set_items.values():
+        yield from image_data_list
+
+
 @ifdo_model
 class iFDO:  # noqa: N801
     """
@@ -964,6 +999,16 @@ class iFDO:  # noqa: N801
     Methods:
         load(path: str | Path) -> 'iFDO': Class method to load an iFDO object from a YAML file.
         save(path: str | Path) -> None: Instance method to save the iFDO object to a YAML file.
+        aload(path: str | Path) -> 'iFDO': Coroutine class method to load an iFDO without blocking the event loop.
+        asave(path: str | Path) -> None: Coroutine method to save the iFDO without blocking the event loop.
+        changed_items() -> list[str]: Instance method to list the image set items modified since load or save.
+        mark_clean() -> None: Instance method to mark the iFDO and the objects it does not share as unmodified.
+        validate_schema() -> list[SchemaError]: Instance method to validate the iFDO against the iFDO JSON schema.
+        clone() -> 'iFDO': Instance method to create a copy-on-write clone of the iFDO.
+        subset(filenames: Iterable[str]) -> 'iFDO': Instance method to create a clone with only some items.
+        filter(predicate: Callable) -> 'iFDO': Instance method to create a clone with the items matching a predicate.
+        update_item(filename: str, index: int, **changes) -> ImageData: Instance method to replace fields of an entry.
+        update_header(**changes) -> ImageSetHeader: Instance method to replace fields of the image set header.
 
     Example:
         # Load an existing iFDO from a YAML file
@@ -981,28 +1026,303 @@ class iFDO:  # noqa: N801
     image_set_items: dict[str, list[ImageData]]
 
     @classmethod
-    def load(cls, path: str | Path) -> "iFDO":
+    def load(cls, path: str | Path, cache: "ParseCache | None" = None, *, strict: bool = False) -> "iFDO":
         """
         Load an iFDO from a YAML file.
 
+        Compressed files (gzip, bzip2, xz or zstandard) are decompressed transparently. By default, an enumeration value
+        that matches no member does not abort the load: the field is left unset and the raw value is kept in the
+        extras of the object, so it is written back on save (see ifdo.model.enum_report to list such values).
+
         Args:
             path: Path to the YAML file.
+            cache: Optional parse cache. If the file is unchanged since it was cached, parsing is skipped.
+            strict: Whether to raise on enumeration values that match no member. Strict loads do not read the cache,
+                which may hold a lenient parse.
 
         Returns:
             The loaded iFDO object.
+
+        Raises:
+            ValueError: If a value cannot be parsed, or (if strict) an enumeration value matches no member.
         """
         path = Path(path)  # Ensure Path object
-        with path.open() as f:
-            d = safe_load(f)
-        return cls.from_dict(d)
 
-    def save(self, path: str | Path) -> None:
+        key = None
+        if cache is not None:
+            key = cache.key(path)
+            cached = None if strict else cache.get(key)
+            if isinstance(cached, cls):
+                return cached
+
+        from yaml import safe_load  # Deferred to keep module import cheap
+
+        profiler = current_profiler()
+        if profiler is None:
+            with open_text(path) as f:
+                d = safe_load(f)
+        else:
+            with profiler.stage("yaml_load"), open_text(path) as f:
+                d = safe_load(f)
+            profiler.report.bytes_read += path.stat().st_size
+        with strict_enums() if strict else nullcontext():
+            ifdo: iFDO = cls.from_dict(d)
+        if profiler is not None:
+            profiler.report.items_loaded += len(ifdo.image_set_items)
+
+        if cache is not None and key is not None:  # Both set together; checked for the type checker
+            cache.put(key, ifdo)
+        return ifdo
+
+    def save(self, path: str | Path, compresslevel: int | None = None) -> None:
         """
         Save to a YAML file.
 
+        The file is compressed if its suffix is .gz, .bz2, .xz or .zst.
+
         Args:
             path: Path to the YAML file.
+            compresslevel: Compression level for compressed files. Defaults to the codec's default.
         """
+        from yaml import safe_dump  # Deferred to keep module import cheap
+
         path = Path(path)  # Ensure Path object
-        with path.open("w") as f:
-            safe_dump(self.to_dict(), f, sort_keys=False)
+        d = self.to_dict()
+
+        profiler = current_profiler()
+        if profiler is None:
+            with open_text(path, "w", compresslevel) as f:
+                safe_dump(d, f, sort_keys=False)
+        else:
+            with profiler.stage("yaml_dump"), open_text(path, "w", compresslevel) as f:
+                safe_dump(d, f, sort_keys=False)
+            profiler.report.bytes_written += path.stat().st_size
+            profiler.report.items_saved += len(self.image_set_items)
+        self.mark_clean()  # The file now reflects the current state
+
+    @classmethod
+    async def aload(cls, path: str | Path, executor: "Executor | None" = None) -> "iFDO":
+        """
+        Load an iFDO from a YAML file without blocking the event loop.
+
+        Args:
+            path: Path to the YAML file.
+            executor: Executor to run blocking work in. Defaults to the event loop's default executor.
+
+        Returns:
+            The loaded iFDO object.
+        """
+        from ifdo.aio import aload  # Avoid a circular import
+
+        return await aload(path, executor=executor)
+
+    async def asave(
+        self,
+        path: str | Path,
+        executor: "Executor | None" = None,
+        compresslevel: int | None = None,
+    ) -> None:
+        """
+        Save to a YAML file without blocking the event loop.
+
+        Args:
+            path: Path to the YAML file.
+            executor: Executor to run blocking work in. Defaults to the event loop's default executor.
+            compresslevel: Compression level for compressed files. Defaults to the codec's default.
+        """
+        from ifdo.aio import asave  # Avoid a circular import
+
+        await asave(self, path, executor=executor, compresslevel=compresslevel)
+
+    def to_pandas(self, *, inherit_header: bool = False) -> "pd.DataFrame":
+        """
+        Convert to a pandas DataFrame with one row per image data entry and nested fields in dotted columns.
+
+        Args:
+            inherit_header: Whether to fill fields that an entry does not set from the first entry of its item (for
+                video frames) and from the image set header.
+
+        Returns:
+            pandas.DataFrame
+        """
+        from ifdo.dataframe import to_pandas  # Avoid a circular import
+
+        return to_pandas(self, inherit_header=inherit_header)
+
+    def to_polars(self, *, inherit_header: bool = False) -> "pl.DataFrame":
+        """
+        Convert to a Polars DataFrame with one row per image data entry and nested fields in dotted columns.
+
+        Args:
+            inherit_header: Whether to fill fields that an entry does not set from the first entry of its item (for
+                video frames) and from the image set header.
+
+        Returns:
+            polars.DataFrame
+        """
+        from ifdo.dataframe import to_polars  # Avoid a circular import
+
+        return to_polars(self, inherit_header=inherit_header)
+
+    @classmethod
+    def from_dataframe(cls, df: "pd.DataFrame | pl.DataFrame", image_set_header: ImageSetHeader) -> "iFDO":
+        """
+        Create an iFDO from a pandas or Polars DataFrame as produced by to_pandas/to_polars.
+
+        Args:
+            df: pandas.DataFrame or polars.DataFrame.
+            image_set_header: Image set header of the iFDO.
+
+        Returns:
+            The iFDO.
+        """
+        from ifdo.dataframe import from_dataframe  # Avoid a circular import
+
+        return from_dataframe(df, image_set_header)
+
+    def changed_items(self) -> list[str]:
+        """
+        List the image set items that were added or modified since the iFDO was loaded or last saved.
+
+        Returns:
+            Filenames of the changed items, in image set order.
+        """
+        return [
+            filename
+            for filename, image_data_list in self.image_set_items.items()
+            if any(image_data.is_dirty() for image_data in image_data_list)
+        ]
+
+    def validate_schema(self, chunk_size: int = 1000, workers: int | None = None) -> list["SchemaError"]:
+        """
+        Validate the iFDO against the iFDO JSON schema. Requires jsonschema (pip install ifdo[schema]).
+
+        Args:
+            chunk_size: Number of image set items to encode and validate at a time.
+            workers: Number of worker processes to validate chunks in parallel. By default, chunks are validated in
+                the current process.
+
+        Returns:
+            The schema violations, each with the filename of its item (None for the header and the top level). Empty if
+            valid.
+        """
+        from ifdo.validation import validate  # Avoid a circular import
+
+        return validate(self, chunk_size, workers)
+
+    def mark_clean(self) -> None:
+        """
+        Mark the iFDO and all its objects as unmodified.
+
+        A derived iFDO (see clone) leaves the objects that it still shares with the iFDOs it was derived from alone:
+        their modification state belongs to those iFDOs too, so saving a clone does not hide the original's changes.
+        """
+        sources = [source for ref in self.__dict__.get("_ifdo_sources", ()) if (source := ref()) is not None]
+        shared = {id(obj) for source in sources for obj in _model_objects(source)}
+        object.__setattr__(self, "_ifdo_dirty", False)
+        for obj in _model_objects(self):
+            if id(obj) not in shared:
+                obj.mark_clean()
+
+    def with_items(self, image_set_items: dict[str, list[ImageData]]) -> "iFDO":
+        """
+        Create a copy-on-write clone with other image set items.
+
+        The clone shares the header with this iFDO and is tracked like any other clone (see clone and mark_clean).
+        Entries in the given items may be shared with this iFDO or new, e.g. the decimated entry lists of
+        ifdo.decimate.decimate.
+
+        Args:
+            image_set_items: Mapping of filename to image data entries. Used as is, not copied.
+
+        Returns:
+            The clone.
+        """
+        derived = copy(self)
+        object.__setattr__(derived, "image_set_items", image_set_items)  # Keep the modification state of the source
+        sources = (*self.__dict__.get("_ifdo_sources", ()), weakref.ref(self))
+        object.__setattr__(derived, "_ifdo_sources", sources)
+        return derived
+
+    def clone(self) -> "iFDO":
+        """
+        Create a copy-on-write clone of the iFDO.
+
+        The clone has its own items dict and entry lists, but shares the header and image data objects with the
+        original instead of copying them. Modify a clone through update_item and update_header, which replace the
+        affected objects rather than mutating shared ones; assigning to attributes of a shared object directly changes
+        it in every iFDO that shares it. Shared objects also share their modification state: saving the clone marks
+        only the objects it no longer shares clean (see mark_clean), so changed_items() of the original is unaffected.
+
+        Returns:
+            The clone.
+        """
+        return self.with_items(
+            {filename: list(image_data_list) for filename, image_data_list in self.image_set_items.items()},
+        )
+
+    def subset(self, filenames: Iterable[str]) -> "iFDO":
+        """
+        Create a copy-on-write clone with only the given image set items.
+
+        Args:
+            filenames: Filenames of the items to keep. The clone keeps them in the given order.
+
+        Returns:
+            The clone.
+
+        Raises:
+            KeyError: If a filename is not an item of this iFDO.
+        """
+        return self.with_items({filename: list(self.image_set_items[filename]) for filename in filenames})
+
+    def filter(self, predicate: Callable[[str, list[ImageData]], bool]) -> "iFDO":
+        """
+        Create a copy-on-write clone with only the image set items that match a predicate.
+
+        Args:
+            predicate: Function called with the filename and image data entries of each item.
+
+        Returns:
+            The clone.
+        """
+        return self.with_items(
+            {
+                filename: list(image_data_list)
+                for filename, image_data_list in self.image_set_items.items()
+                if predicate(filename, image_data_list)
+            },
+        )
+
+    def update_item(self, filename: str, index: int = 0, **changes: object) -> ImageData:
+        """
+        Replace fields of an image data entry without modifying the entry in place.
+
+        The entry is replaced with a shallow copy that has the changes applied, so clones sharing the original entry
+        are unaffected.
+
+        Args:
+            filename: Filename of the image set item.
+            index: Index of the entry in the item (e.g. the frame entry of a video).
+            **changes: Field names and their new values.
+
+        Returns:
+            The new entry.
+        """
+        image_data_list = self.image_set_items[filename]
+        image_data: ImageData = image_data_list[index].replace(**changes)
+        image_data_list[index] = image_data
+        return image_data
+
+    def update_header(self, **changes: object) -> ImageSetHeader:
+        """
+        Replace fields of the image set header without modifying the header in place.
+
+        Args:
+            **changes: Field names and their new values.
+
+        Returns:
+            The new header.
+        """
+        self.image_set_header = self.image_set_header.replace(**changes)
+        return self.image_set_header
@@ -0,0 +1,308 @@
+"""
+Interpolation of navigation data onto image and video frame times.
+
+Navigation (position and attitude of the camera platform) is usually logged separately from the images, at its own
+rate. NavigationTrack holds such a time series as NumPy arrays and interpolates it onto the capture times of all image
+data entries at once: positions linearly, and camera angles linearly on the unwrapped angle so that interpolating
+across 359 -> 1 degrees passes through 0 rather than 180. Times that fall in a gap of the track longer than max_gap,
+or outside the track, are not filled.
+
+The interpolation also estimates its own position error: the distance from the interpolated position to the nearest
+fix along the segment between the bracketing fixes. It is combined with the uncertainty of the fixes themselves (if
+the track has an image_coordinate_uncertainty_meters column) and can be written to image_coordinate_uncertainty_meters.
+
+NumPy is an optional dependency (pip install ifdo[numpy]).
+
+Classes:
+    NavigationTrack: Time series of navigation data.
+
+Functions:
+    fill_navigation: Fill the navigation fields of all image data entries of an iFDO from a track.
+"""
+
+import csv
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("Navigation interpolation requires NumPy: pip install ifdo[numpy]") from e
+
+from ifdo.models import ImageData, iFDO
+from ifdo.tabular import column_values, is_missing
+
+POSITION_FIELDS = ("image_latitude", "image_longitude", "image_altitude_meters", "image_meters_above_ground")
+ANGLE_FIELDS = ("image_camera_yaw_degrees", "image_camera_pitch_degrees", "image_camera_roll_degrees")
+UNCERTAINTY_FIELD = "image_coordinate_uncertainty_meters"
+NAVIGATION_FIELDS = (*POSITION_FIELDS, *ANGLE_FIELDS)
+EARTH_RADIUS_METERS = 6371008.8
+
+
+def _seconds(times: object) -> np.ndarray:
+    """
+    Convert datetimes (or datetime strings / datetime64 values) to float seconds since the epoch.
+    """
+    return np.asarray(times, dtype="datetime64[us]").astype(np.int64) / 1e6
+
+
+def _wrap(field_name: str, degrees: np.ndarray) -> np.ndarray:
+    """
+    Wrap interpolated angles back into range: [0, 360) for yaw, [-180, 180) for pitch and roll.
+    """
+    if field_name == "image_camera_yaw_degrees":
+        return np.mod(degrees, 360.0)
+    return np.mod(degrees + 180.0, 360.0) - 180.0
+
+
+def _brackets(times: np.ndarray, query: np.ndarray, max_gap: float | None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the fixes that bracket each query time.
+
+    Returns:
+        Indices of the left and right bracketing fixes (equal where a query time coincides with a fix), and a mask of
+        the query times that lie within the track and not in a gap longer than max_gap.
+    """
+    right = np.clip(np.searchsorted(times, query, side="left"), 0, len(times) - 1)
+    left = np.clip(right - 1, 0, len(times) - 1)
+    exact = times[right] == query
+    left = np.where(exact, right, left)
+    valid = (query >= times[0]) & (query <= times[-1])
+    if max_gap is not None:
+        valid &= times[right] - times[left] <= max_gap
+    return left, right, valid
+
+
+class NavigationTrack:
+    """
+    Time series of navigation data.
+
+    Attributes:
+        times (np.ndarray): Times of the fixes, in seconds since the epoch, sorted.
+        columns (dict[str, np.ndarray]): Values by ImageData field name, NaN where a fix lacks a value.
+    """
+
+    def __init__(self, times: Iterable[Any], **columns: Iterable[float | None]) -> None:
+        """
+        Initialize the track.
+
+        Args:
+            times: Times of the fixes, as datetimes, ISO datetime strings or NumPy datetime64 values.
+            **columns: Values by ImageData field name: one of NAVIGATION_FIELDS, or
+                image_coordinate_uncertainty_meters for the uncertainty of the fixes. Missing values may be None or NaN.
+
+        Raises:
+            ValueError: If a column is not a navigation field or has a different length than times.
+        """
+        self.times = _seconds(list(times))
+        order = np.argsort(self.times, kind="stable")
+        self.times = self.times[order]
+        self.columns: dict[str, np.ndarray] = {}
+        for name, values in columns.items():
+            if name not in NAVIGATION_FIELDS and name != UNCERTAINTY_FIELD:
+                raise ValueError(f"Not a navigation field: {name}")
+            array = np.array([np.nan if is_missing(value) else value for value in values], dtype=float)
+            if len(array) != len(self.times):
+                raise ValueError(f"Column {name} has {len(array)} values, expected {len(self.times)}")
+            self.columns[name] = array[order]
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Mapping[str, Iterable[Any]],
+        time_column: str = "image-datetime",
+        column_map: Mapping[str, str] | None = None,
+    ) -> "NavigationTrack":
+        """
+        Create a track from columns of values, e.g. the columns of a DataFrame.
+
+        Columns are matched to ImageData fields by field name (image_latitude) or iFDO key (image-latitude), or
+        through an explicit column map. Columns that match no navigation field are ignored.
+
+        Args:
+            columns: Mapping of column name to values.
+            time_column: Name of the column holding the time of each fix.
+            column_map: Optional mapping of column name to ImageData field name, for columns named differently.
+
+        Returns:
+            The track.
+
+        Raises:
+            KeyError: If the time column is missing.
+        """
+        if time_column not in columns:
+            raise KeyError(f"Missing time column: {time_column}")
+        column_map = column_map or {}
+        fields = {}
+        for name, values in columns.items():
+            field_name = column_map.get(name) or ImageData.key_fields.get(name) or name
+            if field_name in NAVIGATION_FIELDS or field_name == UNCERTAINTY_FIELD:
+                fields[field_name] = column_values(values)
+        return cls(column_values(columns[time_column]), **fields)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str | Path,
+        time_column: str = "image-datetime",
+        column_map: Mapping[str, str] | None = None,
+        delimiter: str = ",",
+    ) -> "NavigationTrack":
+        """
+        Create a track from a CSV file with a header row.
+
+        Args:
+            path: Path to the CSV file.
+            time_column: Name of the column holding the time of each fix, as ISO datetimes.
+            column_map: Optional mapping of column name to ImageData field name, for columns named differently.
+            delimiter: Field delimiter.
+
+        Returns:
+            The track.
+        """
+        with Path(path).open(newline="") as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader)
+            rows = list(reader)
+        columns = {name: [row[index] for row in rows] for index, name in enumerate(header)}
+        return cls.from_columns(columns, time_column, column_map)  # Numeric strings are converted by the constructor
+
+    def interpolate(
+        self,
+        times: Iterable[Any],
+        max_gap: float | None = None,
+    ) -> tuple[dict[str, np.ndarray], np.ndarray | None]:
+        """
+        Interpolate the track at the given times.
+
+        Args:
+            times: Times to interpolate at, as datetimes, ISO datetime strings or NumPy datetime64 values.
+            max_gap: Maximum time between the bracketing fixes, in seconds. Times in longer gaps get NaN.
+
+        Returns:
+            Interpolated values by field name (NaN where a time is outside the track or in a gap), and the estimated
+            position uncertainty in meters (None if the track has no latitude and longitude).
+        """
+        query = _seconds(list(times))
+        values = {}
+        for name, column in self.columns.items():
+            if name == UNCERTAINTY_FIELD:
+                continue
+            values[name] = self._interpolate_column(name, column, query, max_gap)
+
+        if "image_latitude" not in self.columns or "image_longitude" not in self.columns:
+            return values, None
+        return values, self._uncertainty(query, max_gap)
+
+    def _interpolate_column(
+        self,
+        name: str,
+        column: np.ndarray,
+        query: np.ndarray,
+        max_gap: float | None,
+    ) -> np.ndarray:
+        """
+        Interpolate one column over its finite samples.
+        """
+        present = np.isfinite(column)
+        times, samples = self.times[present], column[present]
+        result = np.full(len(query), np.nan)
+        if len(times) == 0:
+            return result
+
+        _, _, valid = _brackets(times, query, max_gap)
+        if name in ANGLE_FIELDS:
+            unwrapped = np.degrees(np.unwrap(np.radians(samples)))
+            interpolated = _wrap(name, np.interp(query, times, unwrapped))
+        else:
+            interpolated = np.interp(query, times, samples)
+        result[valid] = interpolated[valid]
+        return result
+
+    def _uncertainty(self, query: np.ndarray, max_gap: float | None) -> np.ndarray:
+        """
+        Estimate the position uncertainty of interpolated positions, in meters.
+        """
+        present = np.isfinite(self.columns["image_latitude"]) & np.isfinite(self.columns["image_longitude"])
+        times = self.times[present]
+        result = np.full(len(query), np.nan)
+        if len(times) == 0:
+            return result
+        latitudes = np.radians(self.columns["image_latitude"][present])
+        longitudes = np.radians(self.columns["image_longitude"][present])
+        left, right, valid = _brackets(times, query, max_gap)
+
+        # Length of the segment between the bracketing fixes (equirectangular approximation)
+        dx = (longitudes[right] - longitudes[left]) * np.cos((latitudes[left] + latitudes[right]) / 2)
+        dy = latitudes[right] - latitudes[left]
+        segment_meters = EARTH_RADIUS_METERS * np.hypot(dx, dy)
+
+        # Distance from the interpolated position to the nearest fix, assuming uniform motion along the segment
+        duration = times[right] - times[left]
+        nearest = np.minimum(query - times[left], times[right] - query)
+        fraction = np.divide(nearest, duration, out=np.zeros(len(query)), where=duration > 0)
+        uncertainty = segment_meters * np.clip(fraction, 0.0, 0.5)
+
+        fix_uncertainty = self.columns.get(UNCERTAINTY_FIELD)
+        if fix_uncertainty is not None:
+            fix_uncertainty = self._interpolate_column(UNCERTAINTY_FIELD, fix_uncertainty, query, None)
+            uncertainty = np.hypot(uncertainty, np.nan_to_num(fix_uncertainty, nan=0.0))
+
+        result[valid] = uncertainty[valid]
+        return result
+
+
+def fill_navigation(
+    ifdo: iFDO,
+    track: NavigationTrack,
+    max_gap: float | None = None,
+    *,
+    overwrite: bool = False,
+    uncertainty: bool = True,
+) -> int:
+    """
+    Fill the navigation fields of all image data entries of an iFDO from a track.
+
+    All entries with an image_datetime (photos and each video frame entry) are interpolated in one vectorized pass.
+    Entries whose time lies outside the track or in a gap longer than max_gap are left unchanged. Changed entries are
+    replaced with updated copies rather than modified in place, so clones of the iFDO that share them are unaffected.
+
+    Args:
+        ifdo: iFDO to fill.
+        track: Navigation track.
+        max_gap: Maximum time between the bracketing fixes, in seconds.
+        overwrite: Whether to overwrite fields that are already set.
+        uncertainty: Whether to write the estimated position uncertainty to image_coordinate_uncertainty_meters.
+
+    Returns:
+        Number of entries that had at least one field filled.
+    """
+    entries = [
+        (image_data_list, index)
+        for image_data_list in ifdo.image_set_items.values()
+        for index, image_data in enumerate(image_data_list)
+        if image_data.image_datetime is not None
+    ]
+    if not entries:
+        return 0
+    values, uncertainties = track.interpolate(
+        [image_data_list[index].image_datetime for image_data_list, index in entries],
+        max_gap,
+    )
+    if uncertainty and uncertainties is not None:
+        values[UNCERTAINTY_FIELD] = uncertainties
+
+    filled = 0
+    columns = [(name, column.tolist()) for name, column in values.items()]  # Python floats in one call per column
+    for row, (image_data_list, index) in enumerate(entries):
+        image_data = image_data_list[index]
+        changes = {
+            name: column[row]
+            for name, column in columns
+            if column[row] == column[row] and (overwrite or getattr(image_data, name) is None)  # Not NaN, not set
+        }
+        if changes:
+            image_data_list[index] = image_data.replace(**changes)
+            filled += 1
+    return filled
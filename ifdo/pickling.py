@@ -0,0 +1,95 @@
+"""
+Compact serialization of image set items for sending between processes.
+
+Model objects pickle compactly on their own: their __reduce__ stores only the fields that are set, behind a bit mask,
+with enumeration members as their index, and they are restored without validation (see ifdo.model.restore_model).
+
+For batches of items, e.g. chunks sent to multiprocessing or Dask workers, dumps_items() goes further and stores the
+image data entries column by column: one list per field that is set in any entry, rather than one tuple per entry.
+Transposing the entries and restoring them field by field runs largely in C, and columns of unset fields cost nothing.
+
+Functions:
+    dumps_items: Serialize image set items to bytes.
+    loads_items: Deserialize image set items serialized by dumps_items.
+"""
+
+import pickle  # nosec B403 - only for data produced by dumps_items
+from collections.abc import Mapping
+
+from ifdo.models import ImageData
+
+BATCH_VERSION = 1
+
+
+def dumps_items(items: Mapping[str, list[ImageData]], protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+    """
+    Serialize image set items to bytes.
+
+    The modification state and extension fields of the entries are kept.
+
+    Args:
+        items: Mapping of filename to image data entries, e.g. a chunk of iFDO.image_set_items.
+        protocol: Pickle protocol.
+
+    Returns:
+        The serialized items.
+    """
+    layout = ImageData.pickle_layout
+    filenames = list(items)
+    lengths = [len(items[filename]) for filename in filenames]
+    dicts = [image_data.__dict__ for filename in filenames for image_data in items[filename]]
+
+    columns = {}
+    for index, column in enumerate(zip(*map(layout.get_values, dicts), strict=True)):
+        if column.count(None) == len(column):  # Not set in any entry
+            continue
+        codes = layout.codes.get(index)
+        columns[index] = column if codes is None else [codes.get(value, value) for value in column]
+
+    dirty = [position for position, d in enumerate(dicts) if d.get("_ifdo_dirty", True)]
+    extras = {position: d["_ifdo_extras"] for position, d in enumerate(dicts) if d.get("_ifdo_extras")}
+    return pickle.dumps((BATCH_VERSION, filenames, lengths, columns, dirty, extras), protocol)
+
+
+def loads_items(data: bytes) -> dict[str, list[ImageData]]:
+    """
+    Deserialize image set items serialized by dumps_items.
+
+    Only load data from trusted sources: like any pickle, it can execute code.
+
+    Args:
+        data: The serialized items.
+
+    Returns:
+        Mapping of filename to image data entries.
+
+    Raises:
+        ValueError: If the data was serialized with an unsupported format version.
+    """
+    version, filenames, lengths, columns, dirty, extras = pickle.loads(data)  # noqa: S301 # nosec B301 - trusted input, see above
+    if version != BATCH_VERSION:
+        raise ValueError(f"Unsupported serialized items version: {version}")
+
+    layout = ImageData.pickle_layout
+    entries = [object.__new__(ImageData) for _ in range(sum(lengths))]
+    dicts = [image_data.__dict__ for image_data in entries]
+    for d in dicts:  # Values were validated when the entries were created, so they are set without validation
+        d.update(layout.empty)
+        d["_ifdo_dirty"] = False
+    for index, column in columns.items():
+        members = layout.members.get(index)
+        decoded = column if members is None else [members[value] if type(value) is int else value for value in column]
+        name = layout.names[index]
+        for d, value in zip(dicts, decoded, strict=True):
+            d[name] = value
+    for position in dirty:
+        dicts[position]["_ifdo_dirty"] = True
+    for position, entry_extras in extras.items():
+        dicts[position]["_ifdo_extras"] = entry_extras
+
+    items = {}
+    start = 0
+    for filename, length in zip(filenames, lengths, strict=True):
+        items[filename] = entries[start : start + length]
+        start += length
+    return items
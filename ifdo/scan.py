@@ -0,0 +1,155 @@
+"""
+Generation of iFDOs by scanning image directories.
+
+scan() walks a directory of images and videos, hashes the files concurrently (see ifdo.files), and produces an iFDO
+with one image set item per file: each gets its SHA-256 hash, a UUID and, where the filename encodes it, its capture
+date and time. The date and time are parsed according to the image set header's image-item-identification-scheme
+(e.g. "<project>_<event>_<sensor>_<datetime>.<ext>") if it has a <datetime> placeholder, and otherwise from the first
+run of digits in the filename that looks like YYYYMMDD_hhmmss.
+
+Scans are incremental when given a state file: files whose size and modification time have not changed since the
+previous scan are not hashed again, and keep their UUID. When given the previous iFDO, its entries are reused for files
+that have not changed, so metadata added since the last scan is kept. Files that vanish or cannot be read while they
+are hashed are left out.
+
+Functions:
+    datetime_from_filename: Parse the capture date and time encoded in a filename.
+    scan: Scan a directory and generate an iFDO.
+"""
+
+import re
+from collections.abc import Iterable
+from datetime import datetime
+from functools import cache
+from pathlib import Path
+from uuid import uuid4
+
+from ifdo.files import FileStateCache, hash_files, list_files
+from ifdo.models import ImageAcquisition, ImageData, ImageSetHeader, iFDO
+
+PHOTO_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".dng", ".cr2", ".nef", ".arw"})
+VIDEO_SUFFIXES = frozenset({".mp4", ".mov", ".avi", ".mkv", ".mts", ".m4v"})
+DATETIME_REGEX = r"\d{8}[_T-]?\d{6}(?:[._]\d{1,6})?"
+DATETIME_PATTERN = re.compile(rf"(?<!\d){DATETIME_REGEX}(?!\d)")
+PLACEHOLDER_PATTERN = re.compile(r"<([^<>]+)>")
+
+
+@cache
+def _scheme_pattern(scheme: str) -> re.Pattern[str] | None:
+    """
+    Compile an image item identification scheme into a regular expression with a "datetime" group.
+    """
+    parts = PLACEHOLDER_PATTERN.split(scheme)  # Alternating literals and placeholder names
+    if "datetime" not in parts[1::2]:
+        return None
+    regex = "".join(
+        re.escape(part) if index % 2 == 0 else (f"(?P<datetime>{DATETIME_REGEX})" if part == "datetime" else ".+?")
+        for index, part in enumerate(parts)
+    )
+    return re.compile(regex)
+
+
+def _parse_datetime(value: str) -> datetime | None:
+    digits = "".join(c for c in value if c.isdigit())
+    try:
+        parsed = datetime.strptime(digits[:14], "%Y%m%d%H%M%S")  # noqa: DTZ007
+    except ValueError:  # Not a valid date and time
+        return None
+    fraction = digits[14:]
+    return parsed.replace(microsecond=int(fraction.ljust(6, "0"))) if fraction else parsed
+
+
+def datetime_from_filename(filename: str, scheme: str | None = None) -> datetime | None:
+    """
+    Parse the capture date and time encoded in a filename.
+
+    Args:
+        filename: Filename, without directories.
+        scheme: Optional image item identification scheme with a <datetime> placeholder, e.g.
+            "<project>_<event>_<sensor>_<datetime>.<ext>".
+
+    Returns:
+        The date and time, or None if the filename does not encode one.
+    """
+    pattern = _scheme_pattern(scheme) if scheme else None
+    match = pattern.fullmatch(filename) if pattern is not None else None
+    if match is not None:
+        return _parse_datetime(match.group("datetime"))
+    match = DATETIME_PATTERN.search(filename)
+    return _parse_datetime(match.group()) if match is not None else None
+
+
+def scan(
+    root: str | Path,
+    image_set_header: ImageSetHeader | None = None,
+    previous: iFDO | None = None,
+    state_path: str | Path | None = None,
+    workers: int | None = None,
+    suffixes: Iterable[str] = PHOTO_SUFFIXES | VIDEO_SUFFIXES,
+    *,
+    recursive: bool = True,
+) -> iFDO:
+    """
+    Scan a directory of images and videos and generate an iFDO.
+
+    Image set items are keyed by the path of each file relative to root. Hidden files and directories are skipped.
+
+    Args:
+        root: Directory to scan.
+        image_set_header: Image set header of the iFDO. Defaults to the header of the previous iFDO, or a new header
+            named after the directory.
+        previous: Optional iFDO from a previous scan. Its entries are kept for unchanged files, and its UUIDs for all
+            files it lists.
+        state_path: Optional path to a JSON state file of file sizes, modification times, hashes and UUIDs. Unchanged
+            files are not hashed again. The file is updated after the scan.
+        workers: Maximum number of hashing threads.
+        suffixes: File suffixes to include (with the leading dot).
+        recursive: Whether to scan subdirectories.
+
+    Returns:
+        The iFDO, with items in path order.
+    """
+    root = Path(root)
+    if image_set_header is None:
+        if previous is not None:
+            image_set_header = previous.image_set_header
+        else:
+            image_set_header = ImageSetHeader(
+                image_set_name=root.resolve().name,
+                image_set_uuid=str(uuid4()),
+                image_set_handle=root.resolve().as_uri(),
+            )
+    scheme = image_set_header.image_item_identification_scheme
+    previous_items = previous.image_set_items if previous is not None else {}
+
+    state_cache = FileStateCache(state_path)
+    files = list_files(root, suffixes, recursive=recursive)
+    image_set_items: dict[str, list[ImageData]] = {}
+    states = {}
+    for filename, path, state in hash_files(files, state_cache, workers):
+        if isinstance(state, OSError):  # Vanished or unreadable since it was listed
+            continue
+        previous_entries = previous_items.get(filename)
+        uuid = (previous_entries[0].image_uuid if previous_entries else None) or state.uuid or str(uuid4())
+        states[filename] = state._replace(uuid=uuid)
+
+        if previous_entries and previous_entries[0].image_hash_sha256 == state.sha256:  # Unchanged file
+            image_set_items[filename] = list(previous_entries)
+            continue
+        if previous_entries:  # Modified file: keep its metadata but update the hash
+            image_set_items[filename] = [previous_entries[0].replace(image_hash_sha256=state.sha256)]
+            image_set_items[filename].extend(previous_entries[1:])
+            continue
+        video = path.suffix.lower() in VIDEO_SUFFIXES
+        image_set_items[filename] = [
+            ImageData(
+                image_datetime=datetime_from_filename(path.name, scheme),
+                image_uuid=uuid,
+                image_hash_sha256=state.sha256,
+                image_acquisition=ImageAcquisition.VIDEO if video else ImageAcquisition.PHOTO,
+            ),
+        ]
+
+    state_cache.states = states  # Forget files that no longer exist
+    state_cache.save()
+    return iFDO(image_set_header=image_set_header, image_set_items=image_set_items)
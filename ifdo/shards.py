@@ -0,0 +1,489 @@
+"""
+Sharded iFDO datasets: one image set split over several files that are loaded on demand.
+
+Long-running deployments (e.g. observatories) produce iFDOs too large to load as one file. write_shards() splits an
+iFDO into shard files, each holding a subset of the image set items, partitioned by item count, by time window or by
+spatial tile. A manifest next to them holds the image set header and an index of the shards: for each shard its file,
+its number of items, and the time range and bounding box of its entries.
+
+ShardedIFDO opens the manifest without reading any shard. It exposes the header and the items like an iFDO, and a
+query only loads the shards whose time range and bounding box overlap it. map_shards() applies a function to shards in
+parallel worker processes, each of which loads its own shard, so the whole image set is never held in one process.
+
+Shards are written as JSON (which parses much faster than YAML), compressed if their suffix is, e.g., .json.gz.
+
+Classes:
+    Shard: Index entry of one shard.
+    ShardedItems: Read-only mapping of filename to image data entries over all shards.
+    ShardedIFDO: An iFDO split over shard files.
+
+Functions:
+    write_shards: Split an iFDO into shard files and write their manifest.
+"""
+
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from math import floor
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+from ifdo.compression import open_text
+from ifdo.model import encode_value
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+PARTITIONS = ("count", "time", "tile")
+DEFAULT_SIZES = {"count": 10000, "time": 86400.0, "tile": 1.0}
+MAX_CACHED = 8
+
+BoundingBox = tuple[float, float, float, float]  # (min latitude, min longitude, max latitude, max longitude)
+T = TypeVar("T")
+
+
+def _seconds(value: datetime) -> float:
+    """
+    Get the POSIX time of a datetime, taking naive datetimes as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class _Extent:
+    """
+    Accumulates the time range and bounding box of image data entries.
+    """
+
+    def __init__(self) -> None:
+        self.start: datetime | None = None
+        self.end: datetime | None = None
+        self.bbox: BoundingBox | None = None
+
+    def add_time(self, time: datetime) -> None:
+        if self.start is None or _seconds(time) < _seconds(self.start):
+            self.start = time
+        if self.end is None or _seconds(time) > _seconds(self.end):
+            self.end = time
+
+    def add_position(self, latitude: float, longitude: float) -> None:
+        if self.bbox is None:
+            self.bbox = (latitude, longitude, latitude, longitude)
+            return
+        min_lat, min_lon, max_lat, max_lon = self.bbox
+        self.bbox = (min(min_lat, latitude), min(min_lon, longitude), max(max_lat, latitude), max(max_lon, longitude))
+
+    def add(self, image_data: ImageData | ImageSetHeader) -> None:
+        if image_data.image_datetime is not None:
+            self.add_time(image_data.image_datetime)
+        if image_data.image_latitude is not None and image_data.image_longitude is not None:
+            self.add_position(image_data.image_latitude, image_data.image_longitude)
+
+    def update(self, other: "_Extent") -> None:
+        if other.start is not None and other.end is not None:
+            self.add_time(other.start)
+            self.add_time(other.end)
+        if other.bbox is not None:
+            self.add_position(other.bbox[0], other.bbox[1])
+            self.add_position(other.bbox[2], other.bbox[3])
+
+
+def _item_extent(image_data_list: list[ImageData], header: ImageSetHeader) -> _Extent:
+    """
+    Get the extent of an item, falling back to the header's time and position where no entry has them.
+    """
+    extent = _Extent()
+    for image_data in image_data_list:
+        extent.add(image_data)
+    if extent.start is None or extent.bbox is None:
+        fallback = _Extent()
+        fallback.add(header)
+        if extent.start is None:
+            extent.start, extent.end = fallback.start, fallback.end
+        if extent.bbox is None:
+            extent.bbox = fallback.bbox
+    return extent
+
+
+def _overlaps(
+    extent_start: datetime | None,
+    extent_end: datetime | None,
+    extent_bbox: BoundingBox | None,
+    start: datetime | None,
+    end: datetime | None,
+    bbox: BoundingBox | None,
+) -> bool:
+    if start is not None or end is not None:
+        if extent_start is None or extent_end is None:
+            return False
+        if start is not None and _seconds(extent_end) < _seconds(start):
+            return False
+        if end is not None and _seconds(extent_start) > _seconds(end):
+            return False
+    if bbox is not None:
+        if extent_bbox is None:
+            return False
+        min_lat, min_lon, max_lat, max_lon = bbox
+        if extent_bbox[2] < min_lat or extent_bbox[0] > max_lat or extent_bbox[3] < min_lon or extent_bbox[1] > max_lon:
+            return False
+    return True
+
+
+class Shard(NamedTuple):
+    """
+    Index entry of one shard.
+
+    Attributes:
+        path (str): Path of the shard file, relative to the manifest.
+        items (int): Number of image set items in the shard.
+        start (datetime | None): Earliest image_datetime of the shard's entries, None if none has one.
+        end (datetime | None): Latest image_datetime of the shard's entries, None if none has one.
+        bbox (tuple[float, float, float, float] | None): Bounding box of the shard's entries as (min latitude, min
+            longitude, max latitude, max longitude), None if none has a position.
+    """
+
+    path: str
+    items: int
+    start: datetime | None = None
+    end: datetime | None = None
+    bbox: BoundingBox | None = None
+
+    def overlaps(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bbox: BoundingBox | None = None,
+    ) -> bool:
+        """
+        Check whether the shard may contain entries within a time range and bounding box.
+
+        Args:
+            start: Start of the time range (inclusive). Naive datetimes are taken as UTC.
+            end: End of the time range (inclusive).
+            bbox: Bounding box as (min latitude, min longitude, max latitude, max longitude). Boxes that cross the
+                antimeridian are not supported.
+
+        Returns:
+            True if the shard's extent overlaps the query.
+        """
+        return _overlaps(self.start, self.end, self.bbox, start, end, bbox)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to the manifest's JSON form.
+        """
+        return {
+            "path": self.path,
+            "items": self.items,
+            "start": encode_value(self.start),
+            "end": encode_value(self.end),
+            "bbox": list(self.bbox) if self.bbox is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "Shard":
+        """
+        Create from the manifest's JSON form.
+        """
+        start, end, bbox = d.get("start"), d.get("end"), d.get("bbox")
+        return cls(
+            d["path"],
+            d["items"],
+            datetime.fromisoformat(start) if start else None,
+            datetime.fromisoformat(end) if end else None,
+            tuple(bbox) if bbox else None,
+        )
+
+
+def _partition_key(by: str, size: float, extent: _Extent, position: int) -> int | tuple[int, int] | None:
+    """
+    Get the key of the shard an item belongs to. Items without a time (or position) get the key None.
+    """
+    if by == "count":
+        return position // int(size)
+    if by == "time":
+        return None if extent.start is None else floor(_seconds(extent.start) / size)
+    if extent.bbox is None:
+        return None
+    return floor(extent.bbox[0] / size), floor(extent.bbox[1] / size)
+
+
+def _load_shard(head: dict[str, Any], path: Path) -> iFDO:
+    with open_text(path) as f:
+        items = json.load(f)["image-set-items"]
+    ifdo: iFDO = iFDO.from_dict({**head, "image-set-items": items})
+    return ifdo
+
+
+def _map_shard(func: Callable[[iFDO], T], head: dict[str, Any], path: Path) -> T:
+    return func(_load_shard(head, path))
+
+
+def write_shards(
+    ifdo: iFDO,
+    directory: str | Path,
+    by: str = "count",
+    size: float | None = None,
+    suffix: str = ".json",
+    compresslevel: int | None = None,
+) -> "ShardedIFDO":
+    """
+    Split an iFDO into shard files and write their manifest.
+
+    Args:
+        ifdo: The iFDO to split.
+        directory: Directory to write the manifest and shards to. Created if needed.
+        by: How to partition the items: "count" (consecutive runs of size items, in image set order), "time" (windows
+            of size seconds, by the item's earliest image_datetime) or "tile" (tiles of size by size degrees, by the
+            item's first position). Items that lack a time or position are written to a last shard of their own. Entries
+            without a time or position fall back to the header's.
+        size: Size of each partition. Defaults to 10000 items, one day, or one degree.
+        suffix: Suffix of the shard files, e.g. ".json.gz" for compressed shards.
+        compresslevel: Compression level for compressed shards. Defaults to the codec's default.
+
+    Returns:
+        The sharded iFDO.
+
+    Raises:
+        ValueError: If by is not a supported partition or size is not positive.
+    """
+    if by not in PARTITIONS:
+        raise ValueError(f"Unsupported partition: {by}")
+    size = size if size is not None else DEFAULT_SIZES[by]
+    if size <= 0:
+        raise ValueError(f"Partition size must be positive, got {size}")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    header = ifdo.image_set_header
+    groups: dict[Any, tuple[list[str], _Extent]] = {}
+    for position, (filename, image_data_list) in enumerate(ifdo.image_set_items.items()):
+        item_extent = _item_extent(image_data_list, header)
+        filenames, extent = groups.setdefault(_partition_key(by, size, item_extent, position), ([], _Extent()))
+        filenames.append(filename)
+        extent.update(item_extent)
+
+    keys = sorted(key for key in groups if key is not None)
+    if None in groups:
+        keys.append(None)
+    shards = []
+    for number, key in enumerate(keys):
+        filenames, extent = groups[key]
+        shard = Shard(f"shard-{number:05d}{suffix}", len(filenames), extent.start, extent.end, extent.bbox)
+        items = {filename: encode_value(ifdo.image_set_items[filename]) for filename in filenames}
+        with open_text(directory / shard.path, "w", compresslevel) as f:
+            json.dump({"image-set-items": items}, f, ensure_ascii=False, separators=(",", ":"))
+        shards.append(shard)
+
+    manifest = {
+        "ifdo-shards": MANIFEST_VERSION,
+        "partition": {"by": by, "size": size},
+        "image-set-header": header.to_dict(),
+        "extras": encode_value(ifdo.extras),
+        "shards": [shard.to_dict() for shard in shards],
+    }
+    with (directory / MANIFEST_NAME).open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return ShardedIFDO(directory)
+
+
+class ShardedItems(Mapping[str, list[ImageData]]):
+    """
+    Read-only mapping of filename to image data entries over all shards of a sharded iFDO.
+
+    The number of items comes from the manifest. Iterating or looking up an item loads shards one at a time (through
+    the sharded iFDO's shard cache); a lookup scans the shards in order until it finds the filename.
+    """
+
+    def __init__(self, sharded: "ShardedIFDO") -> None:
+        """
+        Create the mapping over the shards of a sharded iFDO.
+
+        Args:
+            sharded: The sharded iFDO.
+        """
+        self._sharded = sharded
+
+    def __len__(self) -> int:
+        return sum(shard.items for shard in self._sharded.shards)
+
+    def __iter__(self) -> Iterator[str]:
+        for shard in self._sharded.shards:
+            yield from self._sharded.load_shard(shard).image_set_items
+
+    def __getitem__(self, filename: str) -> list[ImageData]:
+        for shard in self._sharded.shards:
+            image_data_list = self._sharded.load_shard(shard).image_set_items.get(filename)
+            if image_data_list is not None:
+                return image_data_list
+        raise KeyError(filename)
+
+    def items(self) -> Iterator[tuple[str, list[ImageData]]]:  # type: ignore[override]  # Avoids a lookup per item
+        """
+        Iterate over (filename, image data entries) pairs, one shard at a time.
+        """
+        for shard in self._sharded.shards:
+            yield from self._sharded.load_shard(shard).image_set_items.items()
+
+
+class ShardedIFDO:
+    """
+    An iFDO split over shard files, with shards loaded on demand.
+
+    Attributes:
+        path (Path): Path to the directory holding the manifest and shards.
+        image_set_header (ImageSetHeader): The image set header.
+        shards (list[Shard]): Index of the shards.
+        extras (dict[str, Any]): Top-level extension fields of the iFDO, e.g. "$schema".
+        partition (dict[str, Any]): How the items were partitioned ("by" and "size").
+        max_cached (int): Maximum number of loaded shards kept in memory.
+
+    Example:
+        sharded = write_shards(ifdo, "dataset", by="time", size=3600)
+        sharded = ShardedIFDO("dataset")
+        night = sharded.query(start=datetime(2024, 1, 1, 22), end=datetime(2024, 1, 2, 6))
+        counts = sharded.map_shards(count_annotations, workers=8)
+    """
+
+    def __init__(self, path: str | Path, max_cached: int = MAX_CACHED) -> None:
+        """
+        Open a sharded iFDO.
+
+        Args:
+            path: Path to the directory holding the manifest, or to the manifest itself.
+            max_cached: Maximum number of loaded shards kept in memory.
+
+        Raises:
+            ValueError: If the manifest has an unsupported version.
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / MANIFEST_NAME
+        with path.open(encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("ifdo-shards") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported shard manifest version: {manifest.get('ifdo-shards')}")
+        self.path = path.parent
+        self._head = {**manifest.get("extras", {}), "image-set-header": manifest["image-set-header"]}
+        self.image_set_header = ImageSetHeader.from_dict(manifest["image-set-header"])
+        self.extras: dict[str, Any] = manifest.get("extras", {})
+        self.partition = manifest.get("partition", {})
+        self.shards = [Shard.from_dict(shard) for shard in manifest["shards"]]
+        self.max_cached = max_cached
+        self._cache: OrderedDict[str, iFDO] = OrderedDict()
+
+    @property
+    def image_set_items(self) -> ShardedItems:
+        """
+        The image set items of all shards, loaded on demand.
+        """
+        return ShardedItems(self)
+
+    def load_shard(self, shard: Shard) -> iFDO:
+        """
+        Load a shard as an iFDO with the image set header and the shard's items.
+
+        Loaded shards are cached, least recently used first out. The returned iFDO is shared with the cache: derive a
+        copy (e.g. with clone()) before modifying it.
+
+        Args:
+            shard: The shard, from shards or select().
+
+        Returns:
+            The shard's iFDO.
+        """
+        ifdo = self._cache.get(shard.path)
+        if ifdo is not None:
+            self._cache.move_to_end(shard.path)
+            return ifdo
+        ifdo = _load_shard(self._head, self.path / shard.path)
+        self._cache[shard.path] = ifdo
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return ifdo
+
+    def select(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bbox: BoundingBox | None = None,
+    ) -> list[Shard]:
+        """
+        Find the shards that may contain entries within a time range and bounding box, from the manifest alone.
+
+        Args:
+            start: Start of the time range (inclusive). Naive datetimes are taken as UTC.
+            end: End of the time range (inclusive).
+            bbox: Bounding box as (min latitude, min longitude, max latitude, max longitude).
+
+        Returns:
+            The overlapping shards, in manifest order.
+        """
+        return [shard for shard in self.shards if shard.overlaps(start, end, bbox)]
+
+    def query(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        bbox: BoundingBox | None = None,
+    ) -> iFDO:
+        """
+        Collect the items with entries within a time range and bounding box, loading only the overlapping shards.
+
+        Args:
+            start: Start of the time range (inclusive). Naive datetimes are taken as UTC.
+            end: End of the time range (inclusive).
+            bbox: Bounding box as (min latitude, min longitude, max latitude, max longitude).
+
+        Returns:
+            An iFDO with the image set header and the matching items. Entries are shared with the shard cache.
+        """
+        items = {}
+        for shard in self.select(start, end, bbox):
+            for filename, image_data_list in self.load_shard(shard).image_set_items.items():
+                extent = _item_extent(image_data_list, self.image_set_header)
+                if _overlaps(extent.start, extent.end, extent.bbox, start, end, bbox):
+                    items[filename] = list(image_data_list)
+        return self._ifdo(items)
+
+    def map_shards(
+        self,
+        func: Callable[[iFDO], T],
+        shards: Iterable[Shard] | None = None,
+        workers: int | None = None,
+    ) -> list[T]:
+        """
+        Apply a function to the iFDO of each shard.
+
+        Args:
+            func: Function of a shard's iFDO. With workers, it must be picklable (e.g. a module-level function).
+            shards: Shards to process, e.g. from select(). Defaults to all shards.
+            workers: Number of worker processes, each loading its own shards. By default, shards are processed in the
+                current process, through the shard cache.
+
+        Returns:
+            The results, in shard order.
+        """
+        shards = list(shards) if shards is not None else self.shards
+        if workers is None:
+            return [func(self.load_shard(shard)) for shard in shards]
+        paths = [self.path / shard.path for shard in shards]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_map_shard, [func] * len(paths), [self._head] * len(paths), paths))
+
+    def to_ifdo(self) -> iFDO:
+        """
+        Load all shards into one iFDO.
+
+        Returns:
+            The iFDO. Entries are shared with the shard cache.
+        """
+        return self._ifdo(dict(self.image_set_items.items()))
+
+    def _ifdo(self, items: dict[str, list[ImageData]]) -> iFDO:
+        ifdo = iFDO(image_set_header=self.image_set_header, image_set_items=items)
+        ifdo.extras.update(self.extras)
+        return ifdo
@@ -0,0 +1,343 @@
+"""
+Nearest-neighbour search over image content descriptors.
+
+DescriptorIndex collects descriptor vectors (image-average-color, image-entropy and the image-mpeg7-* descriptors) of
+the image data entries of one or more iFDOs into one NumPy matrix, with one row per entry, so video frames are
+indexed individually. Each row concatenates the chosen descriptor fields; entries that lack any of them are skipped.
+With standardize set, every dimension is scaled to zero mean and unit variance so that descriptors on different
+scales (e.g. 0-255 colors and 0-8 entropy) contribute comparably.
+
+Rows are appended to a preallocated array whose capacity doubles when full, so adding entries costs amortized O(d) per
+row. The (standardized) search matrix is derived from it lazily, when the first query after an add runs.
+
+Queries are batched: distances from a block of query vectors to all rows are computed with one matrix product, and the
+k nearest rows are selected with argpartition. The approximate mode uses random-hyperplane locality sensitive hashing:
+rows are bucketed by the signs of a few random projections in several tables, and only rows that share a bucket with
+the query are ranked exactly. It trades recall for speed on large indexes.
+
+NumPy is an optional dependency (pip install ifdo[numpy]).
+
+Classes:
+    SearchResult: One neighbour found by a search.
+    DescriptorIndex: Nearest-neighbour index over descriptor vectors.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    from numpy.typing import ArrayLike
+except ImportError as e:
+    raise ImportError("Similarity search requires NumPy: pip install ifdo[numpy]") from e
+
+from ifdo.models import ImageData, iFDO
+
+DESCRIPTOR_FIELDS = (
+    "image_average_color",
+    "image_entropy",
+    "image_mpeg7_colorlayout",
+    "image_mpeg7_colorstatistics",
+    "image_mpeg7_colorstructure",
+    "image_mpeg7_dominantcolor",
+    "image_mpeg7_edgehistogram",
+    "image_mpeg7_homogenoustexture",
+    "image_mpeg7_stablecolor",
+)
+QUERY_BLOCK_ELEMENTS = 1 << 24  # Bound on the size of the distance matrix of one query block
+INITIAL_CAPACITY = 1024  # Rows preallocated by the first add
+
+
+class SearchResult(NamedTuple):
+    """
+    One neighbour found by a search.
+
+    Attributes:
+        source (str): Name of the iFDO the entry belongs to.
+        filename (str): Filename of the image set item.
+        frame (int): Index of the entry in the item (the frame entry of a video).
+        distance (float): Euclidean distance to the query, in the (standardized) descriptor space.
+    """
+
+    source: str
+    filename: str
+    frame: int
+    distance: float
+
+
+class DescriptorIndex:
+    """
+    Nearest-neighbour index over the descriptor vectors of image data entries.
+
+    Attributes:
+        fields (tuple[str, ...]): Descriptor fields that make up each vector, in order.
+        standardize (bool): Whether dimensions are scaled to zero mean and unit variance.
+    """
+
+    def __init__(self, fields: Sequence[str] = ("image_mpeg7_colorlayout",), *, standardize: bool = True) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            fields: Descriptor fields that make up each vector (see DESCRIPTOR_FIELDS).
+            standardize: Whether to scale dimensions to zero mean and unit variance.
+
+        Raises:
+            ValueError: If a field is not a descriptor field.
+        """
+        for field_name in fields:
+            if field_name not in DESCRIPTOR_FIELDS:
+                raise ValueError(f"Not a descriptor field: {field_name}")
+        self.fields = tuple(fields)
+        self.standardize = standardize
+        self._sizes: list[int] | None = None  # Length of each field's descriptor, set by the first entries added
+        self._data: np.ndarray | None = None  # Unstandardized rows; only the first len(self) are in use
+        self._keys: list[tuple[str, str, int]] = []
+        self._positions: dict[tuple[str, str, int], int] = {}
+        self._matrix: np.ndarray | None = None
+        self._offset: np.ndarray | None = None
+        self._scale: np.ndarray | None = None
+        self._hashes: list[tuple[np.ndarray, dict[int, np.ndarray]]] | None = None
+
+    def __len__(self) -> int:
+        """
+        Get the number of indexed entries.
+        """
+        return len(self._keys)
+
+    def _parts(self, image_data: ImageData) -> list[list[float]] | None:
+        # The descriptor of each field, or None if the entry lacks one
+        parts = []
+        for field_name in self.fields:
+            value = getattr(image_data, field_name)
+            if value is None:
+                return None
+            parts.append([float(value)] if isinstance(value, int | float) else [float(element) for element in value])
+        return parts
+
+    def _check_sizes(self, sizes: list[int], expected: list[int] | None) -> None:
+        if expected is not None and sizes != expected:
+            raise ValueError(f"Descriptor lengths {sizes} do not match the index's {expected}")
+
+    def vector(self, image_data: ImageData) -> list[float] | None:
+        """
+        Get the (unstandardized) descriptor vector of an image data entry.
+
+        Args:
+            image_data: The entry.
+
+        Returns:
+            The vector, or None if the entry lacks one of the descriptor fields.
+
+        Raises:
+            ValueError: If a descriptor has a different length than the indexed entries'.
+        """
+        parts = self._parts(image_data)
+        if parts is None:
+            return None
+        self._check_sizes([len(part) for part in parts], self._sizes)
+        return [element for part in parts for element in part]
+
+    def add(self, ifdo: iFDO, source: str | None = None) -> int:
+        """
+        Add the entries of an iFDO to the index.
+
+        The entries are added all at once: if one of them cannot be added, the index is left unchanged.
+
+        Args:
+            ifdo: The iFDO.
+            source: Name to report in search results. Defaults to the image set name.
+
+        Returns:
+            Number of entries added (entries that lack a descriptor field are skipped).
+
+        Raises:
+            ValueError: If a descriptor has a different length than the other entries'.
+        """
+        source = source if source is not None else ifdo.image_set_header.image_set_name
+        sizes = self._sizes
+        rows = []
+        keys = []
+        for filename, image_data_list in ifdo.image_set_items.items():
+            for frame, image_data in enumerate(image_data_list):
+                parts = self._parts(image_data)
+                if parts is None:
+                    continue
+                part_sizes = [len(part) for part in parts]
+                self._check_sizes(part_sizes, sizes)
+                sizes = part_sizes
+                rows.append([element for part in parts for element in part])
+                keys.append((source, filename, frame))
+        if not rows:
+            return 0
+
+        self._sizes = sizes
+        start = len(self._keys)
+        self._reserve(start + len(rows))
+        if self._data is not None:  # Set by _reserve; checked for the type checker
+            self._data[start : start + len(rows)] = rows
+        self._positions.update(zip(keys, range(start, start + len(rows)), strict=True))
+        self._keys.extend(keys)
+        self._matrix = self._hashes = None  # Rebuilt on the next query
+        return len(rows)
+
+    def _reserve(self, count: int) -> None:
+        # Grow the row array to hold at least count rows, doubling its capacity so appends are amortized O(d)
+        width = sum(self._sizes or ())
+        if self._data is not None and len(self._data) >= count:
+            return
+        capacity = max(count, INITIAL_CAPACITY, 2 * len(self._data) if self._data is not None else 0)
+        data = np.empty((capacity, width), dtype=np.float64)
+        if self._data is not None:
+            data[: len(self._keys)] = self._data[: len(self._keys)]
+        self._data = data
+
+    @classmethod
+    def from_ifdos(
+        cls,
+        ifdos: Iterable[iFDO],
+        fields: Sequence[str] = ("image_mpeg7_colorlayout",),
+        *,
+        standardize: bool = True,
+    ) -> "DescriptorIndex":
+        """
+        Build an index over the entries of several iFDOs.
+
+        Args:
+            ifdos: The iFDOs. Results name each by its image set name.
+            fields: Descriptor fields that make up each vector (see DESCRIPTOR_FIELDS).
+            standardize: Whether to scale dimensions to zero mean and unit variance.
+
+        Returns:
+            The index.
+        """
+        index = cls(fields, standardize=standardize)
+        for ifdo in ifdos:
+            index.add(ifdo)
+        return index
+
+    def _build(self) -> np.ndarray:
+        if self._matrix is None:
+            matrix = self._data[: len(self._keys)] if self._data is not None else np.empty((0, 0), dtype=np.float64)
+            if self.standardize and len(matrix):
+                self._offset = matrix.mean(axis=0)
+                std = matrix.std(axis=0)
+                self._scale = np.where(std > 0, std, 1.0)
+                matrix = (matrix - self._offset) / self._scale
+            self._matrix = matrix
+        return self._matrix
+
+    def _transform(self, vectors: np.ndarray) -> np.ndarray:
+        if self._offset is None or self._scale is None:
+            return vectors
+        return (vectors - self._offset) / self._scale
+
+    def build_approximate(self, tables: int = 8, bits: int = 12, seed: int | None = None) -> None:
+        """
+        Build the hash tables for approximate search. Done automatically by the first approximate query.
+
+        Args:
+            tables: Number of hash tables. More tables increase recall and query time.
+            bits: Number of random hyperplanes per table. More bits make buckets smaller: faster but lower recall.
+            seed: Seed of the random hyperplanes, for reproducible results.
+        """
+        matrix = self._build()
+        rng = np.random.default_rng(seed)
+        weights = 1 << np.arange(bits, dtype=np.int64)
+        self._hashes = []
+        for _ in range(tables):
+            planes = rng.standard_normal((matrix.shape[1], bits))
+            codes = (matrix @ planes > 0) @ weights
+            order = np.argsort(codes, kind="stable")
+            unique, starts = np.unique(codes[order], return_index=True)
+            buckets = dict(zip(unique.tolist(), np.split(order, starts[1:]), strict=True))
+            self._hashes.append((planes, buckets))
+
+    def _candidates(self, vector: np.ndarray, hashes: list[tuple[np.ndarray, dict[int, np.ndarray]]]) -> np.ndarray:
+        buckets = []
+        for planes, table in hashes:
+            code = int((vector @ planes > 0) @ (1 << np.arange(planes.shape[1], dtype=np.int64)))
+            bucket = table.get(code)
+            if bucket is not None:
+                buckets.append(bucket)
+        return np.unique(np.concatenate(buckets)) if buckets else np.empty(0, dtype=np.int64)
+
+    def _results(self, rows: np.ndarray, squared_distances: np.ndarray) -> list[SearchResult]:
+        distances = np.sqrt(np.maximum(squared_distances, 0.0)).tolist()
+        return [
+            SearchResult._make((*self._keys[row], distance))
+            for row, distance in zip(rows.tolist(), distances, strict=True)
+        ]
+
+    def query(self, vectors: ArrayLike, k: int = 10, *, approximate: bool = False) -> list[list[SearchResult]]:
+        """
+        Find the nearest indexed entries to each of a batch of descriptor vectors.
+
+        Args:
+            vectors: Query vectors (unstandardized), one per row, e.g. from vector().
+            k: Number of neighbours per query.
+            approximate: Whether to use the approximate (hashing) mode.
+
+        Returns:
+            For each query, up to k results sorted by distance. Approximate queries may return fewer.
+        """
+        matrix = self._build()
+        queries = self._transform(np.atleast_2d(np.asarray(vectors, dtype=np.float64)))
+        if not len(matrix):
+            return [[] for _ in range(len(queries))]
+        if approximate:
+            if self._hashes is None:
+                self.build_approximate()
+            hashes = self._hashes
+            if hashes is None:  # Set by build_approximate; checked for the type checker
+                return [[] for _ in range(len(queries))]
+            results = []
+            for query in queries:
+                rows = self._candidates(query, hashes)
+                squared = ((matrix[rows] - query) ** 2).sum(axis=1)
+                nearest = np.argsort(squared, kind="stable")[:k]
+                results.append(self._results(rows[nearest], squared[nearest]))
+            return results
+
+        k = min(k, len(matrix))
+        norms = (matrix**2).sum(axis=1)
+        block = max(1, QUERY_BLOCK_ELEMENTS // len(matrix))
+        results = []
+        for start in range(0, len(queries), block):
+            chunk = queries[start : start + block]
+            squared = norms - 2 * chunk @ matrix.T + (chunk**2).sum(axis=1)[:, None]
+            nearest = np.argpartition(squared, k - 1, axis=1)[:, :k]
+            for query_nearest, query_squared in zip(nearest, squared, strict=True):
+                ordered = query_nearest[np.argsort(query_squared[query_nearest], kind="stable")]
+                results.append(self._results(ordered, query_squared[ordered]))
+        return results
+
+    def similar(
+        self,
+        items: Iterable[tuple[str, str, int]],
+        k: int = 10,
+        *,
+        approximate: bool = False,
+    ) -> list[list[SearchResult]]:
+        """
+        Find the nearest entries to a batch of indexed entries, excluding each entry itself.
+
+        Args:
+            items: Indexed entries as (source, filename, frame) tuples.
+            k: Number of neighbours per entry.
+            approximate: Whether to use the approximate (hashing) mode.
+
+        Returns:
+            For each entry, up to k results sorted by distance.
+
+        Raises:
+            KeyError: If an entry is not indexed.
+        """
+        keys = list(items)
+        rows = [self._positions[key] for key in keys]
+        vectors = self._data[rows] if self._data is not None else np.empty((0, 0), dtype=np.float64)
+        results = self.query(vectors, k + 1, approximate=approximate)
+        return [
+            [result for result in query_results if result[:3] != key][:k]
+            for key, query_results in zip(keys, results, strict=True)
+        ]
@@ -0,0 +1,287 @@
+"""
+Bulk construction of image set items from tabular data.
+
+Navigation and acquisition logs are usually tables with one row per image or video frame. Converting them via one
+dict and one ImageData.from_dict call per row repeats the type reflection and validation of every field for every row.
+The functions in this module instead resolve the column-to-field mapping and a converter per column once, convert each
+column in a single pass (with optional range validation of the whole column), and then assemble the ImageData objects
+directly.
+
+Columns are matched to ImageData fields by field name (image_latitude) or iFDO key (image-latitude), or through an
+explicit column map. Rows are grouped into image set items by their filename column; several rows with the same
+filename become the per-frame entries of a video item.
+
+Functions:
+    items_from_columns: Build image set items from a mapping of column name to values (lists, NumPy arrays, ...).
+    items_from_csv: Build image set items from a CSV file.
+    items_from_dataframe: Build image set items from a pandas or Polars DataFrame.
+"""
+
+import csv
+import math
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import fields
+from datetime import datetime
+from enum import Enum
+from itertools import repeat
+from pathlib import Path
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+from pydantic.fields import FieldInfo
+
+from ifdo.model import default_getter, parse_enum, parse_field
+from ifdo.models import ImageData
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+FILENAME_COLUMN = "image-filename"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+Converter = Callable[[Any], Any]
+
+
+def is_missing(value: object, *, empty_strings: bool = True) -> bool:
+    """
+    Check whether a cell value is missing: None, NaN or (if empty_strings is set) an empty string.
+    """
+    return value is None or (empty_strings and value == "") or (isinstance(value, float) and math.isnan(value))
+
+
+def _parse_datetime(value: object) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if hasattr(value, "to_pydatetime"):  # pandas.Timestamp
+        return value.to_pydatetime()  # type: ignore[no-any-return]
+    value = str(value)
+    try:
+        return datetime.strptime(value, DATETIME_FORMAT)  # noqa: DTZ007
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
+def _converter(field_type: object) -> Converter:
+    """
+    Get a function that converts a single (non-missing) cell value to a field's type.
+    """
+    if get_origin(field_type) in (Union, UnionType):  # Optional[X] -> X
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) == 1:
+            field_type = args[0]
+
+    if field_type is float:
+        return float
+    if field_type is int:
+        return int
+    if field_type is str:
+        return str
+    if field_type is datetime:
+        return _parse_datetime
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return lambda value: parse_enum(field_type, value)
+    return lambda value: parse_field(field_type, value)  # Nested objects and lists
+
+
+def _bounds(field_default: object) -> tuple[float | None, float | None]:
+    """
+    Get the inclusive bounds declared on a field with pydantic.Field(ge=..., le=...).
+    """
+    lower = upper = None
+    if isinstance(field_default, FieldInfo):
+        for constraint in field_default.metadata:
+            lower = getattr(constraint, "ge", lower)
+            upper = getattr(constraint, "le", upper)
+    return lower, upper
+
+
+def column_values(column: Iterable[Any]) -> list[Any]:
+    """
+    Convert a column to a list of Python values.
+    """
+    dtype = getattr(column, "dtype", None)
+    if getattr(dtype, "kind", None) == "M":  # NumPy datetime64: convert to datetime objects rather than integers
+        column = column.astype("datetime64[us]")  # type: ignore[attr-defined]
+    if hasattr(column, "tolist"):  # NumPy arrays and pandas Series: convert to Python scalars in one call
+        return column.tolist()  # type: ignore[no-any-return]
+    return list(column)
+
+
+def _validate_column(name: str, values: Sequence[Any], lower: float | None, upper: float | None) -> None:
+    present = [value for value in values if value is not None]
+    if not present:
+        return
+    if (lower is not None and min(present) < lower) or (upper is not None and max(present) > upper):
+        row = next(
+            index
+            for index, value in enumerate(values)
+            if value is not None and ((lower is not None and value < lower) or (upper is not None and value > upper))
+        )
+        raise ValueError(f"Value {values[row]} in row {row} is out of range [{lower}, {upper}] for field {name}")
+
+
+def _resolve_columns(names: Iterable[str], column_map: Mapping[str, str] | None) -> dict[str, str]:
+    """
+    Map column names to ImageData field names.
+    """
+    column_map = column_map or {}
+    unknown = {name: field_name for name, field_name in column_map.items() if field_name not in ImageData.field_keys}
+    if unknown:
+        raise ValueError(f"Column map targets unknown ImageData fields: {unknown}")
+    resolved = {}
+    for name in names:
+        field_name = column_map.get(name) or ImageData.key_fields.get(name)
+        if field_name is None and name in ImageData.field_keys:
+            field_name = name
+        if field_name is not None:
+            resolved[name] = field_name
+    return resolved
+
+
+def items_from_columns(
+    columns: Mapping[str, Iterable[Any]],
+    filename_column: str = FILENAME_COLUMN,
+    column_map: Mapping[str, str] | None = None,
+    *,
+    validate: bool = True,
+    empty_strings: bool = True,
+) -> dict[str, list[ImageData]]:
+    """
+    Build image set items from columns of values.
+
+    Columns that match no ImageData field are ignored. Missing values (None, NaN and empty strings) leave the field
+    unset.
+
+    Args:
+        columns: Mapping of column name to values. Values may be any iterable, e.g. lists, NumPy arrays or Series.
+        filename_column: Name of the column holding the filename of each row.
+        column_map: Optional mapping of column name to ImageData field name, for columns named differently.
+        validate: Whether to check range constraints (e.g. latitude and longitude) over each whole column.
+        empty_strings: Whether empty strings count as missing values. Text formats such as CSV cannot distinguish
+            the two; typed sources can pass False to keep empty strings.
+
+    Returns:
+        Mapping of filename to image data entries, in order of first appearance. Rows sharing a filename become the
+        entries of one item, in row order.
+
+    Raises:
+        KeyError: If the filename column is missing.
+        ValueError: If the column map targets an unknown field, the columns have different lengths, or a value cannot
+            be converted or is out of range.
+    """
+    resolved = _resolve_columns(columns, column_map)
+    if filename_column not in columns:
+        raise KeyError(f"Missing filename column: {filename_column}")
+    filenames = [str(filename) for filename in column_values(columns[filename_column])]
+
+    dataclass_fields = {field.name: field for field in fields(ImageData)}  # type: ignore[arg-type]
+    converted: dict[str, list[Any]] = {}
+    for column_name, field_name in resolved.items():
+        if column_name == filename_column:
+            continue
+        values = column_values(columns[column_name])
+        if len(values) != len(filenames):
+            raise ValueError(f"Column {column_name} has {len(values)} values, expected {len(filenames)}")
+
+        field = dataclass_fields[field_name]
+        convert = _converter(field.type)
+        try:
+            converted[field_name] = [
+                None if is_missing(value, empty_strings=empty_strings) else convert(value) for value in values
+            ]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Could not convert column {column_name} to field {field_name}: {e}") from e
+        if validate:
+            _validate_column(field_name, converted[field_name], *_bounds(field.default))
+
+    # Construct the objects directly: every value has been converted and validated above. The defaults are shared
+    # between objects, which is safe since ImageData fields all default to immutable values.
+    defaults = {}
+    for name, field in dataclass_fields.items():
+        getter = default_getter(field)
+        defaults[name] = getter() if getter is not None else None
+    field_names = list(converted)
+    rows = zip(*converted.values(), strict=True) if converted else repeat((), len(filenames))
+    items: dict[str, list[ImageData]] = {}
+    for filename, row in zip(filenames, rows, strict=True):
+        image_data = object.__new__(ImageData)
+        state = image_data.__dict__
+        state.update(defaults)
+        state.update((name, value) for name, value in zip(field_names, row, strict=True) if value is not None)
+        items.setdefault(filename, []).append(image_data)
+    return items
+
+
+def items_from_csv(
+    path: str | Path,
+    filename_column: str = FILENAME_COLUMN,
+    column_map: Mapping[str, str] | None = None,
+    *,
+    validate: bool = True,
+    delimiter: str = ",",
+) -> dict[str, list[ImageData]]:
+    """
+    Build image set items from a CSV file with a header row.
+
+    Args:
+        path: Path to the CSV file.
+        filename_column: Name of the column holding the filename of each row.
+        column_map: Optional mapping of column name to ImageData field name, for columns named differently.
+        validate: Whether to check range constraints (e.g. latitude and longitude) over each whole column.
+        delimiter: Field delimiter.
+
+    Returns:
+        Mapping of filename to image data entries, as returned by items_from_columns.
+
+    Raises:
+        KeyError: If the filename column is missing.
+        ValueError: If the file is empty, or as raised by items_from_columns.
+    """
+    with Path(path).open(newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"Empty CSV file, expected a header row: {path}")
+        columns: list[list[str]] = [[] for _ in header]
+        for row in reader:
+            for column, value in zip(columns, row, strict=False):
+                column.append(value)
+    return items_from_columns(dict(zip(header, columns, strict=True)), filename_column, column_map, validate=validate)
+
+
+def items_from_dataframe(
+    df: "pd.DataFrame | pl.DataFrame",
+    filename_column: str = FILENAME_COLUMN,
+    column_map: Mapping[str, str] | None = None,
+    *,
+    validate: bool = True,
+) -> dict[str, list[ImageData]]:
+    """
+    Build image set items from a pandas or Polars DataFrame.
+
+    Args:
+        df: pandas.DataFrame or polars.DataFrame.
+        filename_column: Name of the column holding the filename of each row.
+        column_map: Optional mapping of column name to ImageData field name, for columns named differently.
+        validate: Whether to check range constraints (e.g. latitude and longitude) over each whole column.
+
+    Returns:
+        Mapping of filename to image data entries, as returned by items_from_columns.
+    """
+    return items_from_columns(dataframe_columns(df), filename_column, column_map, validate=validate)
+
+
+def dataframe_columns(df: "pd.DataFrame | pl.DataFrame") -> dict[str, Any]:
+    """
+    Get the columns of a pandas or Polars DataFrame.
+
+    Args:
+        df: pandas.DataFrame or polars.DataFrame.
+
+    Returns:
+        Mapping of column name to values (lists or NumPy arrays).
+    """
+    if hasattr(df, "get_column"):  # Polars
+        return {name: df.get_column(name).to_list() for name in df.columns}
+    return {name: df[name].to_numpy() for name in df.columns}  # pandas
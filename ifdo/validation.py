@@ -0,0 +1,164 @@
+"""
+Validation of iFDOs against the iFDO JSON schema.
+
+The iFDO schema and the provenance and annotation schemas it references ship with the package (in ifdo/schema).
+Building a jsonschema validator means loading the schemas and compiling the reference registry, so the validators are
+built once per process and cached.
+
+Rather than validating the whole document as one tree, the top level, the header and the image set items are validated
+separately, items in chunks. This attributes each error to its item, keeps the encoded form of only one chunk in memory
+at a time when validating serially, and lets chunks be validated in parallel worker processes (jsonschema is pure
+Python, so threads would not help). The top level is validated against the root schema with the header and items
+schemas replaced by placeholders, so its own constraints (such as required keys and additionalProperties) still apply.
+
+jsonschema is an optional dependency (pip install ifdo[schema]).
+
+Classes:
+    SchemaError: A schema violation.
+
+Functions:
+    load_schema: Load one of the packaged schemas.
+    validate: Validate an iFDO against the iFDO schema.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from importlib.resources import files
+from itertools import islice
+from json import loads
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from ifdo.models import iFDO
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+IFDO_SCHEMA = "ifdo-v2.1.0.json"
+REFERENCED_SCHEMAS = {
+    "https://marine-imaging.com/fair/schemas/provenance.json": "provenance-v0.1.0.json",
+    "https://marine-imaging.com/fair/schemas/annotation.json": "annotation-v2.0.0.json",
+}
+CHUNK_SIZE = 1000
+HEADER_KEY = "image-set-header"
+ITEMS_KEY = "image-set-items"
+
+
+class SchemaError(NamedTuple):
+    """
+    A schema violation.
+
+    Attributes:
+        item (str | None): Filename of the image set item with the violation, or None for the image set header and
+            the top level of the document.
+        path (str): JSON pointer to the offending value within the header or item, e.g. "/0/image-latitude". Top-level
+            violations are reported against the document root, e.g. "" for a missing top-level key.
+        message (str): Description of the violation.
+    """
+
+    item: str | None
+    path: str
+    message: str
+
+
+@cache
+def load_schema(name: str = IFDO_SCHEMA) -> dict[str, Any]:
+    """
+    Load one of the packaged schemas.
+
+    Args:
+        name: Filename of the schema, e.g. "ifdo-v2.1.0.json".
+
+    Returns:
+        The schema. Shared between calls: do not modify it.
+    """
+    schema: dict[str, Any] = loads((files("ifdo") / "schema" / name).read_text(encoding="utf-8"))
+    return schema
+
+
+@cache
+def _validators() -> tuple["Validator", "Validator", "Validator"]:
+    """
+    Build the top-level, header and item validators.
+    """
+    try:
+        from jsonschema import Draft202012Validator  # Optional dependency
+        from referencing import Registry, Resource  # Optional dependency
+    except ImportError as e:
+        raise ImportError("Schema validation requires jsonschema: pip install ifdo[schema]") from e
+
+    schema = load_schema()
+    registry = Registry().with_resources(
+        (uri, Resource.from_contents(load_schema(name))) for uri, name in REFERENCED_SCHEMAS.items()
+    )
+
+    def sub_validator(sub_schema: dict[str, Any]) -> "Validator":
+        # Keep the root identifier and definitions so that local and relative references still resolve
+        root = {key: schema[key] for key in ("$schema", "$id", "$defs")}
+        return Draft202012Validator({**root, **sub_schema}, registry=registry)
+
+    properties = schema["properties"]
+    # The header and items are validated on their own: accept anything for them at the top level
+    top_level = {**schema, "properties": {**properties, HEADER_KEY: True, ITEMS_KEY: True}}
+    return (
+        Draft202012Validator(top_level, registry=registry),
+        sub_validator(properties[HEADER_KEY]),
+        sub_validator(properties[ITEMS_KEY]),
+    )
+
+
+def _errors(validator: "Validator", instance: object, item: str | None) -> list[SchemaError]:
+    return [
+        SchemaError(item, "".join(f"/{part}" for part in error.absolute_path), error.message)
+        for error in validator.iter_errors(instance)
+    ]
+
+
+def _validate_chunk(chunk: dict[str, Any]) -> list[SchemaError]:
+    _, _, item_validator = _validators()
+    errors: list[SchemaError] = []
+    for filename, item in chunk.items():
+        errors.extend(
+            error._replace(path=error.path.removeprefix(f"/{filename}"))
+            for error in _errors(item_validator, {filename: item}, filename)
+        )
+    return errors
+
+
+def _chunks(ifdo: iFDO, chunk_size: int) -> Iterator[dict[str, Any]]:
+    items = iter(ifdo.image_set_items.items())
+    while chunk := list(islice(items, chunk_size)):
+        yield {
+            filename: [image_data.to_dict() for image_data in image_data_list] for filename, image_data_list in chunk
+        }
+
+
+def validate(ifdo: iFDO, chunk_size: int = CHUNK_SIZE, workers: int | None = None) -> list[SchemaError]:
+    """
+    Validate an iFDO against the iFDO schema.
+
+    Args:
+        ifdo: iFDO to validate.
+        chunk_size: Number of image set items to encode and validate at a time.
+        workers: Number of worker processes to validate chunks in parallel. By default, chunks are validated in the
+            current process.
+
+    Returns:
+        The schema violations, top-level and header violations first and then by item in image set order. Empty if the
+        iFDO is valid.
+
+    Raises:
+        ImportError: If jsonschema is not installed.
+    """
+    top_level_validator, header_validator, _ = _validators()
+    top_level = {HEADER_KEY: {}, ITEMS_KEY: {}, **ifdo.extras}  # Placeholders: validated below
+    errors = _errors(top_level_validator, top_level, None)
+    errors.extend(_errors(header_validator, ifdo.image_set_header.to_dict(), None))
+    if workers is None:
+        for chunk in _chunks(ifdo, chunk_size):
+            errors.extend(_validate_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_errors in executor.map(_validate_chunk, _chunks(ifdo, chunk_size)):
+                errors.extend(chunk_errors)
+    return errors
@@ -0,0 +1,167 @@
+"""
+Integrity verification of the files listed in an iFDO.
+
+verify() checks that every image set item exists under a root directory and that its contents match the item's
+image-hash-sha256, hashing files concurrently in a bounded thread pool with streaming reads (see ifdo.files). With a
+cache file, files whose size and modification time have not changed since they were last hashed are not read again,
+so re-verification only costs a stat() per unchanged file.
+
+The module can also be run from the command line:
+
+    ifdo-verify path/to/ifdo.yaml path/to/images --workers 16 --cache path/to/verify-cache.json
+
+Classes:
+    VerificationReport: Result of a verification.
+
+Functions:
+    verify: Verify the files listed in an iFDO against their hashes.
+    main: Command line entry point.
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ifdo.files import FileStateCache, hash_files, list_files
+from ifdo.models import iFDO
+from ifdo.scan import PHOTO_SUFFIXES, VIDEO_SUFFIXES
+
+
+@dataclass
+class VerificationReport:
+    """
+    Result of a verification. All lists hold image set item filenames (paths relative to the root), sorted.
+
+    Attributes:
+        verified (list[str]): Files that exist and match their hash.
+        missing (list[str]): Items whose file does not exist.
+        mismatched (list[str]): Files whose contents do not match their hash.
+        unreadable (list[str]): Files that exist but could not be read, e.g. for lack of permission.
+        unhashed (list[str]): Items without an image-hash-sha256. Their files are only checked for existence.
+        extra (list[str]): Image and video files under the root that are not image set items.
+    """
+
+    verified: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    mismatched: list[str] = field(default_factory=list)
+    unreadable: list[str] = field(default_factory=list)
+    unhashed: list[str] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether no files are missing, mismatched or unreadable.
+        """
+        return not self.missing and not self.mismatched and not self.unreadable
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the report to a dict of plain values.
+
+        Returns:
+            dict object
+        """
+        return asdict(self)
+
+
+def verify(
+    ifdo: iFDO,
+    root: str | Path,
+    workers: int | None = None,
+    cache_path: str | Path | None = None,
+    *,
+    find_extra: bool = True,
+    suffixes: Iterable[str] = PHOTO_SUFFIXES | VIDEO_SUFFIXES,
+) -> VerificationReport:
+    """
+    Verify the files listed in an iFDO against their image-hash-sha256.
+
+    The hash of an item is taken from its first entry that has one (video items usually set it on the first entry).
+
+    Args:
+        ifdo: iFDO to verify.
+        root: Directory that the image set item filenames are relative to.
+        workers: Maximum number of hashing threads.
+        cache_path: Optional path to a JSON cache of file sizes, modification times and hashes. Files that have not
+            changed since they were last hashed are not read again. The cache is updated after the verification.
+        find_extra: Whether to list files under root that are not image set items. Hidden files are ignored.
+        suffixes: File suffixes (with the leading dot) of the files to list as extra, e.g. not the iFDO file itself.
+
+    Returns:
+        The verification report.
+    """
+    root = Path(root)
+    report = VerificationReport()
+    expected_hashes = {}
+    for filename, image_data_list in ifdo.image_set_items.items():
+        path = root / filename
+        if not path.is_file():
+            report.missing.append(filename)
+            continue
+        expected = next((entry.image_hash_sha256 for entry in image_data_list if entry.image_hash_sha256), None)
+        if expected is None:
+            report.unhashed.append(filename)
+        else:
+            expected_hashes[filename] = expected.lower()
+
+    cache = FileStateCache(cache_path)
+    files = [(filename, root / filename) for filename in expected_hashes]
+    for filename, _, state in hash_files(files, cache, workers):
+        if isinstance(state, FileNotFoundError):  # Removed since it was checked
+            report.missing.append(filename)
+        elif isinstance(state, OSError):
+            report.unreadable.append(filename)
+        elif state.sha256 == expected_hashes[filename]:
+            report.verified.append(filename)
+        else:
+            report.mismatched.append(filename)
+    cache.save()
+
+    if find_extra:
+        report.extra = [filename for filename, _ in list_files(root, suffixes) if filename not in ifdo.image_set_items]
+    for filenames in (report.verified, report.missing, report.mismatched, report.unreadable, report.unhashed):
+        filenames.sort()
+    return report
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Verify the files listed in an iFDO file from the command line.
+
+    Args:
+        argv: Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        Exit status: 0 if no files are missing, mismatched or unreadable, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Verify image files against the hashes in an iFDO file.")
+    parser.add_argument("ifdo", type=Path, help="Path to the iFDO file")
+    parser.add_argument("root", type=Path, help="Directory that the image set item filenames are relative to")
+    parser.add_argument("--workers", type=int, default=None, help="Maximum number of hashing threads")
+    parser.add_argument("--cache", type=Path, default=None, help="Path to a cache file for incremental verification")
+    parser.add_argument("--no-extra", action="store_true", help="Do not list files that are not image set items")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    report = verify(iFDO.load(args.ifdo), args.root, args.workers, args.cache, find_extra=not args.no_extra)
+    if args.json:
+        json.dump(report.to_dict(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        for status in ("missing", "mismatched", "unreadable", "unhashed", "extra"):
+            for filename in getattr(report, status):
+                sys.stdout.write(f"{status}: {filename}\n")
+        sys.stdout.write(
+            f"{len(report.verified)} verified, {len(report.missing)} missing, {len(report.mismatched)} mismatched, "
+            f"{len(report.unreadable)} unreadable, {len(report.unhashed)} unhashed, {len(report.extra)} extra\n",
+        )
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
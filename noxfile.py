@@ -1,6 +1,26 @@
-from nox import session
+from nox import Session, session
 
 @session(python=["3.10", "3.11", "3.12", "3.13"])
 def tests(session):
     session.install("pytest", "jsonschema", ".")
     session.run("pytest")
+
+
+@session
+def benchmarks(session: Session) -> None:
+    """
+    Run the benchmark suite and store the results in .benchmarks for comparison across releases.
+
+    Sizes are set with IFDO_BENCHMARK_SIZES (e.g. 1000,100000,1000000). Extra arguments are passed to pytest, e.g.
+    `nox -s benchmarks -- --benchmark-compare` to compare against the last stored run.
+    """
+    session.install("pytest", "pytest-benchmark", "jsonschema", ".")
+    session.run(
+        "pytest",
+        "benchmarks",
+        "-o",
+        "python_files=bench_*.py",
+        "--benchmark-autosave",
+        "--benchmark-storage=.benchmarks",
+        *session.posargs,
+    )
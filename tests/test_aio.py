@@ -0,0 +1,38 @@
+import asyncio
+
+from ifdo import iFDO
+from ifdo.aio import aiter_items
+
+
+def test_aload_asave(tmp_path):
+    async def round_trip() -> tuple[iFDO, iFDO]:
+        ifdo = await iFDO.aload("tests/ifdo-video-example.json")
+        await ifdo.asave(tmp_path / "ifdo.yaml")
+        return ifdo, await iFDO.aload(tmp_path / "ifdo.yaml")
+
+    ifdo, reloaded = asyncio.run(round_trip())
+
+    assert ifdo == iFDO.load("tests/ifdo-video-example.json")
+    assert reloaded == ifdo
+
+
+def test_aiter_items():
+    async def collect() -> list:
+        return [item async for item in aiter_items("tests/ifdo-video-example.json", batch_size=1, chunk_size=100)]
+
+    items = asyncio.run(collect())
+
+    assert items == list(iFDO.load("tests/ifdo-video-example.json").image_set_items.items())
+
+
+def test_aiter_items_streams(tmp_path):
+    ifdo = iFDO.load("tests/ifdo-video-example.json")
+    ifdo.save(tmp_path / "ifdo.yaml")
+
+    async def first() -> tuple:
+        items = aiter_items(tmp_path / "ifdo.yaml", batch_size=1)
+        item = await anext(items)
+        await items.aclose()
+        return item
+
+    assert asyncio.run(first()) == next(iter(ifdo.image_set_items.items()))
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+from ifdo import iFDO
+from ifdo.cache import ParseCache
+
+
+def write_example(path: Path) -> None:
+    with open("tests/ifdo-video-example.json") as file:
+        path.write_text(file.read())
+
+
+def test_cached_load(tmp_path):
+    source = tmp_path / "ifdo.json"
+    write_example(source)
+    cache = ParseCache(tmp_path / "cache")
+
+    ifdo = iFDO.load(source, cache=cache)
+    assert len(list(cache.directory.iterdir())) == 1
+
+    cached = iFDO.load(source, cache=cache)
+    assert cached == ifdo
+    assert cached is not ifdo
+    assert not cached.is_dirty()
+
+
+def test_changed_source_invalidates(tmp_path):
+    source = tmp_path / "ifdo.json"
+    write_example(source)
+    cache = ParseCache(tmp_path / "cache")
+    key = cache.key(source)
+    iFDO.load(source, cache=cache)
+
+    d = json.loads(source.read_text())
+    d["image-set-header"]["image-set-name"] = "Renamed"
+    source.write_text(json.dumps(d))
+
+    assert cache.key(source) != key
+    assert iFDO.load(source, cache=cache).image_set_header.image_set_name == "Renamed"
+
+
+def test_eviction(tmp_path):
+    cache = ParseCache(tmp_path / "cache", max_bytes=150)
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"y" * 100)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"y" * 100
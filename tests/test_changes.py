@@ -0,0 +1,66 @@
+import json
+
+from ifdo import iFDO
+from ifdo.models import ImageContext, ImageData
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def test_loaded_items_are_clean():
+    ifdo = load_example()
+
+    assert not ifdo.is_dirty()
+    assert ifdo.changed_items() == []
+
+
+def test_changed_items():
+    ifdo = load_example()
+    filename = next(iter(ifdo.image_set_items))
+
+    ifdo.image_set_items[filename][1].image_latitude = 12.0
+    ifdo.image_set_items["new.JPG"] = [ImageData(image_uuid="c6b8d981-05c7-449f-85a9-906ab866bfb7")]
+
+    assert ifdo.changed_items() == [filename, "new.JPG"]
+    assert not ifdo.image_set_header.is_dirty()
+
+
+def test_nested_change_marks_parent_dirty():
+    ifdo = load_example()
+    ifdo.image_set_header.image_project.name = "Other project"
+
+    assert ifdo.image_set_header.is_dirty()
+    ifdo.mark_clean()
+    assert not ifdo.is_dirty()
+
+
+def test_fingerprint():
+    ifdo = load_example()
+    image_data = ifdo.image_set_items["SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"][0]
+    fingerprint = image_data.fingerprint()
+
+    assert fingerprint == ImageData.from_dict(image_data.to_dict()).fingerprint()
+
+    image_data.image_context = ImageContext("Context")
+    assert image_data.fingerprint() != fingerprint
+
+
+def test_extras_changes_mark_dirty():
+    ifdo = load_example()
+    image_data = next(iter(ifdo.image_set_items.values()))[0]
+    image_data.extras.get("x-score")  # Reading does not modify
+    assert not ifdo.is_dirty()
+
+    image_data.extras["x-score"] = 1
+    assert image_data.is_dirty()
+    ifdo.mark_clean()
+
+    image_data.extras.update({"x-other": 2})
+    assert ifdo.changed_items() == [next(iter(ifdo.image_set_items))]
+    ifdo.mark_clean()
+
+    del image_data.extras["x-score"]
+    assert ifdo.is_dirty()
+    assert image_data.to_dict()["x-other"] == 2
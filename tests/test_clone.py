@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.models import ImageContext
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def test_clone_shares_objects():
+    ifdo = load_example()
+    clone = ifdo.clone()
+
+    assert clone == ifdo
+    assert clone.image_set_header is ifdo.image_set_header
+    assert clone.image_set_items is not ifdo.image_set_items
+    assert clone.image_set_items[FILENAME] is not ifdo.image_set_items[FILENAME]
+    assert clone.image_set_items[FILENAME][0] is ifdo.image_set_items[FILENAME][0]
+    assert not clone.is_dirty()
+
+
+def test_update_item_copies_on_write():
+    ifdo = load_example()
+    original = ifdo.image_set_items[FILENAME][1]
+    clone = ifdo.clone()
+
+    updated = clone.update_item(FILENAME, 1, image_latitude=12.0)
+
+    assert updated is clone.image_set_items[FILENAME][1]
+    assert updated.image_latitude == 12.0
+    assert updated.image_datetime is original.image_datetime
+    assert ifdo.image_set_items[FILENAME][1] is original
+    assert original.image_latitude != 12.0
+    assert clone.changed_items() == [FILENAME]
+    assert ifdo.changed_items() == []
+
+
+def test_update_header():
+    ifdo = load_example()
+    clone = ifdo.clone()
+
+    clone.update_header(image_context=ImageContext("Other context"))
+
+    assert clone.image_set_header.image_context.name == "Other context"
+    assert ifdo.image_set_header.image_context.name != "Other context"
+    assert clone.image_set_header.image_project is ifdo.image_set_header.image_project
+
+
+def test_replace_unknown_field():
+    ifdo = load_example()
+
+    with pytest.raises(TypeError):
+        ifdo.image_set_header.replace(image_unknown=1)
+
+
+def test_replace_copies_extras():
+    ifdo = load_example()
+    image_data = ifdo.image_set_items[FILENAME][0]
+    image_data.extras["x-score"] = 1
+
+    replaced = image_data.replace(image_latitude=1.0)
+    replaced.extras["x-score"] = 2
+
+    assert image_data.extras["x-score"] == 1
+
+
+def test_subset_and_filter():
+    ifdo = load_example()
+    filenames = list(ifdo.image_set_items)
+
+    subset = ifdo.subset(filenames[1:])
+    assert list(subset.image_set_items) == filenames[1:]
+    assert len(ifdo.image_set_items) == len(filenames)
+
+    filtered = ifdo.filter(lambda filename, image_data_list: filename == FILENAME)
+    assert list(filtered.image_set_items) == [FILENAME]
+
+    with pytest.raises(KeyError):
+        ifdo.subset(["missing.JPG"])
+
+
+def test_saving_clone_keeps_original_changes(tmp_path):
+    ifdo = load_example()
+    ifdo.image_set_items[FILENAME][1].image_latitude = 12.0
+    clone = ifdo.clone()
+    updated = clone.update_item(FILENAME, 0, image_longitude=1.0)
+    subset = clone.subset([FILENAME])
+
+    subset.save(tmp_path / "subset.yaml")
+    clone.save(tmp_path / "clone.yaml")
+
+    assert ifdo.changed_items() == [FILENAME]
+    assert ifdo.image_set_items[FILENAME][1].is_dirty()
+    assert not updated.is_dirty()  # Owned by the clone
+    assert clone.changed_items() == [FILENAME]  # Still shares the modified entry
+
+    ifdo.save(tmp_path / "ifdo.yaml")
+    assert not ifdo.is_dirty()
+    assert not clone.is_dirty()
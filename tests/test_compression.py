@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.compression import detect_compression
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".zst"])
+def test_compressed_round_trip(tmp_path, suffix):
+    if suffix == ".zst":
+        pytest.importorskip("zstandard")
+    ifdo = iFDO.load("tests/ifdo-video-example.json")
+    path = tmp_path / f"ifdo.yaml{suffix}"
+
+    ifdo.save(path, compresslevel=1)
+
+    assert detect_compression(path) is not None
+    assert iFDO.load(path) == ifdo
+    assert asyncio.run(iFDO.aload(path)) == ifdo
+
+
+def test_compression_detected_from_content(tmp_path):
+    ifdo = iFDO.load("tests/ifdo-video-example.json")
+    ifdo.save(tmp_path / "ifdo.yaml.gz")
+    (tmp_path / "ifdo.yaml.gz").rename(tmp_path / "ifdo.yaml")
+
+    assert detect_compression(tmp_path / "ifdo.yaml") == "gzip"
+    assert iFDO.load(tmp_path / "ifdo.yaml") == ifdo
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.container import convert_from_container, convert_to_container, iFDOContainer, write_container
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def test_container_get(tmp_path):
+    ifdo = load_example()
+    path = tmp_path / "ifdo.ifdopack"
+    write_container(ifdo, path)
+
+    with iFDOContainer(path) as container:
+        assert len(container) == len(ifdo.image_set_items)
+        assert FILENAME in container
+        assert container.get(FILENAME) == ifdo.image_set_items[FILENAME]
+        assert container.get("missing.JPG") is None
+        assert container.image_set_header == ifdo.image_set_header
+        assert container.to_ifdo() == ifdo
+
+
+def test_container_conversion(tmp_path):
+    convert_to_container("tests/ifdo-video-example.json", tmp_path / "ifdo.ifdopack")
+    convert_from_container(tmp_path / "ifdo.ifdopack", tmp_path / "ifdo.yaml")
+
+    assert iFDO.load(tmp_path / "ifdo.yaml") == load_example()
+
+
+def test_not_a_container(tmp_path):
+    path = tmp_path / "ifdo.json"
+    path.write_text("{" + " " * 64 + "}")
+
+    with pytest.raises(ValueError):
+        iFDOContainer(path)
+
+
+def test_container_extras(tmp_path):
+    ifdo = load_example()
+    ifdo.extras["$schema"] = "https://marine-imaging.com/fair/schemas/ifdo-v2.1.0.json"
+    ifdo.extras["custom-key"] = {"nested": [1, 2]}
+    path = tmp_path / "ifdo.ifdopack"
+    write_container(ifdo, path)
+
+    with iFDOContainer(path) as container:
+        assert container.extras == ifdo.extras
+        assert container.to_ifdo().to_dict() == ifdo.to_dict()
+
+
+def test_container_lookup(tmp_path):
+    ifdo = load_example()
+    image_data = ifdo.image_set_items[FILENAME]
+    ifdo = ifdo.with_items({f"image-{i}.JPG": image_data for i in range(100)})
+    path = tmp_path / "ifdo.ifdopack"
+    write_container(ifdo, path)
+
+    with iFDOContainer(path) as container:
+        assert list(container) == list(ifdo.image_set_items)
+        assert all(container.get(f"image-{i}.JPG") == image_data for i in range(100))
+        assert "image-100.JPG" not in container
+        assert 1 not in container
+
+
+def test_empty_container(tmp_path):
+    ifdo = load_example().with_items({})
+    path = tmp_path / "ifdo.ifdopack"
+    write_container(ifdo, path)
+
+    with iFDOContainer(path) as container:
+        assert len(container) == 0
+        assert container.get(FILENAME) is None
+        assert container.to_ifdo() == ifdo
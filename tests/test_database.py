@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+
+from ifdo import iFDO
+from ifdo.database import Database
+from ifdo.models import AnnotationLabel, ImageAnnotation, ImageData
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def test_import_export():
+    ifdo = load_example()
+    ifdo.image_set_items[FILENAME][0].image_annotations = [
+        ImageAnnotation(coordinates=[0.0, 0.0], labels=[AnnotationLabel(label="fish", annotator="kevin")]),
+    ]
+
+    with Database(":memory:") as db:
+        db.import_ifdo(ifdo)
+        db.import_ifdo(ifdo)  # Re-import replaces the image set
+
+        assert db.image_sets() == [(ifdo.image_set_header.image_set_uuid, ifdo.image_set_header.image_set_name)]
+        assert db.export_ifdo(ifdo.image_set_header.image_set_uuid) == ifdo
+
+
+def test_query():
+    ifdo = load_example()
+    ifdo.image_set_items[FILENAME][1].image_annotations = [
+        ImageAnnotation(coordinates=[0.0, 0.0], labels=[AnnotationLabel(label="fish", annotator="kevin")]),
+    ]
+
+    with Database(":memory:") as db:
+        db.import_ifdo(ifdo)
+
+        results = list(db.query(filename=FILENAME, page_size=1))
+        assert [image_data for _, image_data in results] == ifdo.image_set_items[FILENAME]
+
+        results = list(db.query(label="fish"))
+        assert results == [(FILENAME, ifdo.image_set_items[FILENAME][1])]
+
+        results = list(db.query(start=datetime(2019, 3, 4, 8, 37, 25), end=datetime(2019, 3, 4, 8, 37, 26)))
+        assert [image_data.image_datetime for _, image_data in results] == [datetime(2019, 3, 4, 8, 37, 25)]
+
+        assert list(db.query(bbox=(0.0, 0.0, 1.0, 1.0))) == []
+
+
+def test_query_large_page():
+    ifdo = load_example()
+    annotations = [ImageAnnotation(coordinates=[0.0, 0.0], labels=[AnnotationLabel(label="fish", annotator="kevin")])]
+    ifdo.image_set_items = {
+        f"{index}.jpg": [ImageData(image_annotations=annotations if index % 3 == 0 else None)] for index in range(1200)
+    }
+
+    with Database(":memory:") as db:
+        db.import_ifdo(ifdo)
+
+        results = list(db.query(label="fish", page_size=1100))  # More ids than SQLite binds per statement
+        assert [filename for filename, _ in results] == [f"{index}.jpg" for index in range(0, 1200, 3)]
+        assert all(image_data.image_annotations == annotations for _, image_data in results)
+
+
+def test_query_inherited():
+    ifdo = load_example()
+    first, frame = ifdo.image_set_items[FILENAME]
+    frame.image_latitude = frame.image_longitude = None  # Inherited from the first entry
+    for image_data_list in ifdo.image_set_items.values():
+        for image_data in image_data_list:
+            image_data.image_datetime = None  # Inherited from the header
+    ifdo.image_set_header.image_datetime = datetime(2019, 3, 4, 8, 37, 24)
+
+    with Database(":memory:") as db:
+        db.import_ifdo(ifdo)
+
+        results = list(db.query(uuid=first.image_uuid))
+        assert results == [(FILENAME, first), (FILENAME, frame)]
+
+        latitude, longitude = first.image_latitude, first.image_longitude
+        results = list(db.query(bbox=(latitude, longitude, latitude, longitude)))
+        assert results == [(FILENAME, first), (FILENAME, frame)]
+
+        results = list(db.query(start=datetime(2019, 3, 4, 8, 37, 24), end=datetime(2019, 3, 4, 8, 37, 25)))
+        assert len(results) == 4
+        assert db.export_ifdo(ifdo.image_set_header.image_set_uuid) == ifdo  # Stored as imported
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.dataframe import to_columns
+from ifdo.models import ImageCameraPose, ImageContext
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def load_example() -> iFDO:
+    ifdo = iFDO.load("tests/ifdo-video-example.json")
+    image_data = ifdo.image_set_items[FILENAME][0]
+    image_data.image_context = ImageContext("Context", uri="https://example.com")
+    image_data.image_camera_pose = ImageCameraPose(
+        pose_utm_zone="11",
+        pose_utm_epsg="32611",
+        pose_utm_east_north_up_meters=[1.0, 2.0, 3.0],
+        pose_absolute_orientation_utm_matrix=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+    )
+    return ifdo
+
+
+def test_to_columns():
+    ifdo = load_example()
+    columns = to_columns(ifdo)
+    n_rows = sum(len(image_data_list) for image_data_list in ifdo.image_set_items.values())
+
+    assert all(len(values) == n_rows for values in columns.values())
+    assert columns["image-filename"][:2] == [FILENAME, FILENAME]
+    assert columns["image-context.name"][:2] == ["Context", None]
+    assert columns["image-camera-pose.pose-utm-zone"][0] == "11"
+    assert columns["image-datetime"][1] == datetime(2019, 3, 4, 8, 37, 25)
+
+
+def test_inherit_header():
+    ifdo = load_example()
+    columns = to_columns(ifdo, inherit_header=True)
+
+    assert columns["image-context.name"][:2] == ["Context", "Context"]
+    assert columns["image-project.name"][0] == ifdo.image_set_header.image_project.name
+    assert "image-set-name" not in columns
+
+
+@pytest.mark.parametrize("library", ["pandas", "polars"])
+def test_dataframe_round_trip(library):
+    pytest.importorskip(library)
+    ifdo = load_example()
+
+    df = ifdo.to_pandas() if library == "pandas" else ifdo.to_polars()
+    result = iFDO.from_dataframe(df, ifdo.image_set_header)
+
+    assert result.image_set_items == ifdo.image_set_items
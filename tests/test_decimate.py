@@ -0,0 +1,124 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.decimate import decimate, decimate_frames
+from ifdo.models import AnnotationLabel, ImageAnnotation, ImageData
+
+START = datetime(2019, 3, 4, 8, 37, 24)
+
+
+def annotation() -> list[ImageAnnotation]:
+    return [ImageAnnotation(coordinates=[0.0, 0.0], labels=[AnnotationLabel(label="fish", annotator="me")])]
+
+
+def make_video(frames: int = 20) -> list[ImageData]:
+    """
+    A video at 5 frames per second. The first entry holds the defaults; frames 7 and 13 are annotated.
+    """
+    entries = [
+        ImageData(
+            image_datetime=START,
+            image_latitude=10.0,
+            image_longitude=20.0,
+            image_altitude_meters=-100.0,
+            image_hash_sha256="ab" * 32,
+        )
+    ]
+    for frame in range(1, frames):
+        entries.append(
+            ImageData(
+                image_datetime=START + timedelta(seconds=frame / 5),
+                image_altitude_meters=-100.0 - frame,  # Descending 1 m per frame
+                image_annotations=annotation() if frame in (7, 13) else None,
+            )
+        )
+    return entries
+
+
+def test_decimate_by_interval():
+    video = make_video()
+    kept = decimate_frames(video, interval=1.0)
+    assert [entry.image_datetime for entry in kept] == [START + timedelta(seconds=s) for s in range(4)]
+    assert kept[0] is video[0]  # Shared, and still holds the defaults
+    assert kept[1] is video[5]
+
+
+def test_decimate_by_distance():
+    kept = decimate_frames(make_video(), min_distance=4.5)
+    assert [entry.image_altitude_meters for entry in kept] == [-100.0, -105.0, -110.0, -115.0]
+
+
+def test_decimate_combines_criteria():
+    kept = decimate_frames(make_video(), interval=0.9, annotated=True)
+    # The interval counts from the last kept frame, annotated or not
+    assert [entry.image_datetime for entry in kept] == [
+        START + timedelta(seconds=frame / 5) for frame in (0, 5, 7, 12, 13, 18)
+    ]
+
+
+def test_dropped_first_entry_defaults_are_merged():
+    video = make_video()
+    kept = decimate_frames(video, annotated=True)
+    assert len(kept) == 2
+    first, second = kept
+    # The old defaults, with the frame's own values
+    assert first.image_hash_sha256 == "ab" * 32
+    assert first.image_latitude == 10.0
+    assert first.image_datetime == START + timedelta(seconds=7 / 5)
+    assert first.image_altitude_meters == -107.0
+    assert first.image_annotations == video[7].image_annotations
+    # Fields the second frame set itself are kept; no field is wrongly inherited
+    assert second.image_altitude_meters == -113.0
+    assert second.image_datetime == START + timedelta(seconds=13 / 5)
+    assert second is video[13]
+    assert not video[0].image_annotations  # The source is unchanged
+
+
+def test_rebase_restores_old_defaults():
+    video = [
+        ImageData(image_datetime=START, image_altitude_meters=-100.0),
+        ImageData(image_altitude_meters=-90.0, image_annotations=annotation()),
+        ImageData(image_annotations=annotation()),  # Inherits -100 from the first entry
+    ]
+    kept = decimate_frames(video, annotated=True)
+    assert kept[0].image_altitude_meters == -90.0
+    assert kept[1].image_altitude_meters == -100.0  # Set explicitly, since the new first entry has -90
+    assert video[2].image_altitude_meters is None
+
+
+def test_decimate_ifdo():
+    with open("tests/ifdo-video-example.json") as file:
+        ifdo = iFDO.from_dict(json.load(file))
+    ifdo.image_set_items["video.mp4"] = make_video()
+    ifdo.image_set_items["empty.mp4"] = make_video(3)[1:]  # No frame is annotated
+    ifdo.image_set_items["photo.jpg"] = [ImageData(image_datetime=START)]
+
+    reduced = decimate(ifdo, annotated=True)
+    assert "empty.mp4" not in reduced.image_set_items
+    assert len(reduced.image_set_items["video.mp4"]) == 2
+    assert reduced.image_set_items["photo.jpg"] == ifdo.image_set_items["photo.jpg"]
+    assert len(ifdo.image_set_items["video.mp4"]) == 20  # The source is unchanged
+
+
+def test_decimate_requires_a_criterion():
+    with pytest.raises(ValueError):
+        decimate_frames(make_video())
+
+
+def test_rebase_sparse_first_entry():
+    video = [
+        ImageData(image_datetime=START),
+        ImageData(image_latitude=5.0, image_longitude=1.0, image_annotations=annotation()),
+        ImageData(image_annotations=annotation()),  # Inherits no position
+    ]
+    kept = decimate_frames(video, annotated=True)
+    assert kept == video  # The sparse first entry is kept, so the last frame still inherits no position
+
+    with open("tests/ifdo-video-example.json") as file:
+        header = iFDO.from_dict(json.load(file)).image_set_header.replace(image_latitude=2.0, image_longitude=3.0)
+    kept = decimate_frames(video, annotated=True, header=header)
+    assert [(entry.image_latitude, entry.image_longitude) for entry in kept] == [(5.0, 1.0), (2.0, 3.0)]
+    assert video[2].image_latitude is None
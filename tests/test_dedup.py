@@ -0,0 +1,116 @@
+import gzip
+import json
+from hashlib import sha256
+
+from yaml import safe_dump
+
+from ifdo import dedup, iFDO
+from ifdo.dedup import DedupIndex, Match, iter_file_items
+from ifdo.models import ImageData
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+HASH_A = sha256(b"a").hexdigest()
+HASH_B = sha256(b"b").hexdigest()
+UUID_A = "c6b8d981-05c7-449f-85a9-906ab866bfb6"
+UUID_B = "c6b8d981-05c7-449f-85a9-906ab866bfb7"
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def make_archive(tmp_path):
+    first = {
+        "image-set-items": {
+            "a.jpg": {"image-hash-sha256": HASH_A, "image-uuid": UUID_A, "image-altitude-meters": -10.0},
+            "b.jpg": [{"image-hash-sha256": HASH_B, "image-uuid": UUID_B}, {"image-datetime": "2019-03-04"}],
+        }
+    }
+    second = {
+        "image-set-items": {
+            "copy-of-a.jpg": {"image-hash-sha256": HASH_A, "image-uuid": UUID_A, "image-altitude-meters": -12.0},
+            "b.jpg": {"image-hash-sha256": HASH_B, "image-uuid": UUID_A},
+        }
+    }
+    (tmp_path / "first.json").write_text(json.dumps(first))
+    with gzip.open(tmp_path / "second.yaml.gz", "wt") as f:
+        safe_dump(second, f, sort_keys=False)
+    return tmp_path / "first.json", tmp_path / "second.yaml.gz"
+
+
+def test_duplicates_and_conflicts(tmp_path):
+    first, second = make_archive(tmp_path)
+    with DedupIndex(tmp_path / "dedup.sqlite") as index:
+        with index.bulk():
+            assert index.add_file(first, "first") == 2
+            assert index.add_file(second, "second") == 2
+
+        assert list(index.duplicates()) == sorted(
+            [
+                Match("hash", HASH_A, [("first", "a.jpg"), ("second", "copy-of-a.jpg")]),
+                Match("hash", HASH_B, [("first", "b.jpg"), ("second", "b.jpg")]),
+            ],
+            key=lambda match: match.key,
+        )
+        assert list(index.duplicates(by="uuid")) == [
+            Match("uuid", UUID_A, [("first", "a.jpg"), ("second", "copy-of-a.jpg"), ("second", "b.jpg")]),
+        ]
+        assert list(index.conflicts()) == [
+            Match("hash-uuid", HASH_B, [("first", "b.jpg"), ("second", "b.jpg")]),
+            Match("uuid-hash", UUID_A, [("first", "a.jpg"), ("second", "copy-of-a.jpg"), ("second", "b.jpg")]),
+            Match("metadata", HASH_A, [("first", "a.jpg"), ("second", "copy-of-a.jpg")]),
+        ]
+        assert index.lookup(uuid=UUID_B) == [("first", "b.jpg")]
+
+
+def test_reingest_replaces_source(tmp_path):
+    first, _ = make_archive(tmp_path)
+    with DedupIndex(":memory:") as index:
+        index.add_file(first, "first")
+        index.add_file(first, "first")
+
+        assert index.sources() == ["first"]
+        assert list(index.duplicates()) == []
+
+
+def test_add_ifdo():
+    ifdo = load_example()
+    with DedupIndex(":memory:") as index:
+        index.add_ifdo(ifdo)
+        clone = ifdo.clone()
+        clone.image_set_items["copy.JPG"] = [ImageData(image_uuid="not-a-uuid")]
+        index.add_ifdo(clone, "clone")
+
+        uuid = ifdo.image_set_items[FILENAME][0].image_uuid
+        assert index.lookup(uuid=uuid) == [(ifdo.image_set_header.image_set_uuid, FILENAME), ("clone", FILENAME)]
+        assert index.lookup(uuid="not-a-uuid") == [("clone", "copy.JPG")]
+        assert list(index.conflicts()) == []
+
+
+def test_other_keys_are_stored_as_text():
+    md5 = "d41d8cd98f00b204e9800998ecf8427e"
+    with DedupIndex(":memory:") as index:
+        index.add_items("first", [("a.jpg", {"image-hash-sha256": md5, "image-uuid": "legacy-id-000001"})])
+        index.add_items("second", [("a.jpg", {"image-hash-sha256": md5, "image-uuid": "legacy-id-000001"})])
+
+        assert list(index.duplicates()) == [Match("hash", md5, [("first", "a.jpg"), ("second", "a.jpg")])]
+        assert list(index.duplicates(by="uuid")) == [
+            Match("uuid", "legacy-id-000001", [("first", "a.jpg"), ("second", "a.jpg")])
+        ]
+        assert index.lookup(hash=md5) == [("first", "a.jpg"), ("second", "a.jpg")]
+
+
+def test_add_file_streams_items(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedup, "READ_SIZE", 7)  # Values span many reads
+    items = {
+        "a.jpg": {"image-hash-sha256": HASH_A, "image-altitude-meters": -10.5, "x-note": 'with "}" and \\"{'},
+        "b.jpg": [{"image-hash-sha256": HASH_B}, {"image-datetime": "2019-03-04"}],
+    }
+    document = {"image-set-header": {"image-set-name": "before"}, "image-set-items": items, "x-trailer": [1, {}]}
+    (tmp_path / "items.json").write_text(json.dumps(document, indent=2))
+    with gzip.open(tmp_path / "items.yaml.gz", "wt") as f:
+        safe_dump(document, f, sort_keys=False)
+
+    assert list(iter_file_items(tmp_path / "items.json")) == list(items.items())
+    assert list(iter_file_items(tmp_path / "items.yaml.gz")) == list(items.items())
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.model import enum_report, strict_enums
+from ifdo.models import ImageData, ImageIllumination, ImageScaleReference, ImageSpectralResolution
+
+
+def test_normalized_values():
+    image_data = ImageData.from_dict(
+        {
+            "image-scale-reference": "Laser-Marker",
+            "image-illumination": " artificial_light ",
+            "image-spectral-resolution": "MULTI SPECTRAL",
+        },
+    )
+
+    assert image_data.image_scale_reference is ImageScaleReference.LASER_MARKER
+    assert image_data.image_illumination is ImageIllumination.ARTIFICIAL_LIGHT
+    assert image_data.image_spectral_resolution is ImageSpectralResolution.MULTI_SPECTRAL
+
+
+def test_invalid_value_is_lenient_by_default():
+    image_data = ImageData.from_dict({"image-illumination": "moonlight"})
+
+    assert image_data.image_illumination is None
+    assert image_data.extras == {"image-illumination": "moonlight"}
+
+
+def test_strict_enums():
+    with strict_enums(), pytest.raises(ValueError):
+        ImageData.from_dict({"image-illumination": "moonlight"})
+
+
+def test_load_invalid_value(tmp_path):
+    with open("tests/ifdo-video-example.json") as file:
+        d = json.load(file)
+    filename = next(iter(d["image-set-items"]))
+    d["image-set-items"][filename][0]["image-illumination"] = "moonlight"
+    path = tmp_path / "ifdo.json"
+    path.write_text(json.dumps(d))
+
+    ifdo = iFDO.load(path)
+    image_data = ifdo.image_set_items[filename][0]
+    assert image_data.image_illumination is None
+    assert ifdo.to_dict()["image-set-items"][filename][0]["image-illumination"] == "moonlight"
+    with pytest.raises(ValueError):
+        iFDO.load(path, strict=True)
+
+
+def test_enum_report():
+    with enum_report() as report:
+        image_data = ImageData.from_dict({"image-illumination": "moonlight", "image-scale-reference": "Laser marker"})
+
+    assert image_data.image_illumination is None
+    assert image_data.image_scale_reference is ImageScaleReference.LASER_MARKER
+    assert image_data.to_dict() == {"image-scale-reference": "laser marker", "image-illumination": "moonlight"}
+    assert report.invalid == {("ImageIllumination", "image-illumination", "moonlight"): 1}
+    assert report.normalized == {("ImageScaleReference", "Laser marker", "laser marker"): 1}
@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+
+def test_import_is_lazy():
+    code = "import sys, ifdo; assert not {'pydantic', 'yaml', 'ifdo.models'} & set(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes():
+    import ifdo
+    from ifdo.models import iFDO
+
+    assert ifdo.iFDO is iFDO
+    assert ifdo.models.iFDO is iFDO
@@ -0,0 +1,153 @@
+import json
+import shutil
+import stat
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from ifdo import iFDO, journal
+from ifdo.journal import StaleJournalError, append_items, compact, journal_path, load
+from ifdo.models import ImageData
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def copy_example(tmp_path):
+    path = tmp_path / "ifdo.json"
+    shutil.copy("tests/ifdo-video-example.json", path)
+    return path
+
+
+def frame(second: int) -> ImageData:
+    return ImageData(image_datetime=datetime(2019, 3, 4, 8, 40, second), image_altitude_meters=-4000.0)
+
+
+def test_append_does_not_modify_file(tmp_path):
+    path = copy_example(tmp_path)
+    before = path.read_bytes()
+    append_items(path, {FILENAME: [frame(1)]})
+    assert path.read_bytes() == before
+    assert journal_path(path).name == "ifdo.json.journal"
+
+
+def test_load_applies_journal(tmp_path):
+    path = copy_example(tmp_path)
+    base = iFDO.load(path)
+    frames = len(base.image_set_items[FILENAME])
+
+    append_items(path, {FILENAME: [frame(1), frame(2)]})
+    append_items(path, {"new.jpg": [frame(3)]})
+    ifdo = load(path)
+
+    assert len(ifdo.image_set_items[FILENAME]) == frames + 2
+    assert ifdo.image_set_items[FILENAME][-1].image_datetime == datetime(2019, 3, 4, 8, 40, 2)
+    assert list(ifdo.image_set_items)[-1] == "new.jpg"
+    assert ifdo.image_set_items["new.jpg"][0].image_altitude_meters == -4000.0
+
+
+def test_torn_last_line_is_ignored_and_cut(tmp_path):
+    path = copy_example(tmp_path)
+    append_items(path, {"a.jpg": [frame(1)]})
+    with journal_path(path).open("ab") as f:
+        f.write(b'{"image-set-items":{"torn.jpg":[{"image-da')  # Crash mid-write
+    assert "torn.jpg" not in load(path).image_set_items
+
+    append_items(path, {"b.jpg": [frame(2)]})
+    items = load(path).image_set_items
+    assert "a.jpg" in items
+    assert "b.jpg" in items
+    assert "torn.jpg" not in items
+
+
+def test_compact(tmp_path):
+    path = copy_example(tmp_path)
+    append_items(path, {FILENAME: [frame(1)], "new.jpg": [frame(2)]})
+    expected = load(path).to_dict()
+
+    assert compact(path) == 1
+    assert not journal_path(path).exists()
+    assert json.loads(path.read_text()) == expected  # Still JSON
+    assert compact(path) == 0
+
+
+def test_compact_yaml(tmp_path):
+    path = tmp_path / "ifdo.yaml.gz"
+    iFDO.load("tests/ifdo-video-example.json").save(path)
+    append_items(path, {"new.jpg": [frame(1)]})
+    compact(path)
+    assert "new.jpg" in iFDO.load(path).image_set_items
+    assert not list(tmp_path.glob(".*"))  # No temporary file left behind
+
+
+def test_merged_journal_is_ignored(tmp_path, monkeypatch):
+    path = copy_example(tmp_path)
+    append_items(path, {"new.jpg": [frame(1)]})
+    merge = journal._merge
+    left_behind = []
+
+    def merge_and_crash(*args):
+        merge(*args)
+        left_behind.append(journal_path(path).read_bytes())
+
+    monkeypatch.setattr(journal, "_merge", merge_and_crash)
+    compact(path)
+    monkeypatch.undo()
+
+    # Crash after replacing the file but before removing the journal
+    journal_path(path).write_bytes(left_behind[0])
+    ifdo = load(path)
+    assert len(ifdo.image_set_items["new.jpg"]) == 1
+
+    append_items(path, {"other.jpg": [frame(2)]})
+    ifdo = load(path)
+    assert len(ifdo.image_set_items["new.jpg"]) == 1
+    assert "other.jpg" in ifdo.image_set_items
+
+
+def test_compact_keeps_permissions(tmp_path):
+    path = copy_example(tmp_path)
+    path.chmod(0o644)
+    append_items(path, {"new.jpg": [frame(1)]})
+    compact(path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+
+def test_append_during_compact_is_kept(tmp_path, monkeypatch):
+    path = copy_example(tmp_path)
+    append_items(path, {"new.jpg": [frame(1)]})
+    appender = threading.Thread(target=append_items, args=(path, {"late.jpg": [frame(2)]}))
+
+    def load_and_append(path):
+        ifdo = load(path)
+        appender.start()
+        time.sleep(0.2)  # The append waits for the lock on the journal
+        return ifdo
+
+    monkeypatch.setattr(journal, "load", load_and_append)
+    assert compact(path) == 1
+    appender.join()
+    monkeypatch.undo()
+
+    assert "new.jpg" in iFDO.load(path).image_set_items
+    assert "late.jpg" in load(path).image_set_items
+
+
+def test_modified_file_with_unmerged_journal(tmp_path):
+    path = copy_example(tmp_path)
+    append_items(path, {"new.jpg": [frame(1)]})
+    before = journal_path(path).read_bytes()
+    iFDO.load(path).save(path)  # Rewritten without merging the journal
+
+    with pytest.raises(StaleJournalError):
+        append_items(path, {"other.jpg": [frame(2)]})
+    with pytest.raises(StaleJournalError):
+        load(path)
+    with pytest.raises(StaleJournalError):
+        compact(path)
+    assert journal_path(path).read_bytes() == before  # The unmerged items are kept
+
+    journal_path(path).unlink()
+    append_items(path, {"other.jpg": [frame(2)]})
+    assert "other.jpg" in load(path).image_set_items
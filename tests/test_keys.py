@@ -0,0 +1,72 @@
+import json
+
+from ifdo import iFDO
+from ifdo.models import ImageData, ImageSetHeader
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def test_key_tables():
+    assert ImageData.field_keys["image_hash_sha256"] == "image-hash-sha256"
+    assert ImageData.key_fields["image-hash-sha256"] == "image_hash_sha256"
+    assert ImageData.key_fields["image-area-square-meters"] == "image_area_square_meter"
+    assert "image-set-name" in ImageSetHeader.key_fields
+    assert "image-set-name" not in ImageData.key_fields
+
+
+def test_aliases_and_unknown_keys():
+    with open("tests/ifdo-video-example.json") as file:
+        ifdo = iFDO.from_dict(json.load(file))
+    image_data = ifdo.image_set_items[FILENAME][0]
+
+    assert image_data.image_area_square_meter == 21.6994
+    assert image_data.image_mpeg7_colorstatistics is not None
+    assert image_data.unknown_keys() == ()
+    assert ifdo.unknown_keys() == ("$schema",)
+    assert "image-area-square-meters" in image_data.to_dict()  # The schema spelling
+    assert ImageData.from_dict({"image-area-square-meter": 1.0}).to_dict() == {"image-area-square-meters": 1.0}
+
+
+def test_canonical_key_takes_precedence():
+    d = {"image-area-square-meters": 1.0, "image-area-square-meter": 2.0}
+
+    assert ImageData.from_dict(d).image_area_square_meter == 1.0
+    assert ImageData.from_dict(dict(reversed(d.items()))).image_area_square_meter == 1.0
+
+
+def test_schema_keys_round_trip():
+    with open("tests/ifdo-video-example.json") as file:
+        d = json.load(file)
+    result = iFDO.from_dict(d).to_dict()
+
+    for filename, entries in d["image-set-items"].items():
+        for entry, result_entry in zip(entries, result["image-set-items"][filename], strict=True):
+            assert set(result_entry) == set(entry)
+    keys = set(result["image-set-items"][FILENAME][0])
+    assert {"image-area-square-meters", "image-mpeg7-colorstatistic"} <= keys
+
+
+def test_none_uses_default():
+    assert ImageData.from_dict({"image-latitude": None}).image_latitude is None
+
+
+def test_extras_round_trip():
+    with open("tests/ifdo-video-example.json") as file:
+        d = json.load(file)
+    d["image-set-items"][FILENAME][0]["x-partner-field"] = {"nested": [1, 2]}
+    ifdo = iFDO.from_dict(d)
+    image_data = ifdo.image_set_items[FILENAME][0]
+
+    assert image_data.extras == {"x-partner-field": {"nested": [1, 2]}}
+    assert "_ifdo_extras" not in ifdo.image_set_items[FILENAME][1].__dict__
+
+    result = ifdo.to_dict()
+    assert result["$schema"] == d["$schema"]
+    assert result["image-set-items"][FILENAME][0]["x-partner-field"] == {"nested": [1, 2]}
+
+
+def test_extras_assignment():
+    image_data = ImageData()
+    image_data.extras["x-partner-field"] = 1
+
+    assert image_data.to_dict() == {"x-partner-field": 1}
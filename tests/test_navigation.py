@@ -0,0 +1,85 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from ifdo import iFDO
+
+np = pytest.importorskip("numpy")
+
+from ifdo.navigation import NavigationTrack, fill_navigation  # noqa: E402
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+START = datetime(2019, 3, 4, 8, 37, 20)
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def make_track(**kwargs) -> NavigationTrack:
+    times = [START + timedelta(seconds=seconds) for seconds in (0, 10, 20, 30)]
+    return NavigationTrack(
+        times,
+        image_latitude=[11.0, 11.001, 11.002, 11.003],
+        image_longitude=[-117.0, -117.0, -117.0, -117.0],
+        image_altitude_meters=[-1000.0, -1010.0, -1020.0, -1030.0],
+        image_camera_yaw_degrees=[350.0, 10.0, 30.0, 50.0],
+        **kwargs,
+    )
+
+
+def test_interpolate():
+    track = make_track()
+    values, uncertainty = track.interpolate([START + timedelta(seconds=5), START + timedelta(seconds=10)])
+
+    assert values["image_latitude"].tolist() == pytest.approx([11.0005, 11.001])
+    assert values["image_altitude_meters"].tolist() == pytest.approx([-1005.0, -1010.0])
+    assert values["image_camera_yaw_degrees"].tolist() == pytest.approx([0.0, 10.0])  # Through north, not south
+    assert uncertainty[0] == pytest.approx(0.5 * 111.2, rel=0.01)  # Half of the segment of 0.001 degrees latitude
+    assert uncertainty[1] == 0.0
+
+
+def test_interpolate_outside_and_gaps():
+    times = [START, START + timedelta(seconds=1), START + timedelta(seconds=60)]
+    track = NavigationTrack(times, image_latitude=[1.0, 2.0, 3.0], image_longitude=[1.0, 1.0, None])
+    values, uncertainty = track.interpolate(
+        [START - timedelta(seconds=1), START + timedelta(seconds=30), START + timedelta(seconds=60)], max_gap=10
+    )
+
+    assert np.isnan(values["image_latitude"][:2]).all()
+    assert values["image_latitude"][2] == 3.0
+    assert np.isnan(values["image_longitude"][2])  # Missing fixes are skipped per column
+    assert np.isnan(uncertainty).all()
+
+
+def test_fill_navigation():
+    ifdo = load_example()
+    original = ifdo.image_set_items[FILENAME][1]
+    clone = ifdo.clone()
+
+    filled = fill_navigation(clone, make_track(image_coordinate_uncertainty_meters=[1.0, 1.0, 1.0, 1.0]))
+
+    n_entries = sum(len(image_data_list) for image_data_list in clone.image_set_items.values())
+    assert filled == n_entries
+    image_data = clone.image_set_items[FILENAME][1]
+    assert image_data.image_datetime == datetime(2019, 3, 4, 8, 37, 25)
+    assert image_data.image_altitude_meters == pytest.approx(-1005.0)
+    assert image_data.image_coordinate_uncertainty_meters >= 1.0
+    assert ifdo.image_set_items[FILENAME][1] is original
+    assert original.image_altitude_meters is None
+
+
+def test_from_csv(tmp_path):
+    path = tmp_path / "navigation.csv"
+    path.write_text(
+        "time,lat,image-longitude,depth,comment\n"
+        "2019-03-04T08:37:20,11.0,-117.0,-1000.0,start\n"
+        "2019-03-04 08:37:30,11.001,-117.0,,\n"
+    )
+    track = NavigationTrack.from_csv(path, "time", {"lat": "image_latitude", "depth": "image_altitude_meters"})
+
+    values, _ = track.interpolate([START + timedelta(seconds=5)])
+    assert values["image_latitude"].tolist() == pytest.approx([11.0005])
+    assert np.isnan(values["image_altitude_meters"]).all()  # Only one depth fix, so nothing to interpolate between
@@ -0,0 +1,77 @@
+import json
+import pickle
+from copy import deepcopy
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.models import ImageAcquisition, ImageData, ImageQuality
+from ifdo.pickling import dumps_items, loads_items
+
+
+def load_example() -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        return iFDO.from_dict(json.load(file))
+
+
+def test_pickle_round_trip():
+    ifdo = load_example()
+    restored = pickle.loads(pickle.dumps(ifdo))
+    assert restored.to_dict() == ifdo.to_dict()
+    assert not restored.is_dirty()
+    assert restored.image_set_header.image_set_name == ifdo.image_set_header.image_set_name
+
+
+def test_pickle_is_compact():
+    ifdo = load_example()
+    image_data = next(iter(ifdo.image_set_items.values()))[0]
+    assert len(pickle.dumps(image_data)) < len(pickle.dumps(image_data.__dict__))
+
+
+def test_pickle_enums_extras_and_dirty_flag():
+    image_data = ImageData.from_dict({"image-acquisition": "photo", "image-quality": "raw", "x-custom": [1, 2]})
+    restored = pickle.loads(pickle.dumps(image_data))
+    assert restored.image_acquisition is ImageAcquisition.PHOTO
+    assert restored.image_quality is ImageQuality.RAW
+    assert restored.extras == {"x-custom": [1, 2]}
+    assert not restored.is_dirty()
+
+    image_data.image_entropy = 0.5
+    restored = pickle.loads(pickle.dumps(image_data))
+    assert restored.is_dirty()
+    assert restored.image_entropy == 0.5
+    restored.image_entropy = 0.7  # Still tracked
+    assert restored.to_dict()["image-entropy"] == 0.7
+
+
+def test_deepcopy():
+    ifdo = load_example()
+    copied = deepcopy(ifdo)
+    assert copied.to_dict() == ifdo.to_dict()
+    filename = next(iter(ifdo.image_set_items))
+    assert copied.image_set_items[filename][0] is not ifdo.image_set_items[filename][0]
+
+
+@pytest.mark.parametrize("dirty", [False, True])
+def test_dumps_items_round_trip(dirty):
+    ifdo = load_example()
+    filename = next(iter(ifdo.image_set_items))
+    ifdo.image_set_items["photo.jpg"] = [ImageData(image_acquisition=ImageAcquisition.PHOTO)]
+    ifdo.image_set_items["empty.jpg"] = []
+    ifdo.image_set_items[filename][0].extras["x-custom"] = "value"
+    if not dirty:
+        ifdo.mark_clean()
+
+    items = loads_items(dumps_items(ifdo.image_set_items))
+    assert list(items) == list(ifdo.image_set_items)
+    assert {name: [entry.to_dict() for entry in entries] for name, entries in items.items()} == {
+        name: [entry.to_dict() for entry in entries] for name, entries in ifdo.image_set_items.items()
+    }
+    assert items["photo.jpg"][0].image_acquisition is ImageAcquisition.PHOTO
+    assert items[filename][0].extras == {"x-custom": "value"}
+    assert items["photo.jpg"][0].is_dirty() == dirty
+    assert not items[filename][1].is_dirty()
+
+
+def test_dumps_items_empty():
+    assert loads_items(dumps_items({})) == {}
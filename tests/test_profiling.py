@@ -0,0 +1,26 @@
+from ifdo import iFDO
+from ifdo.profiling import current_profiler, profile
+
+
+def test_profile_load_save(tmp_path):
+    reports = []
+    with profile(callback=reports.append) as report:
+        ifdo = iFDO.load("tests/ifdo-video-example.json")
+        ifdo.save(tmp_path / "ifdo.yaml")
+
+    assert current_profiler() is None
+    assert reports == [report]
+    assert set(report.stages) == {"yaml_load", "from_dict", "construct", "strptime", "to_dict", "yaml_dump"}
+    assert report.stages["from_dict"].calls == 1
+    assert report.constructions["iFDO"] == 1
+    assert report.constructions["ImageData"] == sum(len(items) for items in ifdo.image_set_items.values())
+    assert report.items_loaded == report.items_saved == len(ifdo.image_set_items)
+    assert report.bytes_read > 0
+    assert report.bytes_written > 0
+    assert report.to_dict()["constructions"]["iFDO"] == 1
+
+
+def test_no_profile():
+    iFDO.load("tests/ifdo-video-example.json")
+
+    assert current_profiler() is None
@@ -39,17 +39,17 @@ def test_save():
     ifdo.image_set_items["SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"] = [image]
 
     result = ifdo.to_dict()
-    schema = load_json("tests/schema/ifdo-v2.1.0.json")
+    schema = load_json("ifdo/schema/ifdo-v2.1.0.json")
 
     registry = Registry().with_resources(
         [
             (
                 "https://marine-imaging.com/fair/schemas/provenance.json",
-                Resource.from_contents(load_json("tests/schema/provenance-v0.1.0.json")),
+                Resource.from_contents(load_json("ifdo/schema/provenance-v0.1.0.json")),
             ),
             (
                 "https://marine-imaging.com/fair/schemas/annotation.json",
-                Resource.from_contents(load_json("tests/schema/annotation-v2.0.0.json")),
+                Resource.from_contents(load_json("ifdo/schema/annotation-v2.0.0.json")),
             ),
         ]
     )
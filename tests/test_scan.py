@@ -0,0 +1,64 @@
+from datetime import datetime
+from hashlib import sha256
+
+from ifdo.models import ImageAcquisition, ImageContext
+from ifdo.scan import datetime_from_filename, scan
+
+
+def write_files(root):
+    (root / "dive").mkdir()
+    (root / "dive" / "SO268_21-1_CAM-1_20190304_083724.JPG").write_bytes(b"photo 1")
+    (root / "dive" / "SO268_21-1_CAM-1_20190304_083734.jpg").write_bytes(b"photo 2")
+    (root / "video_20190304T090000.mp4").write_bytes(b"video")
+    (root / "notes.txt").write_text("not an image")
+    (root / ".hidden.jpg").write_bytes(b"hidden")
+
+
+def test_datetime_from_filename():
+    assert datetime_from_filename("CAM-1_20190304_083724.JPG") == datetime(2019, 3, 4, 8, 37, 24)
+    assert datetime_from_filename("CAM-1_20190304T083724.250.JPG") == datetime(2019, 3, 4, 8, 37, 24, 250000)
+    assert datetime_from_filename("CAM-1_00000001.JPG") is None
+
+    scheme = "<event>_<datetime>_<index>.<ext>"
+    filename = "20190101_000000_20190304_083724_1.JPG"
+    assert datetime_from_filename(filename) == datetime(2019, 1, 1)
+    assert datetime_from_filename(filename, scheme) == datetime(2019, 3, 4, 8, 37, 24)
+    assert datetime_from_filename("SO268_20190304-083724_000001.JPG", scheme) == datetime(2019, 3, 4, 8, 37, 24)
+
+
+def test_scan(tmp_path):
+    write_files(tmp_path)
+    ifdo = scan(tmp_path, workers=2)
+
+    assert list(ifdo.image_set_items) == [
+        "dive/SO268_21-1_CAM-1_20190304_083724.JPG",
+        "dive/SO268_21-1_CAM-1_20190304_083734.jpg",
+        "video_20190304T090000.mp4",
+    ]
+    photo = ifdo.image_set_items["dive/SO268_21-1_CAM-1_20190304_083724.JPG"][0]
+    assert photo.image_hash_sha256 == sha256(b"photo 1").hexdigest()
+    assert photo.image_datetime == datetime(2019, 3, 4, 8, 37, 24)
+    assert photo.image_acquisition == ImageAcquisition.PHOTO
+    assert ifdo.image_set_items["video_20190304T090000.mp4"][0].image_acquisition == ImageAcquisition.VIDEO
+    assert len({image_data_list[0].image_uuid for image_data_list in ifdo.image_set_items.values()}) == 3
+    assert ifdo.image_set_header.image_set_name == tmp_path.name
+
+
+def test_incremental_scan(tmp_path, monkeypatch):
+    write_files(tmp_path)
+    state_path = tmp_path / ".ifdo-scan.json"
+    first = scan(tmp_path, state_path=state_path)
+    first.update_item("video_20190304T090000.mp4", image_context=ImageContext("Context"))
+
+    (tmp_path / "dive" / "SO268_21-1_CAM-1_20190304_083734.jpg").write_bytes(b"photo 2, edited")
+    (tmp_path / "new_20190305_000000.jpg").write_bytes(b"photo 3")
+    hashed = []
+    monkeypatch.setattr("ifdo.files.file_sha256", lambda path, chunk_size: hashed.append(path.name) or "0" * 64)
+    second = scan(tmp_path, previous=first, state_path=state_path)
+
+    assert sorted(hashed) == ["SO268_21-1_CAM-1_20190304_083734.jpg", "new_20190305_000000.jpg"]
+    for filename, image_data_list in first.image_set_items.items():
+        assert second.image_set_items[filename][0].image_uuid == image_data_list[0].image_uuid
+    assert second.image_set_items["video_20190304T090000.mp4"][0].image_context.name == "Context"
+    assert second.image_set_items["dive/SO268_21-1_CAM-1_20190304_083734.jpg"][0].image_hash_sha256 == "0" * 64
+    assert second.image_set_header is first.image_set_header
@@ -0,0 +1,93 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.models import ImageData
+from ifdo.shards import Shard, ShardedIFDO, write_shards
+
+
+def count_entries(ifdo: iFDO) -> int:
+    return sum(len(image_data_list) for image_data_list in ifdo.image_set_items.values())
+
+
+def make_ifdo(items: int = 10) -> iFDO:
+    with open("tests/ifdo-video-example.json") as file:
+        ifdo = iFDO.from_dict(json.load(file))
+    ifdo.image_set_items = {
+        f"{index:02d}.jpg": [
+            ImageData(
+                image_datetime=datetime(2024, 1, 1, index),
+                image_latitude=float(index),
+                image_longitude=-float(index),
+            )
+        ]
+        for index in range(items)
+    }
+    ifdo.image_set_items["undated.jpg"] = [ImageData()]  # Falls back to the header's time and position
+    return ifdo
+
+
+def test_shard_by_count(tmp_path):
+    ifdo = make_ifdo()
+    sharded = write_shards(ifdo, tmp_path, by="count", size=4)
+    assert [shard.items for shard in sharded.shards] == [4, 4, 3]
+    assert list(sharded.image_set_items) == list(ifdo.image_set_items)
+    assert len(sharded.image_set_items) == len(ifdo.image_set_items)
+    assert sharded.image_set_header == ifdo.image_set_header
+    assert sharded.to_ifdo().to_dict() == ifdo.to_dict()
+
+
+def test_shard_by_time(tmp_path):
+    sharded = write_shards(make_ifdo(), tmp_path, by="time", size=3 * 3600, suffix=".json.gz")
+    assert [shard.items for shard in sharded.shards] == [1, 3, 3, 3, 1]  # The header's 2019 time comes first
+    assert sharded.shards[1].start == datetime(2024, 1, 1, 0)
+    assert sharded.shards[1].end == datetime(2024, 1, 1, 2)
+    assert sharded.shards[1].bbox == (0.0, -2.0, 2.0, -0.0)
+
+
+def test_shard_by_tile(tmp_path):
+    sharded = write_shards(make_ifdo(), tmp_path, by="tile", size=5.0)
+    assert sorted(shard.items for shard in sharded.shards) == [1, 1, 1, 4, 4]  # Tiles of 5 x 5 degrees
+
+
+def test_query_loads_only_overlapping_shards(tmp_path):
+    write_shards(make_ifdo(), tmp_path, by="time", size=3600)
+    sharded = ShardedIFDO(tmp_path / "manifest.json")
+
+    selected = sharded.select(start=datetime(2024, 1, 1, 2, 30), end=datetime(2024, 1, 1, 4))
+    assert [shard.start for shard in selected] == [datetime(2024, 1, 1, 3), datetime(2024, 1, 1, 4)]
+
+    result = sharded.query(start=datetime(2024, 1, 1, 2, 30), end=datetime(2024, 1, 1, 4))
+    assert list(result.image_set_items) == ["03.jpg", "04.jpg"]
+    assert len(sharded._cache) == 2
+
+    result = sharded.query(bbox=(0.5, -6.5, 6.5, -0.5))
+    assert list(result.image_set_items) == ["01.jpg", "02.jpg", "03.jpg", "04.jpg", "05.jpg", "06.jpg"]
+
+
+def test_shard_cache_is_bounded(tmp_path):
+    sharded = write_shards(make_ifdo(), tmp_path, by="count", size=1)
+    sharded.max_cached = 2
+    assert sharded.image_set_items["05.jpg"][0].image_latitude == 5.0
+    assert len(sharded._cache) == 2
+    with pytest.raises(KeyError):
+        sharded.image_set_items["missing.jpg"]
+
+
+def test_map_shards(tmp_path):
+    sharded = write_shards(make_ifdo(), tmp_path, by="count", size=3)
+    assert sharded.map_shards(count_entries) == [3, 3, 3, 2]
+    assert sharded.map_shards(count_entries, workers=2) == [3, 3, 3, 2]
+    assert sharded.map_shards(count_entries, sharded.select(end=datetime(2024, 1, 1))) == [3, 2]
+
+
+def test_shard_manifest_round_trip():
+    shard = Shard("shard-00000.json", 2, datetime(2024, 1, 1), datetime(2024, 1, 2), (1.0, 2.0, 3.0, 4.0))
+    assert Shard.from_dict(json.loads(json.dumps(shard.to_dict()))) == shard
+
+
+def test_invalid_partition(tmp_path):
+    with pytest.raises(ValueError):
+        write_shards(make_ifdo(), tmp_path, by="size")
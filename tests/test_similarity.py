@@ -0,0 +1,97 @@
+import pytest
+
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+
+np = pytest.importorskip("numpy")
+
+from ifdo.similarity import DescriptorIndex, SearchResult  # noqa: E402
+
+
+def make_ifdo(name: str, n_items: int, seed: int) -> iFDO:
+    rng = np.random.default_rng(seed)
+    items = {
+        f"{name}_{index}.JPG": [
+            ImageData(
+                image_mpeg7_colorlayout=rng.normal(size=12).tolist(),
+                image_entropy=float(rng.uniform(0, 8)),
+            ),
+            ImageData(image_mpeg7_colorlayout=rng.normal(size=12).tolist(), image_entropy=1.0),
+            ImageData(),  # No descriptors: not indexed
+        ]
+        for index in range(n_items)
+    }
+    header = ImageSetHeader(image_set_name=name, image_set_uuid=f"{name}-uuid", image_set_handle=f"{name}-handle")
+    return iFDO(image_set_header=header, image_set_items=items)
+
+
+def test_exact_search():
+    ifdos = [make_ifdo("a", 50, 0), make_ifdo("b", 50, 1)]
+    index = DescriptorIndex.from_ifdos(ifdos, fields=("image_mpeg7_colorlayout", "image_entropy"))
+    assert len(index) == 200
+
+    target = ifdos[1].image_set_items["b_7.JPG"][1]
+    vector = index.vector(target)
+    results = index.query([vector, vector], k=3)
+
+    assert len(results) == 2
+    assert results[0][0] == SearchResult("b", "b_7.JPG", 1, pytest.approx(0.0, abs=1e-6))
+    assert [result.distance for result in results[0]] == sorted(result.distance for result in results[0])
+
+    # Brute force reference in the standardized space
+    matrix = index._data[: len(index)]
+    matrix = (matrix - matrix.mean(axis=0)) / matrix.std(axis=0)
+    query = matrix[index._positions[("b", "b_7.JPG", 1)]]
+    reference = np.sort(np.linalg.norm(matrix - query, axis=1))[:3]
+    assert [result.distance for result in results[0]] == pytest.approx(reference.tolist())
+
+
+def test_similar_excludes_self():
+    index = DescriptorIndex.from_ifdos([make_ifdo("a", 20, 0)])
+    results = index.similar([("a", "a_3.JPG", 0)], k=5)
+
+    assert len(results[0]) == 5
+    assert ("a", "a_3.JPG", 0) not in [result[:3] for result in results[0]]
+
+
+def test_approximate_search():
+    index = DescriptorIndex.from_ifdos([make_ifdo("a", 200, 0)])
+    index.build_approximate(tables=16, bits=6, seed=0)
+    key = ("a", "a_42.JPG", 0)
+
+    results = index.similar([key], k=5, approximate=True)[0]
+    exact = index.similar([key], k=5)[0]
+
+    assert results
+    assert results[0][:3] == exact[0][:3]  # The nearest neighbour is found with these settings
+    assert all(result.distance >= exact[0].distance - 1e-9 for result in results)
+
+
+def test_descriptor_length_mismatch():
+    index = DescriptorIndex()
+    query = ImageData(image_mpeg7_colorlayout=[1.0])
+    assert index.vector(query) == [1.0]  # Queries do not fix the descriptor lengths
+    index.add(make_ifdo("a", 2, 0))
+
+    with pytest.raises(ValueError):
+        index.vector(query)
+
+    mixed = make_ifdo("b", 2, 1)
+    mixed.image_set_items["b_1.JPG"][1] = query
+    with pytest.raises(ValueError):
+        index.add(mixed)
+    assert len(index) == 4  # Nothing of the failed iFDO was added
+    results = index.query([index.vector(mixed.image_set_items["b_0.JPG"][0])], k=10)[0]
+    assert {result.source for result in results} == {"a"}
+
+
+def test_incremental_add():
+    ifdos = [make_ifdo(name, 300, seed) for seed, name in enumerate("abcd")]
+    index = DescriptorIndex()
+    for ifdo in ifdos:
+        index.add(ifdo)
+        assert index._matrix is None  # Only built when a query runs
+    assert len(index._data) >= len(index) == 2400  # Grown past the initial capacity
+
+    reference = DescriptorIndex.from_ifdos(ifdos)
+    key = ("c", "c_5.JPG", 1)
+    assert index.similar([key], k=5) == reference.similar([key], k=5)
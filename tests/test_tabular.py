@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+
+from ifdo.models import ImageData, ImageIllumination
+from ifdo.tabular import items_from_columns, items_from_csv, items_from_dataframe
+
+
+def test_items_from_columns():
+    items = items_from_columns(
+        {
+            "image-filename": ["a.MP4", "a.MP4", "b.JPG"],
+            "image-datetime": ["2019-03-04 08:37:24.000000", "2019-03-04T08:37:25", datetime(2019, 3, 4, 8, 37, 26)],
+            "lat": [11.9, 11.91, None],
+            "image_longitude": [-117.0, -117.01, -117.02],
+            "image-illumination": ["artificial light", None, "Artificial-Light"],
+            "unrelated": [1, 2, 3],
+        },
+        column_map={"lat": "image_latitude"},
+    )
+
+    assert list(items) == ["a.MP4", "b.JPG"]
+    assert items["a.MP4"][1] == ImageData(
+        image_datetime=datetime(2019, 3, 4, 8, 37, 25),
+        image_latitude=11.91,
+        image_longitude=-117.01,
+    )
+    assert items["b.JPG"][0].image_latitude is None
+    assert items["b.JPG"][0].image_illumination is ImageIllumination.ARTIFICIAL_LIGHT
+    assert items["b.JPG"][0].to_dict() == ImageData.from_dict(items["b.JPG"][0].to_dict()).to_dict()
+
+
+def test_validation():
+    columns = {"image-filename": ["a.JPG", "b.JPG"], "image-latitude": [10.0, 91.0]}
+
+    with pytest.raises(ValueError, match="row 1"):
+        items_from_columns(columns)
+    assert items_from_columns(columns, validate=False)["b.JPG"][0].image_latitude == 91.0
+
+
+def test_items_from_csv(tmp_path):
+    path = tmp_path / "navigation.csv"
+    path.write_text("image-filename,image-datetime,image-latitude,image-altitude-meters\na.JPG,2019-03-04 08:37:24.000000,11.9,\n")
+
+    items = items_from_csv(path)
+
+    assert items == {"a.JPG": [ImageData(image_datetime=datetime(2019, 3, 4, 8, 37, 24), image_latitude=11.9)]}
+
+
+def test_items_from_csv_errors(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+    with pytest.raises(ValueError, match="header row"):
+        items_from_csv(path)
+
+    path = tmp_path / "navigation.csv"
+    path.write_text("image-filename,lat\na.JPG,11.9\n")
+    with pytest.raises(ValueError, match="image_lattitude"):
+        items_from_csv(path, column_map={"lat": "image_lattitude"})
+
+
+def test_items_from_dataframe():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(
+        {
+            "image-filename": ["a.JPG", "b.JPG"],
+            "image-datetime": pd.to_datetime(["2019-03-04 08:37:24", None]),
+            "image-latitude": [11.9, float("nan")],
+        },
+    )
+
+    items = items_from_dataframe(df)
+
+    assert items["a.JPG"][0] == ImageData(image_datetime=datetime(2019, 3, 4, 8, 37, 24), image_latitude=11.9)
+    assert items["b.JPG"][0] == ImageData()
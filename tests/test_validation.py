@@ -0,0 +1,100 @@
+from datetime import datetime
+
+import pytest
+
+from ifdo import iFDO
+from ifdo.models import ImageContext, ImageCreator, ImageData, ImageLicense, ImagePI, ImageSetHeader
+from ifdo import validation
+from ifdo.validation import SchemaError, load_schema
+
+FILENAME = "SO268-1_21-1_OFOS_SO_CAM-1_20190304_083724.JPG"
+
+
+def make_ifdo() -> iFDO:
+    header = ImageSetHeader(
+        image_set_name="SO268 SO268-1_21-1_OFOS SO_CAM-1_Photo_OFOS",
+        image_set_uuid="f840644a-fe4a-46a7-9791-e32c211bcbf5",
+        image_set_handle="https://hdl.handle.net/20.500.12085/f840644a-fe4a-46a7-9791-e32c211bcbf5",
+        image_abstract="Abstract",
+        image_copyright="Copyright (C)",
+        image_license=ImageLicense("CC-BY"),
+        image_context=ImageContext("Image context"),
+        image_project=ImageContext("Image project"),
+        image_event=ImageContext("Image event"),
+        image_platform=ImageContext("Image Platform"),
+        image_sensor=ImageContext("Image sensor"),
+        image_pi=ImagePI("Image PI"),
+        image_creators=[ImageCreator("Image creator")],
+        image_latitude=10.0,
+        image_longitude=10.0,
+        image_altitude_meters=1.0,
+        image_coordinate_reference_system="WSG84",
+        image_coordinate_uncertainty_meters=0.1,
+        image_datetime=datetime(2020, 1, 1),
+    )
+    image = ImageData(
+        image_handle="test",
+        image_hash_sha256="83f30eb35d1325c44c85fba0cf478825c0a629d20177a945069934f6cd07e087",
+        image_uuid="c6b8d981-05c7-449f-85a9-906ab866bfb6",
+        image_datetime=datetime(2020, 1, 1),
+    )
+    return iFDO(image_set_header=header, image_set_items={FILENAME: [image]})
+
+
+def test_load_schema():
+    assert load_schema()["$id"] == "https://marine-imaging.com/fair/schemas/ifdo-v2.1.0.json"
+
+
+def test_valid():
+    assert make_ifdo().validate_schema() == []
+
+
+def test_errors_per_item():
+    ifdo = make_ifdo()
+    ifdo.image_set_header.image_abstract = None
+    ifdo.image_set_items["missing-uuid.JPG"] = [ImageData(image_datetime=datetime(2020, 1, 1))]
+
+    errors = ifdo.validate_schema(chunk_size=1)
+
+    assert SchemaError(None, "", "'image-abstract' is a required property") in errors
+    assert {error.item for error in errors} == {None, "missing-uuid.JPG"}
+
+
+def test_parallel():
+    ifdo = make_ifdo()
+    ifdo.image_set_items["missing-uuid.JPG"] = [ImageData(image_datetime=datetime(2020, 1, 1))]
+
+    assert ifdo.validate_schema(chunk_size=1, workers=2) == ifdo.validate_schema()
+
+
+@pytest.fixture
+def closed_schema(monkeypatch):
+    # The packaged schema allows any top-level keys: close it to get an invalid top-level document
+    jsonschema = pytest.importorskip("jsonschema")
+    referencing = pytest.importorskip("referencing")
+    schemas = {name: load_schema(name) for name in (validation.IFDO_SCHEMA, *validation.REFERENCED_SCHEMAS.values())}
+    schema = schemas[validation.IFDO_SCHEMA]
+    schemas[validation.IFDO_SCHEMA] = {
+        **schema,
+        "additionalProperties": False,
+        "required": [*schema["required"], "$schema"],
+    }
+    monkeypatch.setattr(validation, "load_schema", lambda name=validation.IFDO_SCHEMA: schemas[name])
+    validation._validators.cache_clear()
+
+    registry = referencing.Registry().with_resources(
+        (uri, referencing.Resource.from_contents(schemas[name])) for uri, name in validation.REFERENCED_SCHEMAS.items()
+    )
+    yield jsonschema.Draft202012Validator(schemas[validation.IFDO_SCHEMA], registry=registry)
+    validation._validators.cache_clear()
+
+
+def test_top_level_errors(closed_schema):
+    ifdo = make_ifdo()
+    ifdo.extras["unknown-key"] = 1
+
+    errors = ifdo.validate_schema()
+
+    expected = [SchemaError(None, "", error.message) for error in closed_schema.iter_errors(ifdo.to_dict())]
+    assert len(expected) == 2  # The missing $schema and the unknown key
+    assert sorted(errors) == sorted(expected)
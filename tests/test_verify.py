@@ -0,0 +1,81 @@
+import json
+from hashlib import sha256
+
+from ifdo.models import ImageData, ImageSetHeader, iFDO
+from ifdo.verify import main, verify
+
+
+def make_example(root):
+    (root / "a.jpg").write_bytes(b"a")
+    (root / "b.jpg").write_bytes(b"b")
+    (root / "c.jpg").write_bytes(b"c")
+    (root / "extra.jpg").write_bytes(b"extra")
+    (root / "notes.txt").write_bytes(b"not an image")
+    header = ImageSetHeader(image_set_name="Set", image_set_uuid="uuid", image_set_handle="handle")
+    return iFDO(
+        image_set_header=header,
+        image_set_items={
+            "a.jpg": [ImageData(image_hash_sha256=sha256(b"a").hexdigest())],
+            "b.jpg": [ImageData(image_hash_sha256=sha256(b"not b").hexdigest())],
+            "c.jpg": [ImageData()],
+            "missing.jpg": [ImageData(image_hash_sha256=sha256(b"missing").hexdigest())],
+        },
+    )
+
+
+def test_verify(tmp_path):
+    ifdo = make_example(tmp_path)
+    report = verify(ifdo, tmp_path, workers=2)
+
+    assert report.verified == ["a.jpg"]
+    assert report.mismatched == ["b.jpg"]
+    assert report.unhashed == ["c.jpg"]
+    assert report.missing == ["missing.jpg"]
+    assert report.extra == ["extra.jpg"]
+    assert not report.ok
+
+
+def test_incremental_verify(tmp_path, monkeypatch):
+    ifdo = make_example(tmp_path)
+    cache_path = tmp_path / ".verify-cache.json"
+    verify(ifdo, tmp_path, cache_path=cache_path)
+
+    (tmp_path / "b.jpg").write_bytes(b"not b")
+    hashed = []
+    monkeypatch.setattr("ifdo.files.file_sha256", lambda path, chunk_size: hashed.append(path.name) or "")
+    report = verify(ifdo, tmp_path, cache_path=cache_path)
+
+    assert hashed == ["b.jpg"]
+    assert report.verified == ["a.jpg"]
+
+
+def test_main(tmp_path, capsys):
+    ifdo = make_example(tmp_path)
+    ifdo_path = tmp_path / "ifdo.yaml"
+    ifdo.save(ifdo_path)
+
+    assert main([str(ifdo_path), str(tmp_path), "--no-extra"]) == 1
+    output = capsys.readouterr().out
+    assert "mismatched: b.jpg" in output
+    assert "1 verified, 1 missing, 1 mismatched, 0 unreadable, 1 unhashed, 0 extra" in output
+
+    assert main([str(ifdo_path), str(tmp_path), "--json"]) == 1
+    assert json.loads(capsys.readouterr().out)["extra"] == ["extra.jpg"]  # Not the iFDO file or other files
+
+
+def test_unreadable_and_vanished_files(tmp_path, monkeypatch):
+    ifdo = make_example(tmp_path)
+    ifdo.image_set_items["b.jpg"][0].image_hash_sha256 = sha256(b"b").hexdigest()
+
+    def file_sha256(path, chunk_size):
+        if path.name == "a.jpg":
+            raise PermissionError(path)
+        raise FileNotFoundError(path)  # Removed after the existence check
+
+    monkeypatch.setattr("ifdo.files.file_sha256", file_sha256)
+    report = verify(ifdo, tmp_path, find_extra=False)
+
+    assert report.unreadable == ["a.jpg"]
+    assert report.missing == ["b.jpg", "missing.jpg"]
+    assert report.verified == []
+    assert not report.ok